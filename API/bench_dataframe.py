@@ -2,15 +2,16 @@ import string
 
 import numpy
 import pytest
-from config import cudf, cupy
+from config import NUM_ROWS, OVERHEAD, TEST_ONLY, cudf, cupy
 from utils import accepts_cudf_fixture
 
 
-@pytest.mark.parametrize("N", [100, 1_000_000])
+@pytest.mark.parametrize("N", NUM_ROWS if OVERHEAD or TEST_ONLY else [100, 1_000_000])
 def bench_construction(benchmark, N):
     benchmark(cudf.DataFrame, {None: cupy.random.rand(N)})
 
 
+@pytest.mark.polars_incompatible
 @accepts_cudf_fixture(cls="dataframe", dtype="float", cols=6)
 @pytest.mark.parametrize(
     "expr", ["a+b", "a+b+c+d+e", "a / (sin(a) + cos(b)) * tanh(d*e*f)"]
@@ -30,6 +31,7 @@ def bench_merge(benchmark, df, nkey_cols):
 
 # TODO: Some of these cases could be generalized to an IndexedFrame benchmark
 # instead of a DataFrame benchmark.
+@pytest.mark.polars_incompatible
 @accepts_cudf_fixture(cls="dataframe", dtype="int")
 @pytest.mark.parametrize(
     "values",
@@ -53,6 +55,7 @@ def random_state(request):
     return rs if isinstance(rs, int) else rs(seed=42)
 
 
+@pytest.mark.polars_incompatible
 @accepts_cudf_fixture(cls="dataframe", dtype="int")
 @pytest.mark.parametrize("frac", [0.5])
 def bench_sample(benchmark, dataframe, axis, frac, random_state):
@@ -90,6 +93,20 @@ def bench_groupby_agg(benchmark, dataframe, agg, nkey_cols, as_index, sort):
     benchmark(dataframe.groupby(by=by, as_index=as_index, sort=sort).agg, agg)
 
 
+@accepts_cudf_fixture(
+    cls="dataframe",
+    dtype="int",
+    cols=6,
+    rows=NUM_ROWS[-1],
+    cardinality=[10, 100_000],
+    skew=[0, 1.5],
+    null_fraction=[0, 0.5],
+)
+@pytest.mark.parametrize("sort", [True, False])
+def bench_groupby_agg_distribution(benchmark, dataframe, sort):
+    benchmark(dataframe.groupby(by="a", sort=sort).agg, "sum")
+
+
 @accepts_cudf_fixture(cls="dataframe", dtype="int")
 @pytest.mark.parametrize("ncol_sort", [1])
 def bench_sort_values(benchmark, dataframe, ncol_sort):
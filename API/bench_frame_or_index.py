@@ -4,6 +4,7 @@ import operator
 
 import numpy as np
 import pytest
+from config import backend
 from utils import accepts_cudf_fixture, make_gather_map
 
 
@@ -27,6 +28,7 @@ def bench_min(benchmark, frame_or_index):
     benchmark(frame_or_index.min)
 
 
+@pytest.mark.pandas_pyarrow_incompatible  # Arrow-backed ints do not support mod
 @accepts_cudf_fixture(cls="frame_or_index", dtype="int")
 def bench_where(benchmark, frame_or_index):
     cond = frame_or_index % 2 == 0
@@ -71,9 +73,21 @@ def bench_astype(benchmark, frame_or_index):
     benchmark(frame_or_index.astype, float)
 
 
-@pytest.mark.parametrize("ufunc", [np.add, np.logical_and])
+@pytest.mark.parametrize(
+    "ufunc",
+    [
+        np.add,
+        # polars does not support logical ufuncs on ints.
+        pytest.param(np.logical_and, marks=pytest.mark.polars_incompatible),
+    ],
+)
 @accepts_cudf_fixture(cls="frame_or_index", dtype="int")
 def bench_ufunc_series_binary(benchmark, frame_or_index, ufunc):
+    # pandas nulls (masked or Arrow-backed) cannot be converted to bool, so
+    # the input is converted (outside of the timed call) to the nullable
+    # boolean dtype, whose Kleene logic preserves the nulls.
+    if ufunc is np.logical_and and backend.name != "cudf":
+        frame_or_index = frame_or_index.astype("boolean")
     benchmark(ufunc, frame_or_index, frame_or_index)
 
 
@@ -2,9 +2,10 @@
 
 import pytest
 import pytest_cases
-from config import cudf, cupy
+from config import NUM_ROWS, OVERHEAD, TEST_ONLY, cudf, cupy
 
 
+@pytest.mark.polars_incompatible
 @pytest_cases.parametrize_with_cases("objs", prefix="concat")
 @pytest.mark.parametrize(
     "axis",
@@ -18,7 +19,12 @@ def bench_concat_axis_1(benchmark, objs, axis, join, ignore_index):
     benchmark(cudf.concat, objs=objs, axis=axis, join=join, ignore_index=ignore_index)
 
 
-@pytest.mark.parametrize("size", [10_000, 100_000])
+# The dense result has size * cardinality elements, so only the overhead and
+# test-only modes use the sizes of NUM_ROWS.
+@pytest.mark.polars_incompatible
+@pytest.mark.parametrize(
+    "size", NUM_ROWS if OVERHEAD or TEST_ONLY else [10_000, 100_000]
+)
 @pytest.mark.parametrize("cardinality", [10, 100, 1000])
 @pytest.mark.parametrize("dtype", [cupy.bool_, cupy.float64])
 def bench_get_dummies_high_cardinality(benchmark, size, cardinality, dtype):
@@ -35,6 +41,7 @@ def bench_get_dummies_high_cardinality(benchmark, size, cardinality, dtype):
     benchmark(cudf.get_dummies, df, columns=["col"], dtype=dtype)
 
 
+@pytest.mark.polars_incompatible
 @pytest.mark.parametrize("prefix", [None, "pre"])
 def bench_get_dummies_simple(benchmark, prefix):
     """This test provides a small input to get_dummies to test the efficiency
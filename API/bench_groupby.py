@@ -0,0 +1,129 @@
+"""Benchmarks of groupby operations.
+
+Unlike the standard fixtures, in which every column has the same dtype and
+fewer than 100 distinct values, these benchmarks group frames with a key
+column of configurable dtype and cardinality (from tens to millions of
+groups) and float value columns.
+"""
+
+import pytest
+from config import NUM_ROWS, backend, cudf
+from utils import Distribution, cached_input, column_generators
+
+KEY_DTYPES = ["int", "str", "category"]
+CARDINALITIES = [10, 1_000, 100_000, 1_000_000]
+VALUE_COLUMNS = ["a", "b", "c"]
+
+
+def keyed_frame(key_dtype, cardinality, null_fraction=None, benchmark=None):
+    """Get a frame with a `key` column and float value columns.
+
+    Frames are cached like the standard fixtures, see `cached_input`.
+
+    Parameters
+    ----------
+    key_dtype : str
+        The dtype of the key column, a key of `column_generators`.
+    cardinality : int
+        The number of distinct keys.
+    null_fraction : Optional[float]
+        The fraction of (randomly placed) null keys. If None, there are no
+        null keys.
+    benchmark : Optional[BenchmarkFixture]
+        If given, the size of the frame is recorded in its `extra_info`.
+    """
+    nr = NUM_ROWS[-1]
+    distribution = Distribution(
+        cardinality=cardinality,
+        null_fraction=null_fraction,
+        null_pattern=None if null_fraction is None else "random",
+    )
+    name = f"groupby_frame_key_{key_dtype}{distribution.name}_rows_{nr}"
+
+    def make():
+        columns = {
+            "key": column_generators[key_dtype](
+                nr, distribution=distribution, nulls=null_fraction is not None
+            )
+        }
+        for i, column in enumerate(VALUE_COLUMNS):
+            columns[column] = column_generators["float"](nr, seed=43 + i)
+        return backend.convert(cudf.DataFrame(columns))
+
+    return cached_input(name, make, benchmark)
+
+
+def grouped(benchmark, key_dtype, cardinality, **kwargs):
+    """Group a keyed frame by its key, recording the size of the frame.
+
+    Only observed categories form groups, which is pinned explicitly because
+    the pandas default for categorical keys is changing.
+    """
+    frame = keyed_frame(key_dtype, cardinality, benchmark=benchmark)
+    return frame.groupby("key", observed=True, **kwargs)
+
+
+@pytest.mark.parametrize("key_dtype", KEY_DTYPES)
+@pytest.mark.parametrize("cardinality", CARDINALITIES)
+@pytest.mark.parametrize("sort", [True, False])
+def bench_groupby_agg_keys(benchmark, key_dtype, cardinality, sort):
+    benchmark(grouped(benchmark, key_dtype, cardinality, sort=sort).agg, "sum")
+
+
+@pytest.mark.parametrize("key_dtype", KEY_DTYPES)
+@pytest.mark.parametrize("cardinality", CARDINALITIES)
+@pytest.mark.parametrize("func", ["sum", "mean", "max"])
+def bench_groupby_transform(benchmark, key_dtype, cardinality, func):
+    benchmark(grouped(benchmark, key_dtype, cardinality).transform, func)
+
+
+@pytest.mark.parametrize("key_dtype", KEY_DTYPES)
+@pytest.mark.parametrize("cardinality", CARDINALITIES)
+@pytest.mark.parametrize("op", ["cumsum", "cummax", "cumcount"])
+def bench_groupby_scans(benchmark, key_dtype, cardinality, op):
+    benchmark(getattr(grouped(benchmark, key_dtype, cardinality), op))
+
+
+# pandas computes the windows of each group separately, taking tens of seconds
+# per call with a million groups.
+@pytest.mark.parametrize("key_dtype", KEY_DTYPES)
+@pytest.mark.parametrize("cardinality", CARDINALITIES[:-1])
+@pytest.mark.parametrize("window", [3, 100])
+def bench_groupby_rolling(benchmark, key_dtype, cardinality, window):
+    groupby = grouped(benchmark, key_dtype, cardinality)
+    benchmark(lambda: groupby.rolling(window).mean())
+
+
+@pytest.mark.parametrize("key_dtype", KEY_DTYPES)
+@pytest.mark.parametrize("cardinality", CARDINALITIES)
+@pytest.mark.parametrize("n", [0, 5])
+def bench_groupby_nth(benchmark, key_dtype, cardinality, n):
+    benchmark(grouped(benchmark, key_dtype, cardinality).nth, n)
+
+
+@pytest.mark.parametrize("key_dtype", KEY_DTYPES)
+@pytest.mark.parametrize("cardinality", CARDINALITIES)
+@pytest.mark.parametrize("n", [1, 5])
+def bench_groupby_head(benchmark, key_dtype, cardinality, n):
+    benchmark(grouped(benchmark, key_dtype, cardinality).head, n)
+
+
+def _range(group):
+    return group["a"].max() - group["a"].min()
+
+
+# The UDF is called once per group, so only low cardinalities are benchmarked.
+@pytest.mark.polars_incompatible
+@pytest.mark.parametrize("key_dtype", KEY_DTYPES)
+@pytest.mark.parametrize("cardinality", [10, 1_000])
+def bench_groupby_apply(benchmark, key_dtype, cardinality):
+    groupby = grouped(benchmark, key_dtype, cardinality)
+    benchmark(groupby[VALUE_COLUMNS].apply, _range)
+
+
+@pytest.mark.parametrize("key_dtype", KEY_DTYPES)
+@pytest.mark.parametrize("cardinality", CARDINALITIES)
+@pytest.mark.parametrize("dropna", [True, False])
+def bench_groupby_agg_null_keys(benchmark, key_dtype, cardinality, dropna):
+    frame = keyed_frame(key_dtype, cardinality, 0.1, benchmark)
+    benchmark(frame.groupby("key", observed=True, dropna=dropna).agg, "sum")
@@ -1,11 +1,11 @@
 """Benchmarks of Index methods."""
 
 import pytest
-from config import cudf, cupy
+from config import NUM_ROWS, OVERHEAD, TEST_ONLY, cudf, cupy
 from utils import accepts_cudf_fixture
 
 
-@pytest.mark.parametrize("N", [100, 1_000_000])
+@pytest.mark.parametrize("N", NUM_ROWS if OVERHEAD or TEST_ONLY else [100, 1_000_000])
 def bench_construction(benchmark, N):
     benchmark(cudf.Index, cupy.random.rand(N))
 
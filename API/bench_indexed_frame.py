@@ -1,11 +1,20 @@
 """Benchmarks of IndexedFrame methods."""
 
 import pytest
+from config import NUM_ROWS
 from utils import accepts_cudf_fixture
 
 
 @accepts_cudf_fixture(cls="indexedframe", dtype="int")
-@pytest.mark.parametrize("op", ["cumsum", "cumprod", "cummax"])
+@pytest.mark.parametrize(
+    "op",
+    [
+        "cumsum",
+        # Arrow raises on integer overflow.
+        pytest.param("cumprod", marks=pytest.mark.pandas_pyarrow_incompatible),
+        "cummax",
+    ],
+)
 def bench_scans(benchmark, op, indexedframe):
     benchmark(getattr(indexedframe, op))
 
@@ -21,6 +30,30 @@ def bench_drop_duplicates(benchmark, indexedframe):
     benchmark(indexedframe.drop_duplicates)
 
 
+@accepts_cudf_fixture(
+    cls="indexedframe",
+    dtype="int",
+    rows=NUM_ROWS[-1],
+    cardinality=[10, 100_000],
+    skew=[0, 1.5],
+    null_fraction=[0, 0.01, 0.99],
+)
+def bench_nunique_distribution(benchmark, indexedframe):
+    benchmark(indexedframe.nunique)
+
+
+@accepts_cudf_fixture(
+    cls="indexedframe",
+    dtype="int",
+    nulls=False,
+    rows=NUM_ROWS[-1],
+    cardinality=[10, 100_000],
+    order=[None, "sorted", "partial"],
+)
+def bench_drop_duplicates_distribution(benchmark, indexedframe):
+    benchmark(indexedframe.drop_duplicates)
+
+
 @accepts_cudf_fixture(cls="indexedframe", dtype="int")
 def bench_rangeindex_replace(benchmark, indexedframe):
     # TODO: Consider adding more DataFrame-specific benchmarks for different
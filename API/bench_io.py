@@ -0,0 +1,312 @@
+"""Benchmarks of reading and writing files.
+
+Every format is written to and read from either a local temporary file or an
+in-memory buffer, so benchmarks measure encoding and decoding rather than the
+storage device. The size of the encoded data is recorded as `io_bytes` in the
+`extra_info` of each benchmark, from which the throughput in MB/s is derived.
+"""
+
+import io
+import math
+import os
+
+import pytest
+from config import backend, cudf
+from utils import accepts_cudf_fixture
+
+# The polars adapter does not implement any I/O.
+pytestmark = pytest.mark.polars_incompatible
+
+# pandas readers return numpy dtypes unless asked for pyarrow dtypes.
+READ_OPTIONS = {"dtype_backend": "pyarrow"} if backend.name == "pandas-pyarrow" else {}
+
+WRITERS = {
+    "parquet": lambda df, sink, **kwargs: df.to_parquet(sink, index=False, **kwargs),
+    "csv": lambda df, sink: df.to_csv(sink, index=False),
+    "json": lambda df, sink: df.to_json(sink, orient="records", lines=True),
+    "orc": lambda df, sink, **kwargs: df.to_orc(sink, index=False, **kwargs),
+    "feather": lambda df, sink, **kwargs: df.to_feather(sink, **kwargs),
+}
+
+READERS = {
+    "parquet": lambda source, **kwargs: cudf.read_parquet(
+        source, **READ_OPTIONS, **kwargs
+    ),
+    "csv": lambda source, **kwargs: cudf.read_csv(source, **READ_OPTIONS, **kwargs),
+    "json": lambda source: cudf.read_json(
+        source, orient="records", lines=True, **READ_OPTIONS
+    ),
+    "orc": lambda source, **kwargs: cudf.read_orc(source, **READ_OPTIONS, **kwargs),
+    "feather": lambda source, **kwargs: cudf.read_feather(
+        source, **READ_OPTIONS, **kwargs
+    ),
+}
+
+# Whether data is read from (or written to) a file or an in-memory buffer.
+SOURCES = ["path", "buffer"]
+
+# The number of leading columns of the (6 column) fixtures to read.
+PROJECTIONS = [1, 3, 6]
+
+
+def parquet_options(compression=None, row_group_size=None):
+    """Translate Parquet writer options to the keywords of the backend."""
+    options = {"compression": compression}
+    if row_group_size is not None:
+        key = "row_group_size_rows" if backend.name == "cudf" else "row_group_size"
+        options[key] = row_group_size
+    return options
+
+
+def orc_options(compression=None, stripe_size=None):
+    """Translate ORC writer options to the keywords of the backend."""
+    if backend.name == "cudf":
+        return {"compression": compression, "stripe_size_bytes": stripe_size}
+    # pandas passes these options to pyarrow.orc.write_table.
+    options = {"compression": compression or "uncompressed"}
+    if stripe_size is not None:
+        options["stripe_size"] = stripe_size
+    return {"engine_kwargs": options}
+
+
+def encode(dataframe, fmt, **options):
+    """Write `dataframe` to an in-memory buffer and return its contents."""
+    buffer = io.BytesIO()
+    WRITERS[fmt](dataframe, buffer, **options)
+    return buffer.getvalue()
+
+
+def make_source(tmp_path, data, source, fmt):
+    """Return a function producing a new readable source containing `data`.
+
+    A new buffer is needed for each read since reading consumes the buffer.
+    """
+    if source == "buffer":
+        return lambda: io.BytesIO(data)
+    path = tmp_path / f"data.{fmt}"
+    path.write_bytes(data)
+    return lambda: str(path)
+
+
+def make_sink(tmp_path, sink, fmt):
+    """Return a function producing a new writable sink."""
+    if sink == "buffer":
+        return io.BytesIO
+    path = str(tmp_path / f"data.{fmt}")
+    return lambda: path
+
+
+def run_write(benchmark, dataframe, tmp_path, fmt, sink, **options):
+    # Write once untimed to determine the size of the output.
+    benchmark.extra_info["io_bytes"] = len(encode(dataframe, fmt, **options))
+    new_sink = make_sink(tmp_path, sink, fmt)
+    benchmark(lambda: WRITERS[fmt](dataframe, new_sink(), **options))
+
+
+def run_read(benchmark, dataframe, tmp_path, fmt, source, write_options, **options):
+    data = encode(dataframe, fmt, **write_options)
+    benchmark.extra_info["io_bytes"] = len(data)
+    new_source = make_source(tmp_path, data, source, fmt)
+    benchmark(lambda: READERS[fmt](new_source(), **options))
+
+
+def read_parquet_chunks(path):
+    """Read a Parquet file one row group at a time, returning the rows read."""
+    import pyarrow.parquet as pq
+
+    file = pq.ParquetFile(path)
+    types_mapper = cudf.ArrowDtype if backend.name == "pandas-pyarrow" else None
+    rows = 0
+    for i in range(file.num_row_groups):
+        if backend.name == "cudf":
+            chunk = cudf.read_parquet(path, row_groups=[i])
+        else:
+            chunk = file.read_row_group(i).to_pandas(types_mapper=types_mapper)
+        rows += len(chunk)
+    return rows
+
+
+def read_csv_chunks(path, num_chunks, num_rows, names):
+    """Read a CSV file in `num_chunks` pieces, returning the rows read."""
+    rows = 0
+    if backend.name == "cudf":
+        # cudf reads chunks by byte range, where only the first contains the
+        # header.
+        size = os.path.getsize(path)
+        chunk_bytes = math.ceil(size / num_chunks)
+        for offset in range(0, size, chunk_bytes):
+            options = {"header": None, "names": names} if offset else {}
+            rows += len(
+                cudf.read_csv(path, byte_range=(offset, chunk_bytes), **options)
+            )
+    else:
+        chunksize = max(math.ceil(num_rows / num_chunks), 1)
+        with cudf.read_csv(path, chunksize=chunksize, **READ_OPTIONS) as reader:
+            for chunk in reader:
+                rows += len(chunk)
+    return rows
+
+
+@accepts_cudf_fixture(cls="dataframe", dtype="int", cols=6)
+@pytest.mark.parametrize("sink", SOURCES)
+@pytest.mark.parametrize("compression", [None, "snappy", "ZSTD"])
+@pytest.mark.parametrize("row_group_size", [10_000, 1_000_000])
+def bench_write_parquet(
+    benchmark, dataframe, tmp_path, compression, row_group_size, sink
+):
+    run_write(
+        benchmark,
+        dataframe,
+        tmp_path,
+        "parquet",
+        sink,
+        **parquet_options(compression, row_group_size),
+    )
+
+
+@accepts_cudf_fixture(cls="dataframe", dtype="int", cols=6)
+@pytest.mark.parametrize("source", SOURCES)
+@pytest.mark.parametrize("compression", [None, "snappy", "ZSTD"])
+@pytest.mark.parametrize("projection", PROJECTIONS)
+def bench_read_parquet(benchmark, dataframe, tmp_path, compression, projection, source):
+    run_read(
+        benchmark,
+        dataframe,
+        tmp_path,
+        "parquet",
+        source,
+        parquet_options(compression),
+        columns=list(dataframe.columns[:projection]),
+    )
+
+
+# Values of int fixtures are in [0, 100), so the threshold is the percentage
+# of rows selected. With sorted data, row groups can be skipped using their
+# statistics.
+@accepts_cudf_fixture(cls="dataframe", dtype="int", cols=6, order=[None, "sorted"])
+@pytest.mark.parametrize("threshold", [1, 10, 50])
+def bench_read_parquet_filters(benchmark, dataframe, tmp_path, threshold):
+    run_read(
+        benchmark,
+        dataframe,
+        tmp_path,
+        "parquet",
+        "path",
+        parquet_options(row_group_size=10_000),
+        filters=[("a", "<", threshold)],
+    )
+
+
+@accepts_cudf_fixture(cls="dataframe", dtype="int", cols=6)
+@pytest.mark.parametrize("num_chunks", [4, 16])
+def bench_read_parquet_chunked(benchmark, dataframe, tmp_path, num_chunks):
+    data = encode(
+        dataframe,
+        "parquet",
+        **parquet_options(
+            row_group_size=max(math.ceil(len(dataframe) / num_chunks), 1)
+        ),
+    )
+    benchmark.extra_info["io_bytes"] = len(data)
+    path = tmp_path / "data.parquet"
+    path.write_bytes(data)
+    benchmark(read_parquet_chunks, str(path))
+
+
+@accepts_cudf_fixture(cls="dataframe", dtype="int", cols=6)
+@pytest.mark.parametrize("sink", SOURCES)
+def bench_write_csv(benchmark, dataframe, tmp_path, sink):
+    run_write(benchmark, dataframe, tmp_path, "csv", sink)
+
+
+@accepts_cudf_fixture(cls="dataframe", dtype="int", cols=6)
+@pytest.mark.parametrize("source", SOURCES)
+@pytest.mark.parametrize("projection", PROJECTIONS)
+def bench_read_csv(benchmark, dataframe, tmp_path, projection, source):
+    run_read(
+        benchmark,
+        dataframe,
+        tmp_path,
+        "csv",
+        source,
+        {},
+        usecols=list(dataframe.columns[:projection]),
+    )
+
+
+@accepts_cudf_fixture(cls="dataframe", dtype="int", cols=6)
+@pytest.mark.parametrize("num_chunks", [4, 16])
+def bench_read_csv_chunked(benchmark, dataframe, tmp_path, num_chunks):
+    data = encode(dataframe, "csv")
+    benchmark.extra_info["io_bytes"] = len(data)
+    path = tmp_path / "data.csv"
+    path.write_bytes(data)
+    benchmark(
+        read_csv_chunks, str(path), num_chunks, len(dataframe), list(dataframe.columns)
+    )
+
+
+@accepts_cudf_fixture(cls="dataframe", dtype="int", cols=6)
+@pytest.mark.parametrize("sink", SOURCES)
+def bench_write_json(benchmark, dataframe, tmp_path, sink):
+    run_write(benchmark, dataframe, tmp_path, "json", sink)
+
+
+@accepts_cudf_fixture(cls="dataframe", dtype="int", cols=6)
+@pytest.mark.parametrize("source", SOURCES)
+def bench_read_json(benchmark, dataframe, tmp_path, source):
+    run_read(benchmark, dataframe, tmp_path, "json", source, {})
+
+
+@accepts_cudf_fixture(cls="dataframe", dtype="int", cols=6)
+@pytest.mark.parametrize("sink", SOURCES)
+@pytest.mark.parametrize("compression", [None, "snappy", "ZSTD"])
+@pytest.mark.parametrize("stripe_size", [1 << 20, 64 << 20])
+def bench_write_orc(benchmark, dataframe, tmp_path, compression, stripe_size, sink):
+    run_write(
+        benchmark,
+        dataframe,
+        tmp_path,
+        "orc",
+        sink,
+        **orc_options(compression, stripe_size),
+    )
+
+
+@accepts_cudf_fixture(cls="dataframe", dtype="int", cols=6)
+@pytest.mark.parametrize("source", SOURCES)
+@pytest.mark.parametrize("compression", [None, "snappy", "ZSTD"])
+@pytest.mark.parametrize("projection", PROJECTIONS)
+def bench_read_orc(benchmark, dataframe, tmp_path, compression, projection, source):
+    run_read(
+        benchmark,
+        dataframe,
+        tmp_path,
+        "orc",
+        source,
+        orc_options(compression),
+        columns=list(dataframe.columns[:projection]),
+    )
+
+
+@accepts_cudf_fixture(cls="dataframe", dtype="int", cols=6)
+@pytest.mark.parametrize("sink", SOURCES)
+@pytest.mark.parametrize("compression", ["uncompressed", "lz4", "zstd"])
+def bench_write_feather(benchmark, dataframe, tmp_path, compression, sink):
+    run_write(benchmark, dataframe, tmp_path, "feather", sink, compression=compression)
+
+
+@accepts_cudf_fixture(cls="dataframe", dtype="int", cols=6)
+@pytest.mark.parametrize("source", SOURCES)
+@pytest.mark.parametrize("compression", ["uncompressed", "lz4", "zstd"])
+@pytest.mark.parametrize("projection", PROJECTIONS)
+def bench_read_feather(benchmark, dataframe, tmp_path, compression, projection, source):
+    run_read(
+        benchmark,
+        dataframe,
+        tmp_path,
+        "feather",
+        source,
+        {"compression": compression},
+        columns=list(dataframe.columns[:projection]),
+    )
@@ -0,0 +1,190 @@
+"""Benchmarks of joins.
+
+Each join has a left (probe) and a right (build) input of independently
+controlled sizes, each with a `key` column and a float value column. The keys
+are determined by:
+    - duplicates: every key of the right input occurs this many times.
+    - overlap: the fraction of keys of the left input that occur in the right
+      input. Left keys are drawn from a range of keys 1 / overlap times larger
+      than the right keys, so an inner join produces about
+      `left_rows * overlap * duplicates` rows.
+    - skew: the exponent of a Zipf distribution of the left keys, in which the
+      most frequent keys are always matched.
+    - order: whether both inputs are presorted by key.
+
+The number of rows of the result is recorded as `output_rows` in the
+`extra_info` of each benchmark, so that the cost of join blowup is visible.
+"""
+
+import numpy
+import pytest
+from config import NUM_ROWS, backend, cudf, cupy
+from utils import Distribution, cached_input, column_generators, describe_input, to_host
+
+# The names of semi and anti joins differ between libraries. pandas (and thus
+# the polars adapter) has no semi joins, and pandas < 3.0 has no anti joins
+# either, so they are emulated with an indicator column (see `anti_join`).
+SEMI_ANTI = (
+    {"semi": "leftsemi", "anti": "leftanti"}
+    if backend.name == "cudf"
+    else {"anti": "left_anti"}
+)
+EMULATE_ANTI = backend.name in ("pandas", "pandas-pyarrow") and (
+    int(cudf.__version__.split(".")[0]) < 3
+)
+
+HOWS = [
+    "inner",
+    "left",
+    "outer",
+    pytest.param("semi", marks=pytest.mark.pandas_incompatible),
+    "anti",
+]
+
+
+def build_keys(codes, key_dtype):
+    """Convert integer codes to keys, preserving their order."""
+    if key_dtype == "int":
+        return codes
+    # Zero padded so that sorted codes produce sorted strings.
+    return numpy.char.mod("key%010d", to_host(codes)).astype(object)
+
+
+def join_input(side, nr, cardinality, key_dtype, skew=None, order=None):
+    """Get one input of a join, see `cached_input`.
+
+    Parameters
+    ----------
+    side : str
+        Either "left", whose keys are sampled from [0, cardinality), or
+        "right", in which each key in [0, cardinality) occurs equally often.
+    nr : int
+        The number of rows.
+    cardinality : int
+        The number of distinct keys.
+    key_dtype : str
+        Either "int" or "str".
+    skew : Optional[float]
+        The Zipf exponent of the keys of the left input.
+    order : Optional[str]
+        The order of the keys, see `Distribution`.
+    """
+    distribution = Distribution(cardinality=cardinality, skew=skew, order=order)
+    name = f"join_{side}_key_{key_dtype}{distribution.name}_rows_{nr}"
+
+    def make():
+        seed = 42 if side == "left" else 43
+        if side == "left":
+            codes = column_generators["int"](nr, seed=seed, distribution=distribution)
+        else:
+            rs = cupy.random.RandomState(seed)
+            codes = cupy.arange(nr) % cardinality
+            codes = (
+                rs.permutation(codes)
+                if order is None
+                else distribution.arrange(rs, codes)
+            )
+        return backend.convert(
+            cudf.DataFrame(
+                {
+                    "key": build_keys(codes, key_dtype),
+                    f"{side}_value": column_generators["float"](nr, seed=seed),
+                }
+            )
+        )
+
+    return cached_input(name, make)
+
+
+def join_inputs(
+    left_rows,
+    right_rows,
+    key_dtype="int",
+    overlap=0.5,
+    duplicates=1,
+    skew=None,
+    order=None,
+):
+    """Get the left and right inputs of a join, see the module docstring."""
+    cardinality = max(right_rows // duplicates, 1)
+    left = join_input(
+        "left", left_rows, round(cardinality / overlap), key_dtype, skew, order
+    )
+    right = join_input("right", right_rows, cardinality, key_dtype, order=order)
+    return left, right
+
+
+def anti_join(left, right, on):
+    """Get the rows of left whose keys do not occur in right."""
+    result = left.merge(right, on=on, how="left", indicator=True)
+    return result.loc[result["_merge"] == "left_only", left.columns]
+
+
+def run_join(benchmark, left, right, method, **kwargs):
+    """Benchmark a join of left and right.
+
+    `method` is either the name of a method of left or a function taking left
+    as its first argument.
+    """
+    left_info, right_info = describe_input(left), describe_input(right)
+    benchmark.extra_info.update(
+        rows=left_info["rows"] + right_info["rows"],
+        bytes=left_info["bytes"] + right_info["bytes"],
+        left_rows=left_info["rows"],
+        right_rows=right_info["rows"],
+    )
+    func = getattr(left, method) if isinstance(method, str) else method
+    args = (right,) if isinstance(method, str) else (left, right)
+    result = benchmark(func, *args, **kwargs)
+    benchmark.extra_info["output_rows"] = len(result)
+
+
+@pytest.mark.parametrize("left_rows", NUM_ROWS)
+@pytest.mark.parametrize("right_rows", NUM_ROWS)
+@pytest.mark.parametrize("how", HOWS)
+def bench_merge_how(benchmark, left_rows, right_rows, how):
+    left, right = join_inputs(left_rows, right_rows)
+    if how == "anti" and EMULATE_ANTI:
+        run_join(benchmark, left, right, anti_join, on="key")
+        return
+    how = SEMI_ANTI.get(how, how)
+    run_join(benchmark, left, right, "merge", on="key", how=how)
+
+
+@pytest.mark.parametrize("duplicates", [1, 4, 16])
+@pytest.mark.parametrize("overlap", [0.1, 0.5, 1.0])
+def bench_merge_duplicates(benchmark, duplicates, overlap):
+    left, right = join_inputs(
+        NUM_ROWS[-1], NUM_ROWS[-2], overlap=overlap, duplicates=duplicates
+    )
+    run_join(benchmark, left, right, "merge", on="key")
+
+
+@pytest.mark.parametrize("skew", [0, 1, 1.5])
+@pytest.mark.parametrize("how", ["inner", "left"])
+def bench_merge_skew(benchmark, skew, how):
+    left, right = join_inputs(NUM_ROWS[-1], NUM_ROWS[-2], skew=skew)
+    run_join(benchmark, left, right, "merge", on="key", how=how)
+
+
+@pytest.mark.parametrize("key_dtype", ["int", "str"])
+@pytest.mark.parametrize("how", ["inner", "left", "outer"])
+def bench_merge_key_dtype(benchmark, key_dtype, how):
+    left, right = join_inputs(NUM_ROWS[-1], NUM_ROWS[-1], key_dtype=key_dtype)
+    run_join(benchmark, left, right, "merge", on="key", how=how)
+
+
+@pytest.mark.parametrize("order", [None, "sorted"])
+@pytest.mark.parametrize("how", ["inner", "left"])
+def bench_merge_sorted(benchmark, order, how):
+    left, right = join_inputs(NUM_ROWS[-1], NUM_ROWS[-1], order=order)
+    run_join(benchmark, left, right, "merge", on="key", how=how)
+
+
+@pytest.mark.polars_incompatible
+@pytest.mark.parametrize("key_dtype", ["int", "str"])
+@pytest.mark.parametrize("how", ["inner", "left", "outer"])
+def bench_join_index(benchmark, key_dtype, how):
+    left, right = join_inputs(NUM_ROWS[-1], NUM_ROWS[-2], key_dtype=key_dtype)
+    left, right = left.set_index("key"), right.set_index("key")
+    run_join(benchmark, left, right, "join", how=how)
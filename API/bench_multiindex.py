@@ -3,6 +3,9 @@ import pandas as pd
 import pytest
 from config import cudf
 
+# polars has no MultiIndex.
+pytestmark = pytest.mark.polars_incompatible
+
 
 @pytest.fixture
 def pidx():
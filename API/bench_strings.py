@@ -0,0 +1,200 @@
+"""Benchmarks of string operations.
+
+The strings are generated by `StringColumnGenerator`s with configurable
+lengths and alphabets rather than taken from the standard fixtures, whose
+strings are short and alphanumeric. Every benchmark is parametrized over the
+string dtypes supported by the backend: object columns and, except under cudf
+(whose strings are always Arrow-like) or if pyarrow is not installed, the
+pyarrow-backed string dtypes.
+"""
+
+import importlib.util
+import string
+
+import pytest
+from config import NUM_ROWS, backend, cudf
+from utils import StringColumnGenerator, cached_input, column_generators
+
+# The polars adapter does not support the str accessor.
+pytestmark = pytest.mark.polars_incompatible
+
+STRING_DTYPES = ["object"]
+if backend.name != "cudf" and importlib.util.find_spec("pyarrow") is not None:
+    STRING_DTYPES += ["string[pyarrow]", "large_string[pyarrow]"]
+
+# The minimum and maximum length of the strings and their distribution.
+LENGTHS = {
+    "short": ((1, 16), "uniform"),
+    "long": ((16, 256), "uniform"),
+    "skewed": ((1, 256), "skewed"),
+}
+
+# Spaces are repeated so that strings contain several words to split.
+ALPHABETS = {
+    "ascii": string.ascii_lowercase + string.digits + " " * 6,
+    "unicode": "aäbcçdeéfghiïjklmnñoöpqrsßtuüvwxyz0123456789αβγжщ漢字한글" + " " * 6,
+}
+
+# The number of distinct strings.
+CARDINALITY = 10_000
+
+TEXT_GENERATORS = {
+    (lengths, alphabet): StringColumnGenerator(
+        f"text_{lengths}_{alphabet}",
+        cardinality=CARDINALITY,
+        lengths=LENGTHS[lengths][0],
+        alphabet=ALPHABETS[alphabet],
+        length_distribution=LENGTHS[lengths][1],
+    )
+    for lengths in LENGTHS
+    for alphabet in ALPHABETS
+}
+
+
+def strings(nr, dtype, lengths="short", alphabet="ascii", seed=42, benchmark=None):
+    """Get a Series of strings, see `cached_input`.
+
+    Parameters
+    ----------
+    nr : int
+        The number of rows.
+    dtype : str
+        The dtype of the Series, one of STRING_DTYPES.
+    lengths : str
+        The lengths of the strings, a key of LENGTHS.
+    alphabet : str
+        The characters of the strings, a key of ALPHABETS.
+    seed : int
+        The seed choosing the strings from the vocabulary.
+    benchmark : Optional[BenchmarkFixture]
+        If given, the size of the Series is recorded in its `extra_info`.
+    """
+    name = f"strings_{dtype}_{lengths}_{alphabet}_{seed}_rows_{nr}"
+
+    def make():
+        values = TEXT_GENERATORS[lengths, alphabet](nr, seed=seed)
+        return cudf.Series(values, dtype=dtype)
+
+    return cached_input(name, make, benchmark)
+
+
+def vocabulary(dtype, lengths="short", alphabet="ascii"):
+    """Get a frame of the distinct strings of `strings` and their codes.
+
+    Short strings occur several times in the vocabulary, so duplicates are
+    dropped to ensure that each string matches a single row.
+    """
+    name = f"strings_vocabulary_{dtype}_{lengths}_{alphabet}"
+
+    def make():
+        generator = TEXT_GENERATORS[lengths, alphabet]
+        return cudf.DataFrame(
+            {
+                "key": cudf.Series(generator.vocabulary(CARDINALITY), dtype=dtype),
+                "code": column_generators["int"](CARDINALITY, seed=44),
+            }
+        ).drop_duplicates("key")
+
+    return cached_input(name, make)
+
+
+@pytest.mark.parametrize("nr", NUM_ROWS)
+@pytest.mark.parametrize("dtype", STRING_DTYPES)
+@pytest.mark.parametrize("lengths", list(LENGTHS))
+@pytest.mark.parametrize("alphabet", list(ALPHABETS))
+@pytest.mark.parametrize("regex", [False, True])
+def bench_str_contains(benchmark, nr, dtype, lengths, alphabet, regex):
+    series = strings(nr, dtype, lengths, alphabet, benchmark=benchmark)
+    pattern = r"[0-9]{2}\s" if regex else "ab"
+    benchmark(series.str.contains, pattern, regex=regex)
+
+
+@pytest.mark.parametrize("nr", NUM_ROWS)
+@pytest.mark.parametrize("dtype", STRING_DTYPES)
+@pytest.mark.parametrize("lengths", list(LENGTHS))
+@pytest.mark.parametrize("regex", [False, True])
+def bench_str_replace(benchmark, nr, dtype, lengths, regex):
+    series = strings(nr, dtype, lengths, benchmark=benchmark)
+    pattern = r"\s+" if regex else " "
+    benchmark(series.str.replace, pattern, "_", regex=regex)
+
+
+@pytest.mark.parametrize("nr", NUM_ROWS)
+@pytest.mark.parametrize("dtype", STRING_DTYPES)
+@pytest.mark.parametrize("lengths", list(LENGTHS))
+@pytest.mark.parametrize("expand", [False, True])
+def bench_str_split(benchmark, nr, dtype, lengths, expand):
+    series = strings(nr, dtype, lengths, benchmark=benchmark)
+    benchmark(series.str.split, " ", n=2, expand=expand)
+
+
+@pytest.mark.parametrize("nr", NUM_ROWS)
+@pytest.mark.parametrize("dtype", STRING_DTYPES)
+@pytest.mark.parametrize("lengths", list(LENGTHS))
+def bench_str_extract(benchmark, nr, dtype, lengths):
+    series = strings(nr, dtype, lengths, benchmark=benchmark)
+    benchmark(series.str.extract, r"(?P<word>[a-z]+)(?P<number>[0-9]+)", expand=True)
+
+
+@pytest.mark.parametrize("nr", NUM_ROWS)
+@pytest.mark.parametrize("dtype", STRING_DTYPES)
+@pytest.mark.parametrize("lengths", list(LENGTHS))
+@pytest.mark.parametrize("alphabet", list(ALPHABETS))
+@pytest.mark.parametrize("op", ["lower", "upper", "len"])
+def bench_str_unary(benchmark, nr, dtype, lengths, alphabet, op):
+    series = strings(nr, dtype, lengths, alphabet, benchmark=benchmark)
+    benchmark(getattr(series.str, op))
+
+
+@pytest.mark.parametrize("nr", NUM_ROWS)
+@pytest.mark.parametrize("dtype", STRING_DTYPES)
+@pytest.mark.parametrize("lengths", list(LENGTHS))
+@pytest.mark.parametrize("alphabet", list(ALPHABETS))
+def bench_str_slice(benchmark, nr, dtype, lengths, alphabet):
+    series = strings(nr, dtype, lengths, alphabet, benchmark=benchmark)
+    benchmark(series.str.slice, 2, 8)
+
+
+@pytest.mark.parametrize("nr", NUM_ROWS)
+@pytest.mark.parametrize("dtype", STRING_DTYPES)
+@pytest.mark.parametrize("lengths", list(LENGTHS))
+def bench_str_cat(benchmark, nr, dtype, lengths):
+    series = strings(nr, dtype, lengths, benchmark=benchmark)
+    other = strings(nr, dtype, lengths, seed=43)
+    benchmark(series.str.cat, other, sep="-")
+
+
+@pytest.mark.parametrize("nr", NUM_ROWS)
+@pytest.mark.parametrize("dtype", STRING_DTYPES)
+@pytest.mark.parametrize("lengths", list(LENGTHS))
+def bench_str_startswith(benchmark, nr, dtype, lengths):
+    series = strings(nr, dtype, lengths, benchmark=benchmark)
+    benchmark(series.str.startswith, "a")
+
+
+@pytest.mark.parametrize("nr", NUM_ROWS)
+@pytest.mark.parametrize("dtype", STRING_DTYPES)
+@pytest.mark.parametrize("lengths", list(LENGTHS))
+def bench_str_sort_values(benchmark, nr, dtype, lengths):
+    benchmark(strings(nr, dtype, lengths, benchmark=benchmark).sort_values)
+
+
+# Each string is looked up in a frame of the distinct strings, so the result
+# has as many rows as the input.
+@pytest.mark.parametrize("nr", NUM_ROWS)
+@pytest.mark.parametrize("dtype", STRING_DTYPES)
+@pytest.mark.parametrize("lengths", list(LENGTHS))
+def bench_str_merge(benchmark, nr, dtype, lengths):
+    frame = strings(nr, dtype, lengths, benchmark=benchmark).to_frame("key")
+    benchmark(frame.merge, vocabulary(dtype, lengths), on="key")
+
+
+@pytest.mark.parametrize("nr", NUM_ROWS)
+@pytest.mark.parametrize("dtype", STRING_DTYPES)
+@pytest.mark.parametrize("lengths", list(LENGTHS))
+def bench_str_groupby(benchmark, nr, dtype, lengths):
+    series = strings(nr, dtype, lengths, benchmark=benchmark)
+    frame = cudf.DataFrame(
+        {"key": series, "value": column_generators["float"](nr, seed=43)}
+    )
+    benchmark(frame.groupby("key").agg, "sum")
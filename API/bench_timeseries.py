@@ -0,0 +1,128 @@
+"""Benchmarks of time series operations.
+
+The standard fixtures have integer indexes, so these benchmarks use frames
+with a DatetimeIndex and float value columns. The index is either regular
+(one row per second) or irregular (gaps drawn from an exponential
+distribution with a mean of one second), so both span about the same time
+for a given number of rows. The window sizes of the windowing operations are
+parametrized, since their cost may grow with the length of the window.
+"""
+
+import pytest
+from config import NUM_ROWS, backend, cudf, cupy
+from utils import cached_input, column_generators
+
+# The polars adapter does not support datetime indexes.
+pytestmark = pytest.mark.polars_incompatible
+
+INDEXES = ["regular", "irregular"]
+VALUE_COLUMNS = ["a", "b"]
+
+# Nanoseconds since the epoch of 2020-01-01.
+START = 1_577_836_800 * 10**9
+
+
+def timeseries(nr, index="regular", tz=None, benchmark=None):
+    """Get a time-indexed frame, see `cached_input`.
+
+    Parameters
+    ----------
+    nr : int
+        The number of rows.
+    index : str
+        Either "regular" or "irregular", see the module docstring.
+    tz : Optional[str]
+        The timezone of the index. If None, the index is timezone-naive.
+    benchmark : Optional[BenchmarkFixture]
+        If given, the size of the frame is recorded in its `extra_info`.
+    """
+    name = f"timeseries_{index}_tz_{tz}_rows_{nr}"
+
+    def make():
+        if index == "regular":
+            timestamps = START + cupy.arange(nr, dtype="int64") * 10**9
+        else:
+            rs = cupy.random.RandomState(42)
+            gaps = rs.exponential(10**9, nr).astype("int64")
+            timestamps = START + cupy.cumsum(gaps)
+        frame = cudf.DataFrame(
+            {
+                column: column_generators["float"](nr, seed=43 + i)
+                for i, column in enumerate(VALUE_COLUMNS)
+            },
+            index=cudf.Series(timestamps).astype("datetime64[ns]"),
+        )
+        if tz is not None:
+            frame.index = frame.index.tz_localize(tz)
+        return backend.convert(frame)
+
+    return cached_input(name, make, benchmark)
+
+
+@pytest.mark.parametrize("nr", NUM_ROWS)
+@pytest.mark.parametrize("index", INDEXES)
+@pytest.mark.parametrize("rule", ["1min", "1h"])
+@pytest.mark.parametrize("agg", ["sum", "mean", "max"])
+def bench_resample_agg(benchmark, nr, index, rule, agg):
+    frame = timeseries(nr, index, benchmark=benchmark)
+    benchmark(lambda: frame.resample(rule).agg(agg))
+
+
+@pytest.mark.parametrize("nr", NUM_ROWS)
+@pytest.mark.parametrize("index", INDEXES)
+@pytest.mark.parametrize("window", [3, 100, 10_000])
+@pytest.mark.parametrize("agg", ["sum", "mean"])
+def bench_rolling_fixed(benchmark, nr, index, window, agg):
+    frame = timeseries(nr, index, benchmark=benchmark)
+    benchmark(lambda: getattr(frame.rolling(window), agg)())
+
+
+@pytest.mark.parametrize("nr", NUM_ROWS)
+@pytest.mark.parametrize("index", INDEXES)
+@pytest.mark.parametrize("window", ["10s", "10min", "1h"])
+@pytest.mark.parametrize("agg", ["sum", "mean"])
+def bench_rolling_time(benchmark, nr, index, window, agg):
+    frame = timeseries(nr, index, benchmark=benchmark)
+    benchmark(lambda: getattr(frame.rolling(window), agg)())
+
+
+@pytest.mark.parametrize("nr", NUM_ROWS)
+@pytest.mark.parametrize("span", [3, 100, 10_000])
+def bench_ewm_mean(benchmark, nr, span):
+    frame = timeseries(nr, benchmark=benchmark)
+    benchmark(lambda: frame.ewm(span=span).mean())
+
+
+@pytest.mark.parametrize("nr", NUM_ROWS)
+@pytest.mark.parametrize("op", ["shift", "diff"])
+@pytest.mark.parametrize("periods", [1, 100])
+def bench_shift_diff(benchmark, nr, op, periods):
+    frame = timeseries(nr, benchmark=benchmark)
+    benchmark(getattr(frame, op), periods)
+
+
+# Each row of the irregular series is matched with the last (or nearest) row
+# of the regular series at or before its timestamp. cudf has no merge_asof.
+@pytest.mark.cudf_incompatible
+@pytest.mark.parametrize("nr", NUM_ROWS)
+@pytest.mark.parametrize("direction", ["backward", "nearest"])
+def bench_merge_asof(benchmark, nr, direction):
+    left = timeseries(nr, "irregular", benchmark=benchmark)
+    right = timeseries(nr, "regular")
+    benchmark(
+        cudf.merge_asof,
+        left,
+        right,
+        left_index=True,
+        right_index=True,
+        suffixes=("_left", "_right"),
+        direction=direction,
+    )
+
+
+@pytest.mark.parametrize("nr", NUM_ROWS)
+@pytest.mark.parametrize("index", INDEXES)
+@pytest.mark.parametrize("tz", ["America/New_York", "Asia/Kolkata"])
+def bench_tz_convert(benchmark, nr, index, tz):
+    frame = timeseries(nr, index, tz="UTC", benchmark=benchmark)
+    benchmark(frame.index.tz_convert, tz)
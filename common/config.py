@@ -3,14 +3,63 @@
 This file contains global definitions that are important for configuring all
 benchmarks such as fixture sizes. In addition, this file supports the following
 features:
-    - Defining the CUDF_BENCHMARKS_USE_PANDAS environment variable will change
-      all benchmarks to run with pandas instead of cudf (and numpy instead of
-      cupy). This feature enables easy comparisons of benchmarks between cudf
-      and pandas. All common modules (cudf, cupy) should be imported from here
-      by benchmark modules to allow configuration if needed.
+    - The --backend option (or equivalently the CUDF_BENCHMARKS_BACKEND
+      environment variable) selects the DataFrame library that all benchmarks
+      run with. The available backends are listed in `BACKENDS`, and the
+      default is cudf. All common modules (cudf, cupy) should be imported from
+      here by benchmark modules to allow configuration if needed, e.g. under
+      the pandas backend `cudf` is pandas and `cupy` is numpy.
+    - Defining the CUDF_BENCHMARKS_USE_PANDAS environment variable is
+      equivalent to `--backend pandas`. This feature enables easy comparisons
+      of benchmarks between cudf and pandas.
+    - The --bench-memory option records the peak memory usage of every
+      benchmark in the benchmark JSON, see instrumentation.py.
+    - The --bench-precision option runs each benchmark until the confidence
+      interval of its median time is narrower than the given fraction of the
+      median, or for at most --bench-time-cap seconds, instead of for a fixed
+      time. See instrumentation.py.
+    - The --bench-profile option profiles every benchmark outside its timed
+      rounds and saves a cProfile profile, a summary of the functions with
+      the most self time and collapsed stacks (for flame graphs) of each
+      benchmark in the given directory. See instrumentation.py.
+    - The --bench-cold option additionally times the first call of every
+      benchmark in a fresh process (reported as `cold_seconds` next to the
+      warm median), to expose one-time costs such as kernel compilation and
+      lazy imports. See instrumentation.py.
     - Defining CUDF_BENCHMARKS_TEST_ONLY will set global configuration
       variables to avoid running large benchmarks, instead using minimal values
       to simply ensure that benchmarks are functional.
+    - Defining CUDF_BENCHMARKS_OVERHEAD enables the overhead mode, in which
+      fixtures have 0, 1, 10 and 100 rows so that benchmarks measure the fixed
+      per-call cost of operations (argument validation, dtype inference,
+      result wrapping) rather than their throughput. The time spent in each
+      of these is recorded for every benchmark (see instrumentation.py) and
+      can be compared to the no-op baselines in suite/bench_overhead.py.
+    - Defining CUDF_BENCHMARKS_SCALING_MAX_ROWS enables the scaling mode, in
+      which fixtures are generated for a geometric grid of sizes (with
+      SCALING_POINTS_PER_DECADE sizes per power of 10) from 100 rows up to the
+      given number of rows. The results can be analyzed with
+      scripts/fit_scaling.py to determine how each benchmark scales.
+    - Defining CUDF_BENCHMARKS_FIXTURE_CACHE_BYTES sets the memory budget (in
+      bytes) of the session-wide cache of generated fixture objects. Setting it
+      to 0 disables the cache so that every fixture is rebuilt on request.
+    - Defining CUDF_BENCHMARKS_DATA_DIR enables a persistent store of the
+      random data used to build fixtures in that directory. Data is generated
+      once and memory-mapped back in subsequent sessions (and by other
+      pytest-xdist workers) instead of being regenerated.
+    - Defining CUDF_BENCHMARKS_SCALE_FACTORS as a comma-separated list of
+      numbers (e.g. "0.1,1") sets the scale factors of the generated tables
+      that the workload benchmarks run on.
+    - Defining CUDF_BENCHMARKS_STREAM_MEMORY_CAP as a number of bytes enables
+      the streaming benchmarks, which process a Parquet dataset larger than
+      that cap in chunks (see streaming.py). Only chunk sizes whose chunks
+      fit under the cap are benchmarked. The dataset is written to
+      CUDF_BENCHMARKS_DATA_DIR if defined, and to a temporary directory
+      otherwise.
+    - Defining CUDF_BENCHMARKS_SELECT as the path of a file of benchmark IDs
+      (one per line) restricts the session to those benchmarks. This is how
+      scripts/parallel_run.py distributes benchmarks across workers, since
+      the IDs may be too many to pass as arguments.
 
 This file is also where standard pytest hooks should be overridden. While these
 definitions typically belong in conftest.py, since any of the above environment
@@ -18,32 +67,203 @@ variables could affect test collection or other properties, we must define them
 in this file and import them in conftest.py to ensure that they are handled
 appropriately.
 """
+import argparse
+import importlib
+import math
 import os
 import sys
 
-# Environment variable-based configuration of benchmarking pandas or cudf.
-collect_ignore = []
-if "CUDF_BENCHMARKS_USE_PANDAS" in os.environ:
-    import numpy as cupy
-    import pandas as cudf
 
-    # cudf internals offer no pandas compatibility guarantees, and we also
-    # never need to compare those benchmarks to pandas.
-    collect_ignore.append("internal/")
+class Backend:
+    """A DataFrame library that benchmarks may be run with.
 
-    # Also filter out benchmarks of APIs that are not compatible with pandas.
-    def is_pandas_compatible(item):
-        return all(m.name != "pandas_incompatible" for m in item.own_markers)
+    Parameters
+    ----------
+    name : str
+        The name used to select the backend.
+    frame_module : str
+        The module providing the cudf API, aliased as `cudf` in benchmarks.
+    array_module : str
+        The module providing the cupy API, aliased as `cupy` in benchmarks.
+    incompatible : Tuple[str]
+        The markers of benchmarks that cannot be run with this backend. The
+        marker `{name}_incompatible` is always included.
+    collect_ignore : Tuple[str]
+        Paths containing benchmarks that cannot be run with this backend.
+    convert : Optional[Callable]
+        A function applied to every generated fixture object, e.g. to convert
+        it to the dtypes native to the backend.
+    """
 
-    def pytest_collection_modifyitems(session, config, items):
-        items[:] = list(filter(is_pandas_compatible, items))
+    def __init__(
+        self,
+        name,
+        frame_module,
+        array_module,
+        incompatible=(),
+        collect_ignore=(),
+        convert=None,
+    ):
+        self.name = name
+        self.frame_module = frame_module
+        self.array_module = array_module
+        self.marker = f"{name.replace('-', '_')}_incompatible"
+        self.incompatible = (self.marker, *incompatible)
+        self.collect_ignore = list(collect_ignore)
+        self.convert = convert or (lambda obj: obj)
 
-else:
-    import cudf  # noqa: W0611, F401
-    import cupy  # noqa: W0611, F401
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.name})"
+
+    def load(self):
+        """Import the frame and array modules of this backend."""
+        return (
+            importlib.import_module(self.frame_module),
+            importlib.import_module(self.array_module),
+        )
+
+    def is_compatible(self, item):
+        return all(m.name not in self.incompatible for m in item.iter_markers())
+
+
+def to_pyarrow_dtypes(obj):
+    """Convert a pandas object to pyarrow-backed dtypes."""
+    import pandas as pd
+    import pyarrow as pa
+
+    if isinstance(obj, pd.DataFrame):
+        return pd.DataFrame(
+            {c: to_pyarrow_dtypes(obj[c]) for c in obj.columns}, index=obj.index
+        )
+    if isinstance(obj.dtype, (pd.ArrowDtype, pd.CategoricalDtype)):
+        return obj
+    # Converting via pyarrow (rather than with astype) preserves all nulls,
+    # including NaT and the masks of nullable dtypes such as Int64.
+    array = pa.array(obj, from_pandas=True)
+    if pa.types.is_large_string(array.type):
+        array = array.cast(pa.string())
+    if isinstance(obj, pd.Index):
+        return pd.Index(array, dtype=pd.ArrowDtype(array.type), name=obj.name)
+    return pd.Series(
+        array, dtype=pd.ArrowDtype(array.type), index=obj.index, name=obj.name
+    )
+
+
+# cudf internals offer no compatibility guarantees with other libraries, and we
+# also never need to compare those benchmarks to other libraries.
+BACKENDS = {
+    backend.name: backend
+    for backend in [
+        Backend("cudf", "cudf", "cupy"),
+        Backend(
+            "pandas",
+            "pandas",
+            "numpy",
+            collect_ignore=["internal/"],
+        ),
+        Backend(
+            "pandas-pyarrow",
+            "pandas",
+            "numpy",
+            incompatible=["pandas_incompatible"],
+            collect_ignore=["internal/"],
+            convert=to_pyarrow_dtypes,
+        ),
+        Backend(
+            "polars",
+            "polars_adapter",
+            "numpy",
+            incompatible=["pandas_incompatible"],
+            collect_ignore=["internal/"],
+        ),
+    ]
+}
+
+
+def requested_backend():
+    """Get the name of the backend requested for this session.
+
+    The backend must be known when this module is imported, which is before
+    pytest has parsed any options, so the --backend option is parsed directly.
+    The result is saved in the environment so that it is inherited by any
+    subprocesses, such as pytest-xdist workers.
+    """
+    parser = argparse.ArgumentParser(add_help=False, allow_abbrev=False)
+    parser.add_argument("--backend")
+    args, _ = parser.parse_known_args(sys.argv[1:])
+
+    if args.backend is not None:
+        name = args.backend
+    elif "CUDF_BENCHMARKS_BACKEND" in os.environ:
+        name = os.environ["CUDF_BENCHMARKS_BACKEND"]
+    elif "CUDF_BENCHMARKS_USE_PANDAS" in os.environ:
+        name = "pandas"
+    else:
+        name = "cudf"
+    os.environ["CUDF_BENCHMARKS_BACKEND"] = name
+    return name
+
+
+backend = BACKENDS[requested_backend()]
+cudf, cupy = backend.load()
+collect_ignore = backend.collect_ignore
 
-    def pytest_collection_modifyitems(session, config, items):
-        pass
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--backend",
+        choices=list(BACKENDS),
+        default=os.environ["CUDF_BENCHMARKS_BACKEND"],
+        help="The DataFrame library to run benchmarks with (default: cudf).",
+    )
+    group = parser.getgroup("instrumentation", "opt-in benchmark instrumentation")
+    group.addoption(
+        "--bench-memory",
+        action="store_true",
+        help="Record the peak memory usage of each benchmarked call.",
+    )
+    group.addoption(
+        "--bench-precision",
+        type=float,
+        help="Run rounds until the 95%% confidence interval of the median is "
+        "narrower than this fraction of the median (e.g. 0.02).",
+    )
+    group.addoption(
+        "--bench-time-cap",
+        type=float,
+        default=10.0,
+        help="The maximum time in seconds spent on the rounds of each benchmark "
+        "with --bench-precision (default: 10).",
+    )
+    group.addoption(
+        "--bench-profile",
+        metavar="DIR",
+        help="Save a profile and collapsed stacks of each benchmark in DIR.",
+    )
+    group.addoption(
+        "--bench-cold",
+        action="store_true",
+        help="Also time the first call of each benchmark in a fresh process.",
+    )
+
+
+def pytest_configure(config):
+    for b in BACKENDS.values():
+        config.addinivalue_line(
+            "markers", f"{b.marker}: mark a benchmark that cannot be run with {b.name}"
+        )
+
+
+def pytest_collection_modifyitems(session, config, items):
+    # Filter out benchmarks of APIs that are not compatible with the backend.
+    items[:] = list(filter(backend.is_compatible, items))
+    if "CUDF_BENCHMARKS_SELECT" in os.environ:
+        with open(os.environ["CUDF_BENCHMARKS_SELECT"]) as f:
+            selected = set(f.read().splitlines())
+        config.hook.pytest_deselected(
+            items=[item for item in items if item.nodeid not in selected]
+        )
+        items[:] = [item for item in items if item.nodeid in selected]
 
 
 def pytest_sessionstart(session):
@@ -57,10 +277,61 @@ def pytest_sessionfinish(session, exitstatus):
         del sys.path[0]
 
 
+def geometric_grid(start, stop, points_per_decade):
+    """Return the integers from start to stop (inclusive) spaced geometrically."""
+    num = round(math.log10(stop / start) * points_per_decade)
+    return sorted(
+        {round(start * (stop / start) ** (i / num)) for i in range(num + 1)}
+        if num > 0
+        else {start}
+    )
+
+
 # Constants used to define benchmarking standards.
-if "CUDF_BENCHMARKS_TEST_ONLY" in os.environ:
+SCALING_POINTS_PER_DECADE = 4
+TEST_ONLY = "CUDF_BENCHMARKS_TEST_ONLY" in os.environ
+OVERHEAD = "CUDF_BENCHMARKS_OVERHEAD" in os.environ
+if TEST_ONLY:
     NUM_ROWS = [10, 20]
     NUM_COLS = [1, 6]
+elif OVERHEAD:
+    NUM_ROWS = [0, 1, 10, 100]
+    NUM_COLS = [1, 6]
+elif "CUDF_BENCHMARKS_SCALING_MAX_ROWS" in os.environ:
+    NUM_ROWS = geometric_grid(
+        100,
+        int(os.environ["CUDF_BENCHMARKS_SCALING_MAX_ROWS"]),
+        SCALING_POINTS_PER_DECADE,
+    )
+    NUM_COLS = [1, 6]
 else:
     NUM_ROWS = [100, 10_000, 1_000_000]
     NUM_COLS = [1, 6]
+
+# The default budget comfortably holds the full grid of int and float fixtures.
+FIXTURE_CACHE_BYTES = int(
+    os.environ.get("CUDF_BENCHMARKS_FIXTURE_CACHE_BYTES", 2 * 1024**3)
+)
+DATA_DIR = os.environ.get("CUDF_BENCHMARKS_DATA_DIR")
+
+# The scale factors of the workload benchmarks, see tpch.py.
+if TEST_ONLY:
+    SCALE_FACTORS = [0.0001]
+elif "CUDF_BENCHMARKS_SCALE_FACTORS" in os.environ:
+    SCALE_FACTORS = [
+        float(sf) for sf in os.environ["CUDF_BENCHMARKS_SCALE_FACTORS"].split(",")
+    ]
+else:
+    SCALE_FACTORS = [0.01, 0.1]
+
+# The memory cap and candidate chunk sizes of the streaming benchmarks, see
+# streaming.py. Chunk sizes whose chunks do not fit under the cap are dropped.
+# The streaming benchmarks are skipped if the memory cap is None.
+if TEST_ONLY:
+    STREAM_MEMORY_CAP = 1_000_000
+    STREAM_CHUNK_ROWS = [1_000, 5_000]
+else:
+    STREAM_MEMORY_CAP = os.environ.get("CUDF_BENCHMARKS_STREAM_MEMORY_CAP")
+    if STREAM_MEMORY_CAP is not None:
+        STREAM_MEMORY_CAP = int(STREAM_MEMORY_CAP)
+    STREAM_CHUNK_ROWS = [10_000, 100_000, 1_000_000, 4_000_000]
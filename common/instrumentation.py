@@ -0,0 +1,581 @@
+"""Instrumentation of benchmarked callables.
+
+Instruments measure properties of a benchmarked callable other than its run
+time, such as its memory usage. Each enabled instrument makes one additional
+call to the callable before the timed rounds begin, so instrumentation never
+affects the reported timings. The measurements are stored in the
+`extra_info` of the benchmark, which pytest-benchmark saves in its JSON output
+alongside the timings.
+
+With --bench-precision, rounds are run adaptively: instead of running for a
+fixed time, a benchmark keeps running rounds until the 95% confidence interval
+of its median is narrower than the requested fraction of the median, or until
+--bench-time-cap seconds have elapsed. The achieved relative width of the
+interval is recorded in `extra_info` as `median_ci_relative_width`.
+
+With --bench-profile DIR, each benchmarked callable is additionally profiled
+with cProfile and a stack sampler, and the profiles are saved in DIR (see
+`Profiler`). The functions with the most self time are recorded in
+`extra_info` as `profile_top`.
+
+In the overhead mode (CUDF_BENCHMARKS_OVERHEAD), `measure_dispatch` records
+the estimated time of each call spent validating arguments, inferring dtypes
+and wrapping results as `dispatch_seconds`, to separate these fixed costs from
+the work proportional to the size of the data.
+
+With --bench-cold, the first call of each benchmarked callable is also timed
+in a fresh pytest process running only that benchmark, so that one-time costs
+such as imports, kernel compilation, cache population and memory pool growth
+are included. The child process is told (through the COLD_OUTPUT environment
+variable) to time a single call after its fixtures are built instead of
+running rounds, and to write the time to a file. The time is recorded in
+`extra_info` as `cold_seconds`, alongside the ratio `cold_to_warm` of the cold
+time to the median of the (warm) timed rounds.
+
+In addition, every benchmark is annotated with the size of its input (rows,
+cols, and bytes) and the resulting throughput (rows/s and GB/s). Benchmarks of
+I/O additionally record the size of the data read or written as `io_bytes`,
+from which the I/O throughput (MB/s) is computed.
+"""
+
+import contextlib
+import cProfile
+import functools
+import hashlib
+import math
+import os
+import pstats
+import re
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+from config import backend
+from pytest_benchmark.fixture import BenchmarkFixture
+
+try:
+    from pytest_benchmark.fixture import PauseInstrumentation
+except ImportError:
+    # pytest-benchmark < 5.1 does not pause coverage or profilers.
+    PauseInstrumentation = contextlib.nullcontext
+from results import ROW_PARAMETERS, median, median_confidence_interval
+from utils import WRAPPER_FILENAME, describe_input, synchronize
+
+# The environment variable holding the path that a benchmark run in a child
+# process by --bench-cold writes the time of its first call to.
+COLD_OUTPUT = "CUDF_BENCHMARKS_COLD_OUTPUT"
+
+
+def _read_proc_status():
+    """Read the current and peak RSS (in bytes) from /proc/self/status."""
+    values = {}
+    with open("/proc/self/status") as f:
+        for line in f:
+            key, _, value = line.partition(":")
+            if key in ("VmRSS", "VmHWM"):
+                values[key] = int(value.split()[0]) * 1024
+    return values["VmRSS"], values["VmHWM"]
+
+
+def _reset_peak_rss():
+    """Reset the peak RSS of the process to its current RSS if supported.
+
+    Returns
+    -------
+    bool
+        Whether the peak was reset (only supported on Linux).
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+class PeakRSS:
+    """Measure the increase in the peak resident set size of the process.
+
+    On Linux the peak is reset before the call, so the measurement is exact.
+    Elsewhere only calls that exceed the lifetime peak of the process (e.g.
+    calls that are larger than those of previous benchmarks) are measured.
+    """
+
+    def __enter__(self):
+        self._reset = _reset_peak_rss()
+        if self._reset:
+            self._start, _ = _read_proc_status()
+        else:
+            self._start = self._maxrss()
+        return self
+
+    def __exit__(self, *args):
+        if self._reset:
+            _, peak = _read_proc_status()
+        else:
+            peak = self._maxrss()
+        self.peak_delta = max(peak - self._start, 0)
+
+    @staticmethod
+    def _maxrss():
+        maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS and in kilobytes elsewhere.
+        return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+class TracemallocPeak:
+    """Measure the peak memory allocated through the Python allocators.
+
+    This includes numpy arrays, which report their allocations to tracemalloc,
+    but not allocations made directly by native libraries such as Arrow.
+    """
+
+    def __enter__(self):
+        tracemalloc.start()
+        return self
+
+    def __exit__(self, *args):
+        _, self.peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+
+class RMMStatistics:
+    """Measure device memory allocations with RMM's statistics adaptor.
+
+    The previous memory resource is restored afterwards so that the overhead
+    of tracking statistics does not affect the timed rounds.
+    """
+
+    def __enter__(self):
+        import rmm.mr
+        import rmm.statistics
+
+        self._mr = rmm.mr.get_current_device_resource()
+        rmm.statistics.enable_statistics()
+        rmm.statistics.push_statistics()
+        return self
+
+    def __exit__(self, *args):
+        import rmm.mr
+        import rmm.statistics
+
+        self.statistics = rmm.statistics.pop_statistics()
+        rmm.mr.set_current_device_resource(self._mr)
+
+
+class StackSampler:
+    """Sample the Python stack of the calling thread from a background thread.
+
+    Only the frames below the frame that entered the sampler are recorded,
+    and frames of the wrappers generated by `accepts_cudf_fixture` are
+    omitted. Native code holding the GIL delays samples until it returns, so
+    time spent in it is attributed to the calling Python frame.
+
+    Parameters
+    ----------
+    interval : float
+        The time in seconds between samples.
+    """
+
+    def __init__(self, interval=0.001):
+        self.interval = interval
+        self.counts = {}
+
+    def __enter__(self):
+        self._thread_id = threading.get_ident()
+        self._root = sys._getframe(1)
+        self._stop = threading.Event()
+        # The sampler must acquire the GIL at least once per interval.
+        self._switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self._switch_interval, self.interval))
+        self._sampler = threading.Thread(target=self._run, daemon=True)
+        self._sampler.start()
+        return self
+
+    def __exit__(self, *args):
+        self._stop.set()
+        self._sampler.join()
+        sys.setswitchinterval(self._switch_interval)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            stack = []
+            while frame is not None and frame is not self._root:
+                code = frame.f_code
+                if code.co_filename != WRAPPER_FILENAME:
+                    stack.append(
+                        f"{getattr(code, 'co_qualname', code.co_name)} "
+                        f"({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+                    )
+                frame = frame.f_back
+            # Samples taken outside the sampled calls have no frames.
+            if frame is not None and stack:
+                key = ";".join(reversed(stack))
+                self.counts[key] = self.counts.get(key, 0) + 1
+
+    def write_collapsed(self, path):
+        """Write the samples in the collapsed stack format of flamegraph.pl."""
+        with open(path, "w") as f:
+            for stack, count in sorted(self.counts.items()):
+                f.write(f"{stack} {count}\n")
+
+
+class Profiler:
+    """Profile a benchmarked callable and save the profiles to a directory.
+
+    The callable is called once under cProfile, whose statistics are saved as
+    `{name}.prof` (readable by pstats or snakeviz) together with a summary of
+    the functions with the most self time in `{name}.txt`. It is then called
+    repeatedly for at least `sample_seconds` under a `StackSampler`, whose
+    samples are saved as `{name}.collapsed` for flamegraph.pl or speedscope.
+
+    Parameters
+    ----------
+    directory : str
+        The directory to save the profiles in.
+    benchmark_id : str
+        The ID of the benchmark, from which the file names are derived.
+    sample_seconds : float
+        The minimum time spent sampling stacks.
+    """
+
+    def __init__(self, directory, benchmark_id, sample_seconds=1.0):
+        name = re.sub(r"[^\w.=-]+", "_", benchmark_id).strip("_")
+        # Benchmark IDs may exceed the maximum length of file names.
+        if len(name) > 150:
+            digest = hashlib.sha1(benchmark_id.encode()).hexdigest()[:12]
+            name = f"{name[:137]}_{digest}"
+        self.path = os.path.join(directory, name)
+        self.sample_seconds = sample_seconds
+
+    def __call__(self, function, args, kwargs):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        profile = cProfile.Profile()
+        profile.runcall(function, *args, **kwargs)
+        synchronize()
+        profile.dump_stats(f"{self.path}.prof")
+        stats = pstats.Stats(profile)
+        # pstats has no public way to omit functions, so the wrappers generated
+        # by accepts_cudf_fixture are removed from its table directly.
+        for func in [func for func in stats.stats if func[0] == WRAPPER_FILENAME]:
+            del stats.stats[func]
+        with open(f"{self.path}.txt", "w") as f:
+            stats.stream = f
+            stats.sort_stats(pstats.SortKey.TIME).print_stats(30)
+        top = [
+            {"function": pstats.func_std_string(func), "self_seconds": tottime}
+            for func, (_, _, tottime, _, _) in sorted(
+                stats.stats.items(), key=lambda item: item[1][2], reverse=True
+            )[:5]
+        ]
+
+        start = time.perf_counter()
+        with StackSampler() as sampler:
+            while True:
+                function(*args, **kwargs)
+                synchronize()
+                if time.perf_counter() - start >= self.sample_seconds:
+                    break
+        sampler.write_collapsed(f"{self.path}.collapsed")
+        return {"profile": self.path, "profile_top": top}
+
+
+# Patterns matching the qualified names of the functions of the dataframe
+# libraries that perform each kind of fixed per-call work.
+DISPATCH_CATEGORIES = {
+    "validation": re.compile(r"(^|\.)_?(validate|check)\w*$"),
+    "dtype_inference": re.compile(
+        r"(^|\.)_?(\w*infer\w*|find_common_type|\w*common_dtype|pandas_dtype"
+        r"|get_dtype|dtype_from\w*|cudf_dtype_from\w*|can_hold\w*)$"
+    ),
+    "result_wrapping": re.compile(
+        r"(^|\.)(_constructor\w*|__finalize__|_from_mgr|_from_data|_from_columns"
+        r"\w*|_wrap\w*|wrap_\w*)$"
+        r"|(^|\.)(DataFrame|Series|Index)\.(__init__|__new__)$"
+    ),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _dispatch_category(code):
+    """Get the key of DISPATCH_CATEGORIES matching a code object, if any."""
+    name = getattr(code, "co_qualname", code.co_name)
+    return next(
+        (
+            category
+            for category, pattern in DISPATCH_CATEGORIES.items()
+            if pattern.search(name)
+        ),
+        None,
+    )
+
+
+def measure_dispatch(function, args, kwargs):
+    """Measure the fraction of a call spent in each kind of per-call work.
+
+    The call is traced with `sys.setprofile`, and the time of the outermost
+    call of a function matching one of DISPATCH_CATEGORIES is attributed to
+    its category. Tracing slows down every Python call by a similar amount,
+    so fractions rather than times are recorded; they are converted to
+    estimated times using the median of the timed rounds. The function is
+    called once untraced first, since the instruments run before any warmup
+    and lazy imports or caches would otherwise be attributed to dispatch.
+
+    Returns
+    -------
+    dict
+        The fraction of the traced call spent in each category.
+    """
+    totals = dict.fromkeys(DISPATCH_CATEGORIES, 0.0)
+    active = None
+    start = 0.0
+
+    def tracer(frame, event, arg):
+        nonlocal active, start
+        if event == "call" and active is None:
+            if (category := _dispatch_category(frame.f_code)) is not None:
+                active = (frame, category)
+                start = time.perf_counter()
+        elif event == "return" and active is not None and frame is active[0]:
+            totals[active[1]] += time.perf_counter() - start
+            active = None
+
+    function(*args, **kwargs)
+    begin = time.perf_counter()
+    sys.setprofile(tracer)
+    try:
+        function(*args, **kwargs)
+    finally:
+        sys.setprofile(None)
+    elapsed = time.perf_counter() - begin
+    return {
+        "dispatch_fractions": {
+            category: total / elapsed for category, total in totals.items()
+        }
+    }
+
+
+def measure_memory(function, args, kwargs):
+    """Measure the memory used by a call to `function(*args, **kwargs)`.
+
+    Returns
+    -------
+    dict
+        The increase in peak RSS and the tracemalloc peak, in bytes. Under
+        cudf, the peak, total and number of device allocations are included.
+    """
+    info = {}
+    with PeakRSS() as rss, TracemallocPeak() as traced:
+        if backend.name == "cudf":
+            with RMMStatistics() as rmm_statistics:
+                function(*args, **kwargs)
+            stats = rmm_statistics.statistics
+            info["device_peak_bytes"] = stats.peak_bytes
+            info["device_total_bytes"] = stats.total_bytes
+            info["device_allocations"] = stats.total_count
+        else:
+            function(*args, **kwargs)
+    info["peak_rss_delta_bytes"] = rss.peak_delta
+    info["tracemalloc_peak_bytes"] = traced.peak
+    return info
+
+
+class InstrumentedBenchmark(BenchmarkFixture):
+    """A pytest-benchmark fixture that applies instruments to benchmarks.
+
+    pytest-benchmark requires the `benchmark` fixture to be a BenchmarkFixture,
+    so rather than wrapping the fixture created by pytest-benchmark, `wrap`
+    converts it into an instance of this subclass.
+    """
+
+    @classmethod
+    def wrap(cls, benchmark, instruments, precision=None, time_cap=None, cold=False):
+        """Convert `benchmark` into an InstrumentedBenchmark.
+
+        Parameters
+        ----------
+        benchmark : pytest_benchmark.fixture.BenchmarkFixture
+            The fixture to convert.
+        instruments : List[Callable]
+            Functions accepting the callable to benchmark and its args and
+            kwargs that return a dict of measurements to store in `extra_info`.
+        precision : Optional[float]
+            The target width of the confidence interval of the median relative
+            to the median. If None, the number of rounds is chosen by
+            pytest-benchmark.
+        time_cap : Optional[float]
+            The maximum time in seconds spent running adaptive rounds.
+        cold : bool
+            Whether to time the first call of the benchmark in a fresh process.
+        """
+        benchmark.__class__ = cls
+        benchmark._instruments = instruments
+        # BenchmarkFixture uses _precision for --benchmark-precision.
+        benchmark._ci_precision = precision
+        benchmark._ci_time_cap = time_cap
+        benchmark._cold = cold
+        return benchmark
+
+    def _measure_cold(self):
+        """Time the first call of this benchmark in a fresh process.
+
+        Returns
+        -------
+        Optional[float]
+            The time in seconds, or None if the benchmark failed in the child
+            process.
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "cold")
+            subprocess.run(
+                [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider"]
+                + ["--benchmark-disable", self.fullname],
+                env=dict(os.environ, **{COLD_OUTPUT: path}),
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            if not os.path.exists(path):
+                return None
+            with open(path) as f:
+                return float(f.read())
+
+    @staticmethod
+    def _first_call(function, args, kwargs):
+        """Time a single call in a child process started by `_measure_cold`."""
+        start = time.perf_counter()
+        result = function(*args, **kwargs)
+        synchronize()
+        elapsed = time.perf_counter() - start
+        with open(os.environ[COLD_OUTPUT], "w") as f:
+            f.write(repr(elapsed))
+        return result
+
+    def _annotate_cold(self, cold_seconds):
+        if cold_seconds is None:
+            return
+        self.extra_info["cold_seconds"] = cold_seconds
+        if self.stats is not None and self.stats.stats.data:
+            median = self.stats.stats.median
+            if median > 0:
+                self.extra_info["cold_to_warm"] = cold_seconds / median
+
+    def _instrument(self, function, args, kwargs):
+        if self.enabled:
+            for instrument in self._instruments:
+                self.extra_info.update(instrument(function, args, kwargs))
+
+    def _describe_input(self, args, kwargs):
+        """Describe the input of benchmarks not using the standard fixtures.
+
+        Benchmarks using `accepts_cudf_fixture` are described by their fixture.
+        Otherwise, the first argument of a recognized type is described, and
+        the number of rows is taken from a size parameter if present.
+        """
+        if "rows" in self.extra_info:
+            return
+        for arg in (*args, *kwargs.values()):
+            if (info := describe_input(arg)) is not None:
+                self.extra_info.update(info)
+                break
+        for param in ROW_PARAMETERS:
+            if param in (self.params or {}):
+                self.extra_info["rows"] = self.params[param]
+
+    def _raw(self, function_to_benchmark, *args, **kwargs):
+        if not self.enabled or self._ci_precision is None:
+            return super()._raw(function_to_benchmark, *args, **kwargs)
+
+        runner = self._make_runner(function_to_benchmark, args, kwargs)
+        with PauseInstrumentation():
+            _, iterations, loops_range = self._calibrate_timer(runner)
+        stats = self._make_stats(iterations)
+        samples = stats.stats.data
+        with PauseInstrumentation():
+            if self._warmup:
+                for _ in range(max(1, int(self._warmup / iterations))):
+                    runner(loops_range)
+
+            # Computing the interval sorts the samples, so it is only checked
+            # each time the number of rounds has grown by 10%.
+            start = time.perf_counter()
+            check = max(self._min_rounds, 2)
+            while True:
+                stats.update(runner(loops_range))
+                rounds = len(samples)
+                timed_out = time.perf_counter() - start >= self._ci_time_cap
+                if rounds >= check or timed_out:
+                    check = math.ceil(rounds * 1.1)
+                    lower, upper = median_confidence_interval(samples)
+                    width = (upper - lower) / median(samples)
+                    if width <= self._ci_precision or timed_out:
+                        break
+        self.extra_info["median_ci_relative_width"] = width
+        self.extra_info["precision_met"] = width <= self._ci_precision
+
+        if self.cprofile:
+            if self.cprofile_loops is None:
+                cprofile_loops = loops_range or range(1)
+            else:
+                cprofile_loops = range(self.cprofile_loops)
+            with PauseInstrumentation():
+                profile = cProfile.Profile()
+                for _ in cprofile_loops:
+                    result = profile.runcall(function_to_benchmark, *args, **kwargs)
+                self._save_cprofile(profile)
+            return result
+        return function_to_benchmark(*args, **kwargs)
+
+    def _annotate_throughput(self):
+        if self.stats is None or not self.stats.stats.data:
+            return
+        median = self.stats.stats.median
+        if median > 0:
+            if "rows" in self.extra_info:
+                self.extra_info["rows_per_second"] = self.extra_info["rows"] / median
+            if "bytes" in self.extra_info:
+                self.extra_info["gb_per_second"] = (
+                    self.extra_info["bytes"] / median / 1e9
+                )
+            if "io_bytes" in self.extra_info:
+                self.extra_info["io_mb_per_second"] = (
+                    self.extra_info["io_bytes"] / median / 1e6
+                )
+        if "dispatch_fractions" in self.extra_info:
+            self.extra_info["dispatch_seconds"] = {
+                category: fraction * median
+                for category, fraction in self.extra_info["dispatch_fractions"].items()
+            }
+
+    def __call__(self, function_to_benchmark, *args, **kwargs):
+        if COLD_OUTPUT in os.environ:
+            return self._first_call(function_to_benchmark, args, kwargs)
+        # The child process runs before this one has called the benchmark, so
+        # its first call is not affected by the state of this process.
+        cold_seconds = self._measure_cold() if self._cold and self.enabled else None
+        self._describe_input(args, kwargs)
+        self._instrument(function_to_benchmark, args, kwargs)
+        result = super().__call__(function_to_benchmark, *args, **kwargs)
+        self._annotate_throughput()
+        self._annotate_cold(cold_seconds)
+        return result
+
+    def pedantic(self, target, args=(), kwargs=None, setup=None, **options):
+        if COLD_OUTPUT in os.environ:
+            if setup is not None:
+                args, kwargs = setup() or (args, kwargs)
+            return self._first_call(target, args, kwargs or {})
+        cold_seconds = self._measure_cold() if self._cold and self.enabled else None
+        self._describe_input(args, kwargs or {})
+        # Arguments produced by setup may only be used once, so benchmarks
+        # using setup are not instrumented.
+        if setup is None:
+            self._instrument(target, args, kwargs or {})
+        result = super().pedantic(target, args, kwargs, setup, **options)
+        self._annotate_throughput()
+        self._annotate_cold(cold_seconds)
+        return result
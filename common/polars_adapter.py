@@ -0,0 +1,327 @@
+"""An adapter exposing the subset of the cudf API used by benchmarks on polars.
+
+polars has a different API from cudf and pandas, so this module wraps polars
+objects in classes that translate the calls made by benchmarks into the
+equivalent polars calls. Only the functionality needed by the benchmarks is
+provided; benchmarks of anything else must be marked `polars_incompatible`.
+polars has no index, so Index objects are represented as Series.
+"""
+
+import numpy
+import polars as pl
+
+# Reductions and scans whose polars names differ from the pandas names.
+_RENAMES = {
+    "cumsum": "cum_sum",
+    "cumprod": "cum_prod",
+    "cummax": "cum_max",
+}
+
+# Join types whose polars names differ from the pandas names.
+_JOIN_TYPES = {
+    "outer": "full",
+    "left_anti": "anti",
+}
+
+
+def _unwrap(obj):
+    return obj._obj if isinstance(obj, _PolarsObject) else obj
+
+
+def _wrap(obj):
+    if isinstance(obj, pl.DataFrame):
+        return DataFrame(obj)
+    if isinstance(obj, pl.Series):
+        return Series(obj)
+    return obj
+
+
+def _polars_dtype(dtype):
+    if dtype == "category":
+        return pl.Categorical
+    return pl.Series(values=numpy.empty(0, dtype=dtype)).dtype
+
+
+class _PolarsObject:
+    """The base class of all wrapped polars objects."""
+
+    def __init__(self, obj):
+        self._obj = obj
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self._obj!r})"
+
+    def __len__(self):
+        return len(self._obj)
+
+    @property
+    def values(self):
+        return self.to_numpy()
+
+    def to_numpy(self):
+        return self._obj.to_numpy()
+
+    def copy(self, deep=True):
+        return self.__class__(self._obj.clone())
+
+    def memory_usage(self, *args, **kwargs):
+        return self._obj.estimated_size()
+
+    def astype(self, dtype):
+        return self.__class__(self._obj.cast(_polars_dtype(dtype)))
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        inputs = [_unwrap(i) for i in inputs]
+        return _wrap(getattr(ufunc, method)(*inputs, **kwargs))
+
+    def _binop(self, op, other):
+        return _wrap(getattr(self._obj, op)(_unwrap(other)))
+
+    def __add__(self, other):
+        return self._binop("__add__", other)
+
+    def __mul__(self, other):
+        return self._binop("__mul__", other)
+
+    def __mod__(self, other):
+        return self._binop("__mod__", other)
+
+    def __eq__(self, other):
+        return self._binop("__eq__", other)
+
+
+class Series(_PolarsObject):
+    def __init__(self, data=None, dtype=None):
+        if isinstance(data, _PolarsObject):
+            data = data._obj
+        elif not isinstance(data, pl.Series):
+            data = pl.Series(values=data)
+        super().__init__(data if dtype is None else data.cast(dtype))
+
+    def mask(self, cond):
+        return Series(
+            pl.select(
+                pl.when(pl.Series(_unwrap(cond))).then(None).otherwise(self._obj)
+            ).to_series()
+        )
+
+    def take(self, indices):
+        return Series(self._obj.gather(_unwrap(indices)))
+
+    def argsort(self):
+        return Series(self._obj.arg_sort())
+
+    def where(self, cond, other):
+        return Series(
+            pl.select(
+                pl.when(_unwrap(cond)).then(self._obj).otherwise(other)
+            ).to_series()
+        )
+
+    def nunique(self):
+        return self._obj.drop_nulls().n_unique()
+
+    def sort_values(self):
+        return Series(self._obj.sort(nulls_last=True))
+
+    def nsmallest(self, n):
+        return Series(self._obj.drop_nulls().bottom_k(n))
+
+    def drop_duplicates(self):
+        return Series(self._obj.unique(maintain_order=True))
+
+    def replace(self, to_replace, value):
+        return Series(self._obj.replace(to_replace, value))
+
+    def __getattr__(self, name):
+        # Reductions and scans.
+        attr = getattr(self._obj, _RENAMES.get(name, name))
+        return lambda *args, **kwargs: _wrap(attr(*args, **kwargs))
+
+
+def Index(data=None, dtype=None):
+    return Series(data, dtype)
+
+
+def RangeIndex(start, stop=None, step=1):
+    if stop is None:
+        start, stop = 0, start
+    return Series(numpy.arange(start, stop, step))
+
+
+class DataFrame(_PolarsObject):
+    def __init__(self, data=None):
+        if isinstance(data, dict):
+            # polars requires string column names.
+            data = pl.DataFrame({str(k): _unwrap(v) for k, v in data.items()})
+        super().__init__(data)
+
+    @property
+    def columns(self):
+        return self._obj.columns
+
+    def __getitem__(self, key):
+        return _wrap(self._obj[key])
+
+    def _map(self, func):
+        return DataFrame(
+            self._obj.select(func(self._obj[c]).alias(c) for c in self._obj.columns)
+        )
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        # polars DataFrames do not support ufuncs, so apply them per column.
+        return DataFrame(
+            {
+                c: getattr(ufunc, method)(
+                    *(_unwrap(i)[c] if isinstance(i, DataFrame) else i for i in inputs),
+                    **kwargs,
+                )
+                for c in self.columns
+            }
+        )
+
+    def take(self, indices):
+        return DataFrame(self._obj[_unwrap(indices).to_list()])
+
+    def where(self, cond, other):
+        cond = _unwrap(cond)
+        return self._map(lambda s: pl.when(cond[s.name]).then(s).otherwise(other))
+
+    def nunique(self):
+        return {c: self._obj[c].drop_nulls().n_unique() for c in self.columns}
+
+    def astype(self, dtype):
+        return DataFrame(self._obj.cast(_polars_dtype(dtype)))
+
+    def sort_values(self, by):
+        return DataFrame(self._obj.sort(by, nulls_last=True))
+
+    def nsmallest(self, n, columns):
+        return DataFrame(self._obj.bottom_k(n, by=columns))
+
+    def drop_duplicates(self):
+        return DataFrame(self._obj.unique(maintain_order=True))
+
+    def replace(self, to_replace, value):
+        return self._map(lambda s: s.replace(to_replace, value))
+
+    def merge(self, right, on, how="inner"):
+        how = _JOIN_TYPES.get(how, how)
+        return DataFrame(self._obj.join(_unwrap(right), on=on, how=how, coalesce=True))
+
+    def groupby(self, by, as_index=True, sort=True, dropna=True, observed=True):
+        # polars only forms groups of observed categories.
+        return _GroupBy(self._obj, by, sort, dropna)
+
+    def cumsum(self):
+        return DataFrame(self._obj.select(pl.all().cum_sum()))
+
+    def cumprod(self):
+        return DataFrame(self._obj.select(pl.all().cum_prod()))
+
+    def cummax(self):
+        return DataFrame(self._obj.select(pl.all().cum_max()))
+
+    def min(self):
+        return DataFrame(self._obj.min())
+
+    def sum(self):
+        return DataFrame(self._obj.sum())
+
+    def product(self):
+        return DataFrame(self._obj.select(pl.all().product()))
+
+    def mean(self):
+        return DataFrame(self._obj.mean())
+
+
+class _GroupBy:
+    def __init__(self, df, by, sort, dropna=True):
+        self._by = [by] if isinstance(by, str) else by
+        self._df = df
+        self._columns = [c for c in df.columns if c not in self._by]
+        self._sort = sort
+        self._dropna = dropna
+
+    def _frame(self):
+        # polars always groups null keys, so they are dropped by each operation
+        # (rather than once here) so that, as in pandas, the cost is timed.
+        return self._df.drop_nulls(self._by) if self._dropna else self._df
+
+    def agg(self, func):
+        if isinstance(func, str):
+            func = {c: [func] for c in self._columns}
+        elif isinstance(func, list):
+            func = {c: func for c in self._columns}
+        func = {c: [f] if isinstance(f, str) else f for c, f in func.items()}
+        # Groups are sorted below if requested, so their order is not maintained.
+        result = (
+            self._frame()
+            .group_by(self._by, maintain_order=False)
+            .agg(
+                getattr(pl.col(c), _RENAMES.get(f, f))().alias(f"{c}_{f}")
+                for c, fs in func.items()
+                if c not in self._by
+                for f in fs
+            )
+        )
+        return DataFrame(result.sort(self._by) if self._sort else result)
+
+    def _over(self, func):
+        # Apply func to each value column within each group, preserving the
+        # order of rows like pandas transforms.
+        return DataFrame(
+            self._frame().select(
+                func(pl.col(c)).over(self._by).alias(c) for c in self._columns
+            )
+        )
+
+    def _position(self):
+        return pl.int_range(pl.len()).over(self._by)
+
+    def transform(self, func):
+        return self._over(lambda col: getattr(col, _RENAMES.get(func, func))())
+
+    def cumsum(self):
+        return self._over(lambda col: col.cum_sum())
+
+    def cummax(self):
+        return self._over(lambda col: col.cum_max())
+
+    def cumcount(self):
+        return Series(self._frame().select(self._position()).to_series())
+
+    def head(self, n=5):
+        return DataFrame(self._frame().filter(self._position() < n))
+
+    def nth(self, n):
+        return DataFrame(self._frame().filter(self._position() == n))
+
+    def rolling(self, window):
+        return _Rolling(self, window)
+
+
+class _Rolling:
+    def __init__(self, groupby, window):
+        self._groupby = groupby
+        self._window = window
+
+    def mean(self):
+        return self._groupby._over(lambda col: col.rolling_mean(self._window))
+
+    def sum(self):
+        return self._groupby._over(lambda col: col.rolling_sum(self._window))
+
+
+def concat(objs):
+    objs = [_unwrap(o) for o in objs]
+    return _wrap(pl.concat(objs))
+
+
+__all__ = [
+    "DataFrame",
+    "Index",
+    "RangeIndex",
+    "Series",
+    "concat",
+]
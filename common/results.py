@@ -0,0 +1,273 @@
+"""Utilities for loading and analyzing benchmark results.
+
+This module deliberately avoids importing cudf or any other DataFrame library
+(including via config.py) so that results can be analyzed on any machine.
+"""
+
+import json
+import math
+import re
+from statistics import NormalDist
+
+# The names of base fixtures generated in conftest.py, see the documentation
+# there for the naming convention. Fixtures with a non-default distribution
+# (see utils.Distribution) have additional components following the dtype.
+FIXTURE_PATTERN = re.compile(
+    r"(?P<cls>[a-z_]+?)_dtype_(?P<dtype>[a-z0-9]+)"
+    r"(?:_(?P<distribution>(?:(?:card|zipf|order|nullpct|nullpat)_[a-z0-9]+_?)+?))?"
+    r"_nulls_(?P<nulls>true|false)(?:_cols_(?P<cols>\d+))?_rows_(?P<rows>\d+)"
+)
+
+# Parameters that benchmarks not using the standard fixtures use for sizes.
+ROW_PARAMETERS = ("N", "size", "nr")
+
+
+def load_benchmarks(path):
+    """Load the list of benchmarks from a pytest-benchmark JSON file."""
+    with open(path) as f:
+        return json.load(f)["benchmarks"]
+
+
+def parse_benchmark(benchmark):
+    """Get the function and fixture properties of a benchmark.
+
+    The properties of the fixture are parsed from the benchmark id using the
+    fixture naming convention. For benchmarks that do not use the standard
+    fixtures, the number of rows is taken from a size parameter if present.
+
+    Parameters
+    ----------
+    benchmark : dict
+        A benchmark from a pytest-benchmark JSON file.
+
+    Returns
+    -------
+    dict
+        The function (including its module) and the class, dtype,
+        distribution, nulls, cols, and rows of the fixture. Properties that
+        are not known are None.
+    """
+    function, _, _ = benchmark["fullname"].partition("[")
+    properties = dict.fromkeys(
+        ("cls", "dtype", "distribution", "nulls", "cols", "rows")
+    )
+    properties["function"] = function
+
+    # Union ids contain the names of every fixture in the union hierarchy, the
+    # last of which is the base fixture actually used.
+    matches = list(FIXTURE_PATTERN.finditer(benchmark["name"]))
+    if matches:
+        properties.update(matches[-1].groupdict())
+    else:
+        params = benchmark.get("params") or {}
+        for param in ROW_PARAMETERS:
+            if param in params:
+                properties["rows"] = str(params[param])
+    return properties
+
+
+def geometric_mean(values):
+    values = list(values)
+    return math.exp(sum(math.log(v) for v in values) / len(values))
+
+
+def median(values):
+    values = sorted(values)
+    mid = len(values) // 2
+    return values[mid] if len(values) % 2 else (values[mid - 1] + values[mid]) / 2
+
+
+def median_confidence_interval(values, confidence=0.95):
+    """Compute a distribution-free confidence interval of the median.
+
+    The bounds are order statistics whose ranks are chosen with the normal
+    approximation to the binomial distribution of the number of values below
+    the median, so like `mann_whitney_u`, no assumption is made about the
+    distribution of times.
+
+    Returns
+    -------
+    Tuple[float, float]
+        The lower and upper bounds. With few values, these are the minimum and
+        maximum.
+    """
+    values = sorted(values)
+    n = len(values)
+    half_width = NormalDist().inv_cdf(0.5 + confidence / 2) * math.sqrt(n) / 2
+    lower = max(math.floor(n / 2 - half_width) - 1, 0)
+    upper = min(math.ceil(n / 2 + half_width), n - 1)
+    return values[lower], values[upper]
+
+
+def rank(values):
+    """Rank values from 1, assigning tied values the average of their ranks."""
+    order = sorted(range(len(values)), key=values.__getitem__)
+    ranks = [0.0] * len(values)
+    i = 0
+    while i < len(order):
+        j = i
+        while j + 1 < len(order) and values[order[j + 1]] == values[order[i]]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[order[k]] = (i + j) / 2 + 1
+        i = j + 1
+    return ranks
+
+
+def mann_whitney_u(x, y):
+    """Perform a two-sided Mann-Whitney U test of samples x and y.
+
+    The test is nonparametric, so unlike a t-test it makes no assumption about
+    the (typically skewed and multimodal) distribution of benchmark times. The
+    p-value uses the normal approximation with tie and continuity corrections.
+
+    Returns
+    -------
+    Tuple[float, float]
+        The U statistic of x and the p-value.
+    """
+    n1, n2 = len(x), len(y)
+    n = n1 + n2
+    combined = list(x) + list(y)
+    ranks = rank(combined)
+    u = sum(ranks[:n1]) - n1 * (n1 + 1) / 2
+
+    counts = {}
+    for v in combined:
+        counts[v] = counts.get(v, 0) + 1
+    ties = sum(t**3 - t for t in counts.values())
+    variance = n1 * n2 / 12 * ((n + 1) - ties / (n * (n - 1)))
+    if variance == 0:
+        return u, 1.0
+    mean = n1 * n2 / 2
+    z = max(abs(u - mean) - 0.5, 0) / math.sqrt(variance)
+    return u, math.erfc(z / math.sqrt(2))
+
+
+def cliffs_delta(x, y):
+    """Compute Cliff's delta, P(x > y) - P(x < y), of samples x and y."""
+    u, _ = mann_whitney_u(x, y)
+    return 2 * u / (len(x) * len(y)) - 1
+
+
+def benjamini_hochberg(pvalues):
+    """Adjust p-values to control the false discovery rate across many tests.
+
+    Testing every benchmark in the suite at a fixed significance level would
+    flag many benchmarks by chance alone, so p-values must be adjusted for the
+    number of tests performed.
+    """
+    m = len(pvalues)
+    order = sorted(range(m), key=pvalues.__getitem__, reverse=True)
+    adjusted = [0.0] * m
+    running_min = 1.0
+    for i, idx in enumerate(order):
+        running_min = min(running_min, pvalues[idx] * m / (m - i))
+        adjusted[idx] = running_min
+    return adjusted
+
+
+def fit_overhead_model(sizes, times, basis):
+    """Fit times to the model `t = a + b * basis(n)` with a, b >= 0.
+
+    The model is fitted by least squares on relative errors, since times span
+    several orders of magnitude and absolute errors would be dominated by the
+    largest sizes.
+
+    Returns
+    -------
+    Tuple[float, float, float]
+        The fixed overhead a, the coefficient b, and the root mean square
+        relative error of the fit.
+    """
+    # Normalize the basis so that the normal equations are well conditioned.
+    scale = max(basis(n) for n in sizes)
+    xs = [basis(n) / scale for n in sizes]
+    ws = [1 / t**2 for t in times]
+    sw = sum(ws)
+    swx = sum(w * x for w, x in zip(ws, xs))
+    swxx = sum(w * x * x for w, x in zip(ws, xs))
+    swt = sum(w * t for w, t in zip(ws, times))
+    swxt = sum(w * x * t for w, x, t in zip(ws, xs, times))
+    det = sw * swxx - swx * swx
+    if det:
+        a = (swxx * swt - swx * swxt) / det
+        b = (sw * swxt - swx * swt) / det
+    if not det or a < 0 or b < 0:
+        # The unconstrained fit is not physical, so fall back to the better of
+        # the purely constant and purely variable models.
+        a, b = min(
+            [(swt / sw, 0.0), (0.0, swxt / swxx)],
+            key=lambda ab: _relative_error(times, [ab[0] + ab[1] * x for x in xs]),
+        )
+    return a, b / scale, _relative_error(times, [a + b * x for x in xs])
+
+
+def _relative_error(times, predictions):
+    return math.sqrt(
+        sum(((p - t) / t) ** 2 for t, p in zip(times, predictions)) / len(times)
+    )
+
+
+# Models of the variable cost of an operation on n rows.
+SCALING_MODELS = {
+    "constant": lambda n: 1,
+    "linear": lambda n: n,
+    "nlogn": lambda n: n * math.log(n),
+    "quadratic": lambda n: n * n,
+}
+
+
+def fit_scaling(sizes, times):
+    """Determine how the time of a benchmark scales with its number of rows.
+
+    Each model in `SCALING_MODELS` is fitted with a fixed overhead term, as is
+    the power law `t = a + b * n**k`. The power law is fitted by searching for
+    the exponent k, so that unlike a fit of log(t) against log(n), the
+    exponent is not biased towards 0 by the overhead that dominates at small
+    sizes.
+
+    Parameters
+    ----------
+    sizes : List[int]
+        The numbers of rows.
+    times : List[float]
+        The (median) time for each number of rows.
+
+    Returns
+    -------
+    dict
+        The error of each model, the best model, the fitted exponent, and the
+        crossover size at which the variable cost equals the fixed overhead
+        (None if there is no overhead or variable cost).
+    """
+    result = {
+        "errors": {
+            name: fit_overhead_model(sizes, times, basis)[2]
+            for name, basis in SCALING_MODELS.items()
+        }
+    }
+    result["model"] = min(result["errors"], key=result["errors"].get)
+    a, b, _, k = min(
+        (
+            (*fit_overhead_model(sizes, times, lambda n: n ** (k / 100)), k / 100)
+            for k in range(301)
+        ),
+        key=lambda fit: fit[2],
+    )
+    result["exponent"] = k
+    result["crossover"] = (a / b) ** (1 / k) if a > 0 and b > 0 and k > 0 else None
+    return result
+
+
+def format_table(headers, rows):
+    """Format rows of values as a plain text table."""
+    rows = [[str(v) for v in row] for row in rows]
+    widths = [max(len(r[i]) for r in [headers, *rows]) for i in range(len(headers))]
+
+    def format_row(row):
+        return "  ".join(v.ljust(w) for v, w in zip(row, widths)).rstrip()
+
+    lines = [format_row(headers), format_row(["-" * w for w in widths])]
+    lines.extend(format_row(row) for row in rows)
+    return "\n".join(lines)
@@ -0,0 +1,136 @@
+"""Datasets and chunked pipelines for streaming benchmarks.
+
+Production jobs often process tables that do not fit in memory by streaming
+them through chunked readers. The streaming benchmarks reproduce this with a
+Parquet dataset on local disk whose in-memory size is STREAM_DATASET_FACTOR
+times the configured memory cap (STREAM_MEMORY_CAP), processed one chunk at a
+time by pipelines whose memory usage is bounded by the chunk size rather than
+by the size of the dataset. Chunk sizes are taken from STREAM_CHUNK_ROWS,
+dropping those whose chunks would not fit under the memory cap.
+
+Chunks are read with pyarrow's `ParquetFile.iter_batches` for every backend
+and converted to the backend's DataFrame, so that the cost of converting
+each chunk (including the copy to the device under cudf) is part of the
+per-chunk overhead being measured.
+"""
+
+import math
+import os
+
+import numpy
+from config import STREAM_CHUNK_ROWS, backend, cudf
+
+# The in-memory size of the dataset relative to the memory cap.
+STREAM_DATASET_FACTOR = 2
+
+# The number of distinct keys of the dataset.
+STREAM_CARDINALITY = 10_000
+
+# The columns of the dataset and their dtypes.
+STREAM_COLUMNS = {"key": "int64", "a": "float64", "b": "float64", "c": "int64"}
+
+ROW_BYTES = sum(numpy.dtype(dtype).itemsize for dtype in STREAM_COLUMNS.values())
+
+# The number of copies of a chunk in memory at once: the Arrow batch, the
+# converted DataFrame, the filtered DataFrame and the partial aggregate.
+STREAM_CHUNK_COPIES = 4
+
+
+def dataset_rows(memory_cap):
+    """Get the number of rows of the dataset for a memory cap in bytes."""
+    return math.ceil(STREAM_DATASET_FACTOR * memory_cap / ROW_BYTES)
+
+
+def chunk_sizes(memory_cap):
+    """Get the chunk sizes of STREAM_CHUNK_ROWS that fit under a memory cap."""
+    max_rows = memory_cap // (STREAM_CHUNK_COPIES * ROW_BYTES)
+    return [chunk_rows for chunk_rows in STREAM_CHUNK_ROWS if chunk_rows <= max_rows]
+
+
+def write_dataset(path, num_rows, row_group_size):
+    """Write the dataset to a Parquet file at `path` unless it already exists.
+
+    The dataset is generated and written one row group at a time, so that
+    generating it does not require more memory than a row group. Row groups
+    should be as large as the largest chunk size so that every chunk is read
+    from a single row group. The file is written under a temporary name and
+    renamed, so a partially written file is never reused.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if os.path.exists(path):
+        return path
+    schema = pa.schema(list(STREAM_COLUMNS.items()))
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with pq.ParquetWriter(tmp_path, schema) as writer:
+        for i, start in enumerate(range(0, num_rows, row_group_size)):
+            nr = min(row_group_size, num_rows - start)
+            rs = numpy.random.RandomState(i)
+            columns = {
+                "key": rs.randint(0, STREAM_CARDINALITY, nr),
+                "a": rs.random_sample(nr),
+                "b": rs.standard_normal(nr),
+                "c": rs.randint(0, 1_000_000, nr),
+            }
+            writer.write_table(pa.table(columns, schema=schema))
+    os.replace(tmp_path, path)
+    return path
+
+
+def frame_from_arrow(table):
+    """Convert a pyarrow Table into a DataFrame of the backend."""
+    if backend.name == "cudf":
+        return cudf.DataFrame.from_arrow(table)
+    types_mapper = cudf.ArrowDtype if backend.name == "pandas-pyarrow" else None
+    return table.to_pandas(types_mapper=types_mapper)
+
+
+def iter_chunks(path, chunk_rows):
+    """Iterate over a Parquet file in DataFrames of at most `chunk_rows` rows."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_rows):
+        yield frame_from_arrow(pa.Table.from_batches([batch]))
+
+
+# The aggregations combining the partial aggregates of chunks.
+COMBINE_AGGREGATIONS = {"b_sum": "sum", "b_count": "sum", "c_max": "max"}
+
+
+def combine_partials(partials):
+    return cudf.concat(partials).groupby(level=0).agg(COMBINE_AGGREGATIONS)
+
+
+def aggregate_chunks(path, chunk_rows):
+    """Compute grouped statistics of a filtered dataset one chunk at a time.
+
+    Each chunk is filtered and partially aggregated by key. The partial
+    aggregates are combined whenever they exceed a few times the number of
+    keys, so the memory used does not grow with the number of chunks.
+
+    Returns
+    -------
+    DataFrame
+        The mean of `b` and the maximum of `c` for each key.
+    """
+    partials = []
+    pending_rows = 0
+    for chunk in iter_chunks(path, chunk_rows):
+        chunk = chunk[chunk["a"] < 0.5]
+        partial = chunk.groupby("key").agg(
+            b_sum=("b", "sum"), b_count=("b", "count"), c_max=("c", "max")
+        )
+        partials.append(partial)
+        pending_rows += len(partial)
+        if pending_rows > 4 * STREAM_CARDINALITY:
+            partials = [combine_partials(partials)]
+            pending_rows = len(partials[0])
+    combined = combine_partials(partials)
+    return cudf.DataFrame(
+        {
+            "b_mean": combined["b_sum"] / combined["b_count"],
+            "c_max": combined["c_max"],
+        }
+    )
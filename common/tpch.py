@@ -0,0 +1,268 @@
+"""Generated tables and stage timing for workload benchmarks.
+
+Workload benchmarks run multi-step queries on a small star schema, which is a
+simplified version of the TPC-H schema: a `lineitem` fact table referencing
+the `orders` and `part` tables, where orders reference `customer`, customers
+reference `nation`, and nations reference `region`. The sizes of the tables
+other than nation and region are proportional to the scale factor as in TPC-H,
+e.g. there are 6 million lineitems at scale factor 1. The data is generated
+deterministically from fixed seeds on the host and then converted to the
+backend, so the tables (and therefore the results of queries) are identical
+across sessions and backends.
+"""
+
+import contextlib
+import time
+
+import numpy
+from config import backend, cudf
+from results import median
+from utils import cached_input, describe_input, synchronize
+
+REGIONS = ["AFRICA", "AMERICA", "ASIA", "EUROPE", "MIDDLE EAST"]
+
+# The nations and the index of their region in REGIONS.
+NATIONS = [
+    ("ALGERIA", 0),
+    ("ARGENTINA", 1),
+    ("BRAZIL", 1),
+    ("CANADA", 1),
+    ("EGYPT", 4),
+    ("ETHIOPIA", 0),
+    ("FRANCE", 3),
+    ("GERMANY", 3),
+    ("INDIA", 2),
+    ("INDONESIA", 2),
+    ("IRAN", 4),
+    ("IRAQ", 4),
+    ("JAPAN", 2),
+    ("JORDAN", 4),
+    ("KENYA", 0),
+    ("MOROCCO", 0),
+    ("MOZAMBIQUE", 0),
+    ("PERU", 1),
+    ("CHINA", 2),
+    ("ROMANIA", 3),
+    ("SAUDI ARABIA", 4),
+    ("VIETNAM", 2),
+    ("RUSSIA", 3),
+    ("UNITED KINGDOM", 3),
+    ("UNITED STATES", 1),
+]
+
+SEGMENTS = ["AUTOMOBILE", "BUILDING", "FURNITURE", "HOUSEHOLD", "MACHINERY"]
+PRIORITIES = ["1-URGENT", "2-HIGH", "3-MEDIUM", "4-NOT SPECIFIED", "5-LOW"]
+SHIP_MODES = ["AIR", "FOB", "MAIL", "RAIL", "REG AIR", "SHIP", "TRUCK"]
+BRANDS = [f"Brand#{i}{j}" for i in range(1, 6) for j in range(1, 6)]
+CONTAINERS = [
+    f"{size} {kind}"
+    for size in ["SM", "MED", "LG", "JUMBO", "WRAP"]
+    for kind in ["CASE", "BOX", "BAG", "JAR", "PKG", "PACK", "CAN", "DRUM"]
+]
+
+# Orders are placed on the days of 1992 to 1998, and items are shipped within
+# 121 days of their order.
+START_DATE = numpy.datetime64("1992-01-01", "ns")
+NUM_ORDER_DAYS = 2_406
+# Items shipped after this date have status "O" (open), otherwise "F".
+CURRENT_DATE = numpy.datetime64("1995-06-17", "ns")
+
+# The number of rows of each table at scale factor 1.
+BASE_ROWS = {
+    "part": 200_000,
+    "customer": 150_000,
+    "orders": 1_500_000,
+    "lineitem": 6_000_000,
+}
+
+
+def num_rows(table, scale_factor):
+    return max(round(BASE_ROWS[table] * scale_factor), 1)
+
+
+def _choice(rs, values, nr):
+    """Sample `nr` strings from `values`."""
+    return numpy.array(values, dtype=object)[rs.randint(0, len(values), nr)]
+
+
+def _dates(days):
+    """Convert days since START_DATE to datetimes."""
+    ns = days.astype("int64") * 86_400 * 10**9 + START_DATE.astype("int64")
+    return cudf.Series(ns).astype("datetime64[ns]")
+
+
+def _prices(rs, nr, low, high):
+    """Sample `nr` prices in [low, high) rounded to cents."""
+    return (rs.randint(low * 100, high * 100, nr) / 100).astype("float64")
+
+
+def _order_days(scale_factor):
+    rs = numpy.random.RandomState(3)
+    return rs.randint(0, NUM_ORDER_DAYS, num_rows("orders", scale_factor))
+
+
+def _region(scale_factor):
+    return {
+        "r_regionkey": numpy.arange(len(REGIONS)),
+        "r_name": numpy.array(REGIONS, dtype=object),
+    }
+
+
+def _nation(scale_factor):
+    return {
+        "n_nationkey": numpy.arange(len(NATIONS)),
+        "n_name": numpy.array([name for name, _ in NATIONS], dtype=object),
+        "n_regionkey": numpy.array([region for _, region in NATIONS]),
+    }
+
+
+def _part(scale_factor):
+    nr = num_rows("part", scale_factor)
+    rs = numpy.random.RandomState(1)
+    return {
+        "p_partkey": numpy.arange(nr),
+        "p_brand": _choice(rs, BRANDS, nr),
+        "p_container": _choice(rs, CONTAINERS, nr),
+        "p_size": rs.randint(1, 51, nr),
+        "p_retailprice": _prices(rs, nr, 900, 2_000),
+    }
+
+
+def _customer(scale_factor):
+    nr = num_rows("customer", scale_factor)
+    rs = numpy.random.RandomState(2)
+    return {
+        "c_custkey": numpy.arange(nr),
+        "c_nationkey": rs.randint(0, len(NATIONS), nr),
+        "c_mktsegment": _choice(rs, SEGMENTS, nr),
+        "c_acctbal": _prices(rs, nr, -1_000, 10_000),
+    }
+
+
+def _orders(scale_factor):
+    nr = num_rows("orders", scale_factor)
+    days = _order_days(scale_factor)
+    rs = numpy.random.RandomState(4)
+    return {
+        "o_orderkey": numpy.arange(nr),
+        "o_custkey": rs.randint(0, num_rows("customer", scale_factor), nr),
+        "o_orderdate": _dates(days),
+        "o_orderpriority": _choice(rs, PRIORITIES, nr),
+        "o_shippriority": numpy.zeros(nr, dtype="int64"),
+        "o_totalprice": _prices(rs, nr, 1_000, 500_000),
+    }
+
+
+def _lineitem(scale_factor):
+    nr = num_rows("lineitem", scale_factor)
+    rs = numpy.random.RandomState(5)
+    orderkey = rs.randint(0, num_rows("orders", scale_factor), nr)
+    shipdays = _order_days(scale_factor)[orderkey] + rs.randint(1, 122, nr)
+    shipped = shipdays <= (CURRENT_DATE - START_DATE).astype("int64") // (
+        86_400 * 10**9
+    )
+    quantity = rs.randint(1, 51, nr).astype("float64")
+    return {
+        "l_orderkey": orderkey,
+        "l_partkey": rs.randint(0, num_rows("part", scale_factor), nr),
+        "l_quantity": quantity,
+        "l_extendedprice": quantity * _prices(rs, nr, 900, 2_000),
+        "l_discount": rs.randint(0, 11, nr) / 100,
+        "l_tax": rs.randint(0, 9, nr) / 100,
+        # Shipped items are returned ("R") or accepted ("A") at random.
+        "l_returnflag": numpy.where(
+            shipped, _choice(rs, ["A", "R"], nr), numpy.array("N", dtype=object)
+        ),
+        "l_linestatus": numpy.where(shipped, "F", "O").astype(object),
+        "l_shipdate": _dates(shipdays),
+        "l_shipmode": _choice(rs, SHIP_MODES, nr),
+    }
+
+
+TABLES = {
+    "region": _region,
+    "nation": _nation,
+    "part": _part,
+    "customer": _customer,
+    "orders": _orders,
+    "lineitem": _lineitem,
+}
+
+
+def star_schema(scale_factor):
+    """Get the tables of the star schema at `scale_factor`.
+
+    Tables are cached like the standard fixtures (see `cached_input`), so
+    queries must not modify them.
+
+    Returns
+    -------
+    Dict[str, DataFrame]
+        The tables keyed by name.
+    """
+    return {
+        name: cached_input(
+            f"workload_{name}_sf_{scale_factor}",
+            lambda: backend.convert(cudf.DataFrame(make(scale_factor))),
+        )
+        for name, make in TABLES.items()
+    }
+
+
+class StageTimer:
+    """Record the time of each named stage of a query.
+
+    Calling the timer with a name returns a context manager timing the
+    enclosed statements. Stages with the same name are accumulated.
+    """
+
+    def __init__(self):
+        self.times = {}
+
+    @contextlib.contextmanager
+    def __call__(self, name):
+        synchronize()
+        start = time.perf_counter()
+        yield
+        synchronize()
+        self.times[name] = self.times.get(name, 0) + time.perf_counter() - start
+
+
+def untimed(name):
+    """A stage that is not timed, used for the timed rounds of a benchmark."""
+    return contextlib.nullcontext()
+
+
+def run_query(benchmark, query, tables, stage_rounds=3):
+    """Benchmark a query end to end and record the time of each stage.
+
+    Timing the stages requires synchronization between them, so the stages are
+    timed in `stage_rounds` additional runs of the query that precede the
+    timed rounds, and the median time of each stage is recorded as
+    `stage_seconds` in the `extra_info` of the benchmark.
+
+    Parameters
+    ----------
+    benchmark : pytest_benchmark.fixture.BenchmarkFixture
+        The benchmark fixture.
+    query : Callable[[Dict[str, DataFrame], Callable], Any]
+        A function accepting the tables and a function that is called with the
+        name of each stage to obtain a context manager enclosing the stage.
+    tables : Dict[str, DataFrame]
+        The tables, see `star_schema`.
+    stage_rounds : int
+        The number of runs used to time the stages.
+    """
+    inputs = [describe_input(table) for table in tables.values()]
+    benchmark.extra_info.update(
+        rows=sum(i["rows"] for i in inputs), bytes=sum(i["bytes"] for i in inputs)
+    )
+    if benchmark.enabled:
+        timers = [StageTimer() for _ in range(stage_rounds)]
+        for timer in timers:
+            query(tables, timer)
+        benchmark.extra_info["stage_seconds"] = {
+            stage: median([timer.times[stage] for timer in timers])
+            for stage in timers[0].times
+        }
+    return benchmark(query, tables, untimed)
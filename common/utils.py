@@ -1,14 +1,32 @@
 """Common utilities for fixture creation and benchmarking."""
 
 import inspect
+import os
 import re
+import string
+import tempfile
 import textwrap
-from collections.abc import MutableSet
-from itertools import groupby
+from collections import OrderedDict, defaultdict
+from collections.abc import Mapping, MutableSet
+from itertools import product
 from numbers import Real
 
+import numpy
+import pytest
 import pytest_cases
-from config import NUM_COLS, NUM_ROWS, cudf, cupy
+from config import (
+    DATA_DIR,
+    FIXTURE_CACHE_BYTES,
+    NUM_COLS,
+    NUM_ROWS,
+    backend,
+    cudf,
+    cupy,
+)
+
+# The filename of the benchmark wrappers generated by `accepts_cudf_fixture`,
+# which identifies their frames, e.g. so that profilers can omit them.
+WRAPPER_FILENAME = "<accepts_cudf_fixture>"
 
 
 def make_gather_map(len_gather_map: Real, len_column: Real, how: str):
@@ -49,7 +67,18 @@ def flatten(xs):
 
 
 def accepts_cudf_fixture(
-    cls, *, dtype="int", nulls=None, cols=None, rows=None, name=None
+    cls,
+    *,
+    dtype="int",
+    nulls=None,
+    cols=None,
+    rows=None,
+    name=None,
+    cardinality=None,
+    skew=None,
+    order=None,
+    null_fraction=None,
+    null_pattern=None,
 ):
     """Pass "standard" cudf fixtures to functions without renaming parameters.
 
@@ -69,7 +98,9 @@ def accepts_cudf_fixture(
         itself, or using the name (as a string). If a string, the case is
         irrelevant as the string will be converted to all lowercase.
     dtype : Union[str, Iterable[str]], default 'int'
-        The dtype or set of dtypes to use.
+        The dtype or set of dtypes to use, which must be keys of
+        `column_generators`. Benchmarks of dtypes that the backend does not
+        support are deselected.
     nulls : Optional[bool], default None
         Whether to test nullable or non-nullable data. If None, both nullable
         and non-nullable data are included.
@@ -86,6 +117,19 @@ def accepts_cudf_fixture(
         `cls.__name__.lower()`. Use of this name allows the decorated function
         to masquerade as a pytest receiving a fixture while substituting the
         real fixture (with a much longer name).
+    cardinality : Optional[Union[int, List[int]]], default None
+        The number of distinct values, see `Distribution`. Like the following
+        parameters, if a list is given the benchmark is run for each value,
+        and if None the standard fixtures are used.
+    skew : Optional[Union[float, List[float]]], default None
+        The exponent of a Zipf distribution of values, see `Distribution`.
+    order : Optional[Union[str, List[str]]], default None
+        The order of values, see `Distribution`.
+    null_fraction : Optional[Union[float, List[float]]], default None
+        The fraction of null rows, see `Distribution`. Whether the data is
+        nullable is implied, so nulls must be None.
+    null_pattern : Optional[Union[str, List[str]]], default None
+        The positions of null rows, see `Distribution`.
 
     Raises
     ------
@@ -99,6 +143,10 @@ def accepts_cudf_fixture(
     @accepts_cudf_fixture("dataframe", dtype="int", nulls=False, name="df")
     def bench_columns(benchmark, df):
         benchmark(df.columns)
+
+    @accepts_cudf_fixture("series", cardinality=[10, 10_000], skew=[0, 1.5])
+    def bench_drop_duplicates(benchmark, series):
+        benchmark(series.drop_duplicates)
     """
     if inspect.isclass(cls):
         cls = cls.__name__
@@ -147,6 +195,38 @@ def accepts_cudf_fixture(
 
     fixture_name = f"{cls}{dtype_str}{null_str}{col_str}{row_str}"
 
+    knobs = {
+        "cardinality": cardinality,
+        "skew": skew,
+        "order": order,
+        "null_fraction": null_fraction,
+        "null_pattern": null_pattern,
+    }
+    if any(value is not None for value in knobs.values()):
+        assert (
+            nulls is None or null_fraction is None
+        ), "nulls may not be specified with null_fraction"
+        knobs = {k: v if isinstance(v, list) else [v] for k, v in knobs.items()}
+        variants = {}
+        for dt in dtype:
+            for values in product(*knobs.values()):
+                distribution = Distribution(**dict(zip(knobs, values)))
+                add_distribution(dt, distribution)
+                variant_null_str = null_str
+                if null_fraction is not None:
+                    variant_null_str = f"_nulls_{str(distribution.nulls[0]).lower()}"
+                variants[f"{dt}{distribution.name}"] = (
+                    f"{cls}_dtype_{dt}{distribution.name}"
+                    f"{variant_null_str}{col_str}{row_str}"
+                )
+        if len(variants) == 1:
+            (fixture_name,) = variants.values()
+        else:
+            fixture_name = f"{cls}_dtype_{'_or_'.join(variants)}{col_str}{row_str}"
+            fixture_unions.add_union(
+                fixture_name, variants.values(), ids=list(variants)
+            )
+
     def deco(bm):
         # pytests's test collection process relies on parsing the globals dict
         # to find test functions and identify their parameters for the purpose
@@ -171,18 +251,32 @@ def accepts_cudf_fixture(
         params_str += f"{fixture_name}"
         arg_str += f"{name}={fixture_name}"
 
+        # Record the size of the fixture so that throughput can be computed.
+        annotate_str = "pass"
+        if "benchmark" in parameters:
+            annotate_str = (
+                f"benchmark.extra_info.update(describe_input({fixture_name}))"
+            )
+
         src = textwrap.dedent(
             f"""
             def wrapped_bm({params_str}):
+                {annotate_str}
                 return bm({arg_str})
             """
         )
-        globals_ = {"bm": bm}
-        exec(src, globals_)
+        globals_ = {"bm": bm, "describe_input": describe_input}
+        exec(compile(src, WRAPPER_FILENAME, "exec"), globals_)
+        # Only the fixture unions that are actually used are created, and they
+        # live in the module containing the benchmark.
+        fixture_unions.materialize(fixture_name, bm.__globals__)
         wrapped_bm = globals_["wrapped_bm"]
         # In case marks were applied to the original benchmark, copy them over.
         if marks := getattr(bm, "pytestmark", None):
             wrapped_bm.pytestmark = marks
+        # Benchmarks of dtypes that the backend does not support are deselected.
+        if not all(column_generators[dt].supports(backend) for dt in dtype):
+            wrapped_bm = getattr(pytest.mark, backend.marker)(wrapped_bm)
         return wrapped_bm
 
     return deco
@@ -223,41 +317,882 @@ class OrderedSet(MutableSet):
         self._data.pop(value, None)
 
 
-def make_fixture(name, func, globals_, fixtures):
+def nbytes(obj):
+    """Return the memory footprint of a cudf (or pandas) object in bytes."""
+    usage = obj.memory_usage
+    # Column.memory_usage is a property, whereas the Frame methods accept
+    # arguments and DataFrame.memory_usage returns a per-column Series.
+    if callable(usage):
+        usage = usage(deep=True)
+    if hasattr(usage, "sum"):
+        usage = usage.sum()
+    return int(usage)
+
+
+def describe_input(obj):
+    """Describe the size of a benchmark input for computing throughput.
+
+    Parameters
+    ----------
+    obj : Union[Frame, BaseIndex, ColumnBase, Array, Mapping]
+        The input. Mappings (e.g. a dict of columns passed to a constructor)
+        are described by the total size of their values.
+
+    Returns
+    -------
+    Optional[dict]
+        The number of rows, columns, and bytes of the input, or None if the
+        input is not a recognized type.
+    """
+    if isinstance(obj, Mapping):
+        values = [describe_input(v) for v in obj.values()]
+        if not values or None in values:
+            return None
+        return {
+            "rows": values[0]["rows"],
+            "cols": len(values),
+            "bytes": sum(v["bytes"] for v in values),
+        }
+    if hasattr(obj, "memory_usage"):
+        size = nbytes(obj)
+    elif hasattr(obj, "nbytes"):
+        size = int(obj.nbytes)
+    else:
+        return None
+    cols = len(obj.columns) if hasattr(obj, "columns") else 1
+    return {"rows": len(obj), "cols": cols, "bytes": size}
+
+
+class FixtureCache:
+    """A session-wide cache of fixture objects with a memory budget.
+
+    Generating the data for the larger fixtures is often more expensive than
+    the operations being benchmarked, so base fixtures are built once per
+    session and cached by name. Since fixture names encode the class, dtype,
+    nullability, and size of the object, the name is a unique key. When adding
+    an object would exceed the budget, the least recently used objects are
+    evicted first. Objects larger than the entire budget are never cached.
+
+    Benchmarks share the cached object unless they are marked with
+    `pytest.mark.mutates_fixture`, in which case they receive a deep copy so
+    that they cannot affect other benchmarks.
+
+    Parameters
+    ----------
+    max_bytes : int
+        The memory budget of the cache. A budget of 0 disables caching.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._data = OrderedDict()
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}({len(self)} objects, "
+            f"{self.nbytes}/{self.max_bytes} bytes)"
+        )
+
+    def get(self, key, factory, readonly=False):
+        """Get the object for `key`, calling `factory()` to create it if needed."""
+        if key in self._data:
+            self._data.move_to_end(key)
+            obj, _ = self._data[key]
+        else:
+            obj = factory()
+            size = nbytes(obj)
+            if size > self.max_bytes:
+                return obj
+            while self.nbytes + size > self.max_bytes:
+                self.evict()
+            self._data[key] = (obj, size)
+            self.nbytes += size
+        return obj if readonly else obj.copy(deep=True)
+
+    def evict(self):
+        """Remove the least recently used object from the cache."""
+        _, (_, size) = self._data.popitem(last=False)
+        self.nbytes -= size
+
+    def clear(self):
+        self._data.clear()
+        self.nbytes = 0
+
+
+fixture_cache = FixtureCache(FIXTURE_CACHE_BYTES)
+
+
+def cached_input(name, make, benchmark=None):
+    """Get a benchmark input that is not one of the standard fixtures.
+
+    Inputs are built by `make()` and stored in `fixture_cache` like the
+    standard fixtures. Since they are shared by every benchmark using them,
+    benchmarks must not modify them. Unlike fixtures, inputs are not
+    converted for the backend, so `make` must do so if needed.
+
+    Parameters
+    ----------
+    name : str
+        The name of the input in the cache, which must identify its contents.
+    make : Callable[[], Any]
+        The function creating the input.
+    benchmark : Optional[BenchmarkFixture]
+        If given, the size of the input is recorded in its `extra_info`.
+    """
+    obj = fixture_cache.get(name, make, readonly=True)
+    if benchmark is not None:
+        benchmark.extra_info.update(describe_input(obj))
+    return obj
+
+
+def make_fixture(name, func, globals_, fixtures=None):
     """Create a named fixture in `globals_` and save its name in `fixtures`.
 
     https://github.com/pytest-dev/pytest/issues/2424#issuecomment-333387206
     explains why this hack is necessary. Essentially, dynamically generated
     fixtures must exist in globals() to be found by pytest.
+
+    The objects produced by `func` are converted for the current backend and
+    stored in `fixture_cache` so that each fixture is only generated once per
+    session.
     """
-    globals_[name] = pytest_cases.fixture(name=name)(func)
-    fixtures.add(name)
 
+    def cached_fixture(request):
+        readonly = request.node.get_closest_marker("mutates_fixture") is None
+        return fixture_cache.get(name, lambda: backend.convert(func(request)), readonly)
 
-def collapse_fixtures(fixtures, pattern, repl, globals_, idfunc=None):
-    """Create unions of fixtures based on specific name mappings.
+    globals_[name] = pytest_cases.fixture(name=name)(cached_fixture)
+    if fixtures is not None:
+        fixtures.add(name)
 
-    `fixtures` are grouped into unions according the regex replacement
-    `re.sub(pattern, repl)` and placed into `new_fixtures`.
+
+class FixtureUnionGraph:
+    """The set of fixture unions that may be requested by benchmarks.
+
+    Creating a fixture union is expensive relative to computing its name and
+    members, and the number of possible unions grows multiplicatively with
+    each new dtype or size. The graph of unions is therefore computed once
+    from the names of the base fixtures, and each union is only created when a
+    benchmark requests it via `materialize`. Base fixtures may also be added
+    to the graph so that they are likewise only created when requested.
     """
 
-    def collapser(n):
-        return re.sub(pattern, repl, n)
+    def __init__(self):
+        self._unions = {}
+        self._fixtures = {}
 
-    # Note: sorted creates a new list, not a view, so it's OK to modify the
-    # list of fixtures while iterating over the sorted result.
-    for name, group in groupby(sorted(fixtures, key=collapser), key=collapser):
-        group = list(group)
-        if len(group) > 1 and name not in fixtures:
-            pytest_cases.fixture_union(name=name, fixtures=group, ids=idfunc)
-            # Need to assign back to the parent scope's globals.
-            globals_[name] = globals()[name]
-            fixtures.add(name)
+    def __contains__(self, name):
+        return name in self._unions or name in self._fixtures
 
+    def __iter__(self):
+        yield from self._unions
+        yield from self._fixtures
+
+    def __len__(self):
+        return len(self._unions) + len(self._fixtures)
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}({len(self._unions)} unions, "
+            f"{len(self._fixtures)} fixtures)"
+        )
+
+    def add_union(self, name, fixtures, ids=None):
+        """Add a union of `fixtures` named `name`."""
+        self._unions[name] = (list(fixtures), ids)
+
+    def add_fixture(self, name, func):
+        """Add a base fixture named `name` that is created with `make_fixture`."""
+        self._fixtures[name] = func
+
+    def collapse(self, fixtures, rules, idfunc=None, first_idfunc=None):
+        """Add the unions formed by collapsing fixture names according to rules.
+
+        In each pass, the names of all known fixtures are grouped by the regex
+        replacement `re.sub(pattern, repl)` for each `(pattern, repl)` in
+        `rules`, and any group containing more than one fixture becomes a
+        union. Passes are repeated until no new unions are formed, since the
+        unions formed by one rule may be collapsed further by an earlier one.
+
+        Every name is only grouped once per rule: each rule keeps the groups of
+        the names it has seen, and a pass only revisits the groups that
+        received names added since the previous pass.
+
+        Parameters
+        ----------
+        fixtures : Iterable[str]
+            The names of the base fixtures.
+        rules : List[Tuple[str, str]]
+            The regex patterns and replacements to apply.
+        idfunc : Optional[Callable], default None
+            The id function for the unions.
+        first_idfunc : Optional[Callable], default None
+            The id function for the unions formed in the first pass. If None,
+            idfunc is used.
+        """
+        rules = [(re.compile(pattern), repl) for pattern, repl in rules]
+        names = list(OrderedSet(fixtures))
+        known = set(names)
+        # The groups of each rule, and the number of names each has grouped.
+        groups = [defaultdict(list) for _ in rules]
+        seen = [0] * len(rules)
+        ids = first_idfunc or idfunc
+
+        num_names = None
+        while num_names != len(names):
+            num_names = len(names)
+            for i, (pattern, repl) in enumerate(rules):
+                # Unions added while applying this rule are only grouped by it
+                # in the next pass.
+                new_names, seen[i] = names[seen[i] :], len(names)
+                touched = set()
+                for name in new_names:
+                    key = pattern.sub(repl, name)
+                    groups[i][key].append(name)
+                    touched.add(key)
+                for key in sorted(touched):
+                    group = groups[i][key]
+                    if len(group) > 1 and key not in known:
+                        self.add_union(key, group, ids)
+                        names.append(key)
+                        known.add(key)
+            ids = idfunc
+
+    def materialize(self, name, globals_):
+        """Create the union `name` and any fixtures it contains in `globals_`.
+
+        https://github.com/pytest-dev/pytest/issues/2424#issuecomment-333387206
+        explains why this hack is necessary. Essentially, dynamically generated
+        fixtures must exist in globals() to be found by pytest. Names that are
+        not in the graph (e.g. the standard base fixtures) are ignored.
+        """
+        if name in globals_:
+            return
+        if name in self._fixtures:
+            make_fixture(name, self._fixtures[name], globals_)
+            return
+        if name not in self._unions:
+            return
+        fixtures, ids = self._unions[name]
+        for fixture in fixtures:
+            self.materialize(fixture, globals_)
+        pytest_cases.fixture_union(name=name, fixtures=fixtures, ids=ids)
+        # fixture_union places the union in this module, so it must be moved.
+        globals_[name] = globals().pop(name)
+
+
+fixture_unions = FixtureUnionGraph()
+
+
+def to_host(data):
+    """Copy an array to the host if it is a cupy array."""
+    return data.get() if hasattr(data, "get") else data
+
+
+def synchronize():
+    """Wait for the work of previous operations to complete.
+
+    cudf may return before the work of an operation has completed, so timings
+    of individual calls must synchronize before reading the clock.
+    """
+    if backend.name == "cudf":
+        cupy.cuda.get_current_stream().synchronize()
+
+
+def from_arrow(array):
+    """Create a Series from a pyarrow array, preserving its type."""
+    if backend.name == "cudf":
+        return cudf.Series.from_arrow(array)
+    return cudf.Series(array, dtype=cudf.ArrowDtype(array.type))
+
+
+class DataStore:
+    """A persistent on-disk store of generated arrays.
+
+    Arrays are saved as .npy files named by their key. Subsequent requests for
+    the same key, including those from other sessions or pytest-xdist workers,
+    memory-map the file and copy it into a new array instead of regenerating
+    the data. Files are written atomically so that concurrent writers of the
+    same key are safe.
+
+    Parameters
+    ----------
+    path : Optional[str]
+        The directory in which to store data. If None, nothing is stored and
+        all data is generated on request.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.path})"
+
+    def get(self, key, factory):
+        """Load the array for `key`, calling `factory()` to create it if needed."""
+        if self.path is None:
+            return factory()
+
+        filename = os.path.join(self.path, f"{key}.npy")
+        try:
+            # Copying out of the mapped file means that the returned array is
+            # writeable and, under cudf, resident on the device.
+            return cupy.array(numpy.load(filename, mmap_mode="r"))
+        except FileNotFoundError:
+            pass
+
+        data = factory()
+        os.makedirs(self.path, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=self.path, suffix=".npy", delete=False
+        ) as f:
+            # cupy arrays must be explicitly copied to the host.
+            numpy.save(f, to_host(data))
+        os.replace(f.name, filename)
+        return data
+
+
+data_store = DataStore(DATA_DIR)
+
+
+def _format_number(value):
+    # Fixture names must be valid identifiers, so "." is replaced by "p".
+    return f"{value:g}".replace(".", "p")
+
+
+class Distribution:
+    """The distribution of the values and nulls of generated columns.
+
+    Hash-based and sort-based algorithms (e.g. in groupby, merge, or
+    drop_duplicates) are sensitive to the number of distinct keys, their
+    frequencies, and their order, none of which vary in the default data.
+
+    Parameters
+    ----------
+    cardinality : Optional[int]
+        The number of distinct values. Only supported by generators of
+        discrete values. If None, the default of the generator is used.
+    skew : Optional[float]
+        The exponent s of a Zipf distribution of values, in which the k-th
+        most frequent value has a frequency proportional to 1 / k**s. Only
+        supported by generators of discrete values. If None or 0, values are
+        uniformly distributed.
+    order : Optional[str]
+        The order of the values, one of "sorted", "reversed", or "partial"
+        (sorted except for a randomly shuffled 10% of rows). If None, values
+        are in random order.
+    null_fraction : Optional[float]
+        The fraction of rows that are null in nullable fixtures. If None, half
+        of the rows are null.
+    null_pattern : Optional[str]
+        The positions of the null rows, one of "strided" (evenly spaced),
+        "random", or "clustered" (random runs of 64 rows, i.e. entirely null
+        words of the validity bitmask). If None, nulls are strided if
+        null_fraction is None (i.e. every other row is null) and random
+        otherwise.
+    """
 
-# A dictionary of callables that create a column of a specified length
-random_state = cupy.random.RandomState(42)
+    ORDERS = ("sorted", "reversed", "partial")
+    NULL_PATTERNS = ("strided", "random", "clustered")
+
+    def __init__(
+        self,
+        cardinality=None,
+        skew=None,
+        order=None,
+        null_fraction=None,
+        null_pattern=None,
+    ):
+        assert cardinality is None or cardinality > 0, "cardinality must be positive"
+        assert skew is None or skew >= 0, "skew must be non-negative"
+        assert (
+            order is None or order in self.ORDERS
+        ), f"order {order} is invalid, choose from {', '.join(self.ORDERS)}"
+        assert null_fraction is None or (
+            0 <= null_fraction <= 1
+        ), "null_fraction must be between 0 and 1"
+        assert null_pattern is None or null_pattern in self.NULL_PATTERNS, (
+            f"null_pattern {null_pattern} is invalid, choose from "
+            f"{', '.join(self.NULL_PATTERNS)}"
+        )
+        self.cardinality = cardinality
+        self.skew = skew
+        self.order = order
+        self.null_fraction = null_fraction
+        self.null_pattern = null_pattern
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.name})"
+
+    @property
+    def name(self):
+        """The component identifying the distribution in fixture names."""
+        name = ""
+        if self.cardinality is not None:
+            name += f"_card_{self.cardinality}"
+        if self.skew:
+            name += f"_zipf_{_format_number(self.skew)}"
+        if self.order is not None:
+            name += f"_order_{self.order}"
+        if self.null_fraction is not None:
+            name += f"_nullpct_{_format_number(self.null_fraction * 100)}"
+        if self.null_pattern is not None:
+            name += f"_nullpat_{self.null_pattern}"
+        return name
+
+    @property
+    def nulls(self):
+        """The possible nullabilities of fixtures with this distribution."""
+        if self.null_fraction is None:
+            return [False, True]
+        return [self.null_fraction > 0]
+
+    @property
+    def discrete(self):
+        """Whether the distribution determines the values themselves."""
+        return self.cardinality is not None or bool(self.skew)
+
+    def sample(self, rs, nr, cardinality):
+        """Sample `nr` values from [0, cardinality)."""
+        cardinality = self.cardinality or cardinality
+        if not self.skew:
+            return rs.randint(low=0, high=cardinality, size=nr)
+        p = 1 / cupy.arange(1, cardinality + 1, dtype="float64") ** self.skew
+        return rs.choice(cardinality, size=nr, p=p / p.sum())
+
+    def arrange(self, rs, data):
+        """Order `data` (in place where possible)."""
+        if self.order is None:
+            return data
+        data.sort()
+        if self.order == "reversed":
+            data = data[::-1]
+        elif self.order == "partial":
+            rows = rs.permutation(len(data))[: len(data) // 10]
+            data[rows] = data[rs.permutation(rows)]
+        return data
+
+    def null_mask(self, nr, seed=0):
+        """The mask of null rows of a nullable fixture with `nr` rows."""
+        fraction = 0.5 if self.null_fraction is None else self.null_fraction
+        pattern = self.null_pattern or (
+            "strided" if self.null_fraction is None else "random"
+        )
+        num_nulls = round(fraction * nr)
+        rs = numpy.random.RandomState(seed)
+        mask = numpy.zeros(nr, dtype=bool)
+        if pattern == "strided":
+            mask[numpy.arange(num_nulls) * nr // max(num_nulls, 1)] = True
+        elif pattern == "random":
+            mask[rs.permutation(nr)[:num_nulls]] = True
+        else:
+            num_blocks = -(-nr // 64)
+            blocks = rs.permutation(num_blocks)[: round(fraction * num_blocks)]
+            mask[(blocks[:, None] * 64 + numpy.arange(64)).ravel() % nr] = True
+        return mask
+
+
+def with_nulls(values, null_mask):
+    """Construct a nullable array from values and a mask of null rows.
+
+    Nulls are set in a single construction rather than by setting rows of an
+    existing object to null, which is slow and under pandas would convert
+    integers to floats.
+
+    Parameters
+    ----------
+    values : Union[Array, Series]
+        The values, as produced by a `ColumnGenerator`.
+    null_mask : numpy.ndarray
+        A boolean array that is True for rows that are null.
+
+    Returns
+    -------
+    Union[Array, Series]
+        An object accepted by the constructors of all classes (Series, Index,
+        DataFrame).
+    """
+    if backend.name == "cudf":
+        bitmask = cupy.packbits(cupy.asarray(~null_mask), bitorder="little")
+        return cudf.Series.from_masked_array(values, bitmask)
+    if not isinstance(values, numpy.ndarray):
+        # Series built from the generated data, e.g. of datetimes.
+        return values.mask(null_mask)
+    if backend.name == "polars":
+        import pyarrow
+
+        return pyarrow.array(values, mask=null_mask)
+    if values.dtype.kind in "iu":
+        return cudf.arrays.IntegerArray(values, null_mask)
+    if values.dtype.kind == "b":
+        return cudf.arrays.BooleanArray(values, null_mask)
+    return numpy.where(
+        null_mask, numpy.nan if values.dtype.kind == "f" else None, values
+    )
+
+
+# The distribution of the standard fixtures.
+default_distribution = Distribution()
+
+
+class ColumnGenerator:
+    """A deterministic generator of random column data.
+
+    Each column is generated from its own random state so that the data only
+    depends on the seed and the length, allowing it to be saved in and
+    reloaded from `data_store`. Only numeric arrays can be stored, so columns
+    of other types (e.g. strings or datetimes) are built from numeric data
+    after it is loaded.
+
+    Parameters
+    ----------
+    name : str
+        The name of the generator.
+    dtype : str
+        The dtype of the generated (numeric) data.
+    func : Callable[[cupy.random.RandomState, int], Array]
+        A function generating an array of the given length.
+    build : Optional[Callable[[Array], Any]]
+        A function converting the generated data into an array or Series that
+        the constructors of all classes (Series, Index, DataFrame) accept.
+    backends : Optional[Tuple[str]]
+        The backends supporting the type of column. If None, all backends are
+        supported.
+    cardinality : Optional[int]
+        For generators of discrete values (codes in [0, cardinality) before
+        `build`), the default number of distinct values. Only these
+        generators support the cardinality and skew of a `Distribution`.
+    """
+
+    def __init__(self, name, dtype, func, build=None, backends=None, cardinality=None):
+        self.name = name
+        self.dtype = dtype
+        self.func = func
+        self.build = build
+        self.backends = backends
+        self.cardinality = cardinality
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.name}, {self.dtype})"
+
+    def __call__(self, nr, seed=42, distribution=default_distribution, nulls=False):
+        """Generate a column of `nr` rows, with nulls if `nulls` is True."""
+        assert (
+            self.cardinality is not None or not distribution.discrete
+        ), f"The cardinality and skew of {self.name} columns cannot be configured"
+
+        def generate():
+            rs = cupy.random.RandomState(seed)
+            if distribution.discrete:
+                data = distribution.sample(rs, nr, self.cardinality)
+            else:
+                data = self.func(rs, nr)
+            data = distribution.arrange(rs, data)
+            return data.astype(self.dtype, copy=False)
+
+        data = data_store.get(
+            f"{self.name}_{self.dtype}{distribution.name}_{seed}_{nr}", generate
+        )
+        values = self.build_values(data, distribution)
+        return with_nulls(values, distribution.null_mask(nr)) if nulls else values
+
+    def build_values(self, data, distribution):
+        """Convert generated data into the column's values with `build`."""
+        return data if self.build is None else self.build(data)
+
+    def supports(self, backend):
+        return self.backends is None or backend.name in self.backends
+
+
+class StringColumnGenerator(ColumnGenerator):
+    """A generator of string columns drawn from a fixed vocabulary.
+
+    The vocabulary is sorted, so sorting the generated codes also sorts the
+    strings.
+
+    Parameters
+    ----------
+    name : str
+        The name of the generator.
+    cardinality : int
+        The default number of distinct strings in the vocabulary.
+    lengths : Tuple[int, int]
+        The minimum and maximum length of the strings.
+    categorical : bool
+        Whether to generate categorical columns rather than string columns.
+    alphabet : str
+        The characters of the strings, which are drawn uniformly from it (so
+        repeated characters are drawn more often).
+    length_distribution : str
+        The distribution of the lengths of the strings, either "uniform" or
+        "skewed", in which most strings are short and few approach the
+        maximum length.
+    """
+
+    def __init__(
+        self,
+        name,
+        cardinality,
+        lengths,
+        categorical=False,
+        alphabet=string.ascii_letters + string.digits,
+        length_distribution="uniform",
+    ):
+        super().__init__(
+            name,
+            "int64",
+            lambda rs, nr: rs.randint(low=0, high=cardinality, size=nr),
+            cardinality=cardinality,
+        )
+        self.lengths = lengths
+        self.categorical = categorical
+        self.alphabet = alphabet
+        self.length_distribution = length_distribution
+        self._vocabularies = {}
+
+    def vocabulary(self, size):
+        """The vocabulary of `size` strings, generated on the host."""
+        if size not in self._vocabularies:
+            rs = numpy.random.RandomState(0)
+            chars = numpy.array(list(self.alphabet))
+            low, high = self.lengths
+            if self.length_distribution == "uniform":
+                lengths = rs.randint(low, high + 1, size=size)
+            else:
+                lengths = numpy.minimum(
+                    low + rs.exponential((high - low) / 8, size=size).astype(int), high
+                )
+            matrix = chars[rs.randint(0, len(chars), size=(size, high))]
+            # Trailing empty characters are dropped when viewed as strings.
+            matrix[numpy.arange(high) >= lengths[:, None]] = ""
+            self._vocabularies[size] = numpy.sort(
+                matrix.view(f"U{high}").ravel()
+            ).astype(object)
+        return self._vocabularies[size]
+
+    def build_values(self, codes, distribution):
+        vocabulary = self.vocabulary(distribution.cardinality or self.cardinality)
+        values = vocabulary[to_host(codes)]
+        if self.categorical:
+            return cudf.Series(values).astype("category")
+        return values
+
+
+def _make_decimals(data):
+    import pyarrow
+
+    return from_arrow(pyarrow.array(to_host(data)).cast(pyarrow.decimal128(12, 2)))
+
+
+def _make_lists(data):
+    import pyarrow
+
+    # Lists of 0-3 elements, reusing the data as the list elements.
+    data = to_host(data)
+    offsets = numpy.concatenate([[0], numpy.cumsum(data % 4)])
+    values = numpy.resize(data, offsets[-1])
+    return from_arrow(pyarrow.ListArray.from_arrays(offsets, values))
+
+
+# A dictionary of callables that create a column of a specified length.
 column_generators = {
-    "int": (lambda nr: random_state.randint(low=0, high=100, size=nr)),
-    "float": (lambda nr: random_state.rand(nr)),
+    generator.name: generator
+    for generator in [
+        ColumnGenerator(
+            "int",
+            "int64",
+            lambda rs, nr: rs.randint(low=0, high=100, size=nr),
+            cardinality=100,
+        ),
+        ColumnGenerator("float", "float64", lambda rs, nr: rs.rand(nr)),
+        StringColumnGenerator("str", cardinality=1000, lengths=(4, 16)),
+        StringColumnGenerator(
+            "category", cardinality=100, lengths=(4, 16), categorical=True
+        ),
+        ColumnGenerator(
+            "datetime",
+            "int64",
+            # Nanosecond timestamps between 2000 and 2030.
+            lambda rs, nr: rs.randint(
+                low=946_684_800 * 10**9, high=1_893_456_000 * 10**9, size=nr
+            ),
+            build=lambda data: cudf.Series(data).astype("datetime64[ns]"),
+        ),
+        ColumnGenerator(
+            "timedelta",
+            "int64",
+            # Nanosecond durations of up to a day.
+            lambda rs, nr: rs.randint(low=0, high=86_400 * 10**9, size=nr),
+            build=lambda data: cudf.Series(data).astype("timedelta64[ns]"),
+        ),
+        ColumnGenerator(
+            "decimal",
+            "float64",
+            lambda rs, nr: rs.rand(nr) * 1000,
+            build=_make_decimals,
+            backends=("cudf", "pandas-pyarrow"),
+        ),
+        ColumnGenerator(
+            "list",
+            "int64",
+            lambda rs, nr: rs.randint(low=0, high=100, size=nr),
+            build=_make_lists,
+            backends=("cudf", "pandas-pyarrow"),
+        ),
+    ]
 }
+
+
+# The rules used to collapse base fixtures into fixture unions, see
+# FixtureUnionGraph.collapse.
+# Note: If we start also introducing unions across dtypes, most likely those
+# will take the form `*int_and_float*` or similar since we won't want to union
+# _all_ dtypes. In that case, the regexes will need to use suitable lookaheads
+# etc to avoid infinite loops when collapsing.
+FIXTURE_UNION_RULES = [
+    ("_nulls_(true|false)", ""),
+    ("series|dataframe", "indexedframe"),
+    ("indexedframe|index", "frame_or_index"),
+    (r"_rows_\d+", ""),
+    (r"_cols_\d+", ""),
+]
+
+
+# We define some custom naming functions for use in the creation of fixture
+# unions to create more readable test function names that don't contain the
+# entire union, which quickly becomes intractably long.
+def unique_union_id(val):
+    return val.alternative_name
+
+
+def default_union_id(val):
+    return f"alt{val.get_alternative_idx()}"
+
+
+def base_fixtures(dtype, distribution=default_distribution):
+    """Generate the base fixtures of a dtype.
+
+    Parameters
+    ----------
+    dtype : str
+        The dtype, a key of `column_generators`.
+    distribution : Distribution
+        The distribution of the data.
+
+    Yields
+    ------
+    Tuple[str, Callable]
+        The name and function of each fixture, see conftest.py for the naming
+        convention.
+    """
+    column_generator = column_generators[dtype]
+    prefix = f"_dtype_{dtype}{distribution.name}"
+
+    def make_dataframe(nr, nc, nulls):
+        assert nc <= len(string.ascii_lowercase)
+        return cudf.DataFrame(
+            {
+                f"{string.ascii_lowercase[i]}": column_generator(
+                    nr, seed=42 + i, distribution=distribution, nulls=nulls
+                )
+                for i in range(nc)
+            }
+        )
+
+    for nr in NUM_ROWS:
+        # TODO: pytest_cases.fixture doesn't appear to support lambdas where
+        # pytest does. https://github.com/smarie/python-pytest-cases/issues/278
+        # Once that is fixed we could use lambdas here.
+        # TODO: pytest_cases has a bug where the first argument being a
+        # defaulted kwarg e.g. (nr=nr, nc=nc) raises errors.
+        # https://github.com/smarie/python-pytest-cases/issues/278
+        # Once that is fixed we could remove all the extraneous `request`
+        # fixtures in these fixtures.
+        for nulls in distribution.nulls:
+
+            def series(request, nr=nr, nulls=nulls):
+                return cudf.Series(
+                    column_generator(nr, distribution=distribution, nulls=nulls)
+                )
+
+            yield f"series{prefix}_nulls_{str(nulls).lower()}_rows_{nr}", series
+
+        # For now, not bothering to include a nullable index fixture.
+        def index(request, nr=nr):
+            return cudf.Index(column_generator(nr, distribution=distribution))
+
+        yield f"index{prefix}_nulls_false_rows_{nr}", index
+
+        for nc in NUM_COLS:
+            for nulls in distribution.nulls:
+
+                def dataframe(request, nr=nr, nc=nc, nulls=nulls):
+                    return make_dataframe(nr, nc, nulls)
+
+                yield (
+                    f"dataframe{prefix}_nulls_{str(nulls).lower()}_cols_{nc}_rows_{nr}",
+                    dataframe,
+                )
+
+
+def add_fixture_unions(fixtures, variants):
+    """Add the unions of the base `fixtures` to `fixture_unions`.
+
+    Parameters
+    ----------
+    fixtures : Iterable[str]
+        The names of the base fixtures.
+    variants : Iterable[Tuple[str, Distribution]]
+        The dtypes and distributions of the base fixtures.
+    """
+    fixture_unions.collapse(
+        fixtures,
+        FIXTURE_UNION_RULES,
+        idfunc=default_union_id,
+        # Label the first level differently from others since there's no
+        # redundancy.
+        first_idfunc=unique_union_id,
+    )
+
+    for dtype, distribution in variants:
+        # We have to manually add this one because we aren't including nullable
+        # indexes but we want to be able to run some benchmarks on
+        # Series/DataFrame that may or may not be nullable as well as Index
+        # objects.
+        prefix = f"_dtype_{dtype}{distribution.name}"
+        null_str = ""
+        if len(distribution.nulls) == 1:
+            null_str = f"_nulls_{str(distribution.nulls[0]).lower()}"
+            if not distribution.nulls[0]:
+                # The union was formed by collapsing.
+                continue
+        fixture_unions.add_union(
+            f"frame_or_index{prefix}{null_str}",
+            (f"indexedframe{prefix}{null_str}", f"index{prefix}_nulls_false"),
+            ids=["", f"index{prefix}_nulls_false"],
+        )
+
+
+def add_distribution(dtype, distribution):
+    """Add base fixtures and unions of a dtype with a non-default distribution.
+
+    Unlike the standard fixtures created in conftest.py, the fixtures are only
+    created when a benchmark requests them, see `FixtureUnionGraph.materialize`.
+    """
+    assert column_generators[dtype].cardinality is not None or not (
+        distribution.discrete
+    ), f"The cardinality and skew of {dtype} columns cannot be configured"
+    fixtures = []
+    for name, func in base_fixtures(dtype, distribution):
+        if name in fixture_unions:
+            return
+        fixture_unions.add_fixture(name, func)
+        fixtures.append(name)
+    add_fixture_unions(fixtures, [(dtype, distribution)])
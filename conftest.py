@@ -35,6 +35,12 @@ indexedframe, frame, frame_or_index. Note that in the case of indexes, to match
 Series/DataFrame we simply set `classname=index` and rely on the
 `dtype_{dtype}` component to delineate which index class is actually in use.
 
+Benchmarks may also request data with a non-default distribution of values
+(cardinality, skew, order, and null fraction) via `accepts_cudf_fixture`. The
+names of those fixtures contain additional components following the dtype,
+e.g. `series_dtype_int_card_10_zipf_1p5_nulls_false_rows_100`, and they are only
+created when requested (see `utils.Distribution`).
+
 In addition to the above fixtures, we also provide the following more
 specialized fixtures:
     - rangeindex: Since RangeIndex always holds int64 data we cannot conflate
@@ -44,7 +50,6 @@ specialized fixtures:
 
 
 import os
-import string
 import sys
 
 import pytest_cases
@@ -56,10 +61,18 @@ import pytest_cases
 sys.path.insert(0, os.path.join(os.getcwd(), "common"))
 
 from config import cudf  # noqa: W0611, E402, F401
+from instrumentation import (  # noqa: E402
+    InstrumentedBenchmark,
+    Profiler,
+    measure_dispatch,
+    measure_memory,
+)
 from utils import (  # noqa: E402
     OrderedSet,
-    collapse_fixtures,
+    add_fixture_unions,
+    base_fixtures,
     column_generators,
+    default_distribution,
     make_fixture,
 )
 
@@ -69,8 +82,11 @@ from utils import (  # noqa: E402
 from config import (  # noqa: W0611, E402, F401
     NUM_COLS,
     NUM_ROWS,
+    OVERHEAD,
     collect_ignore,
+    pytest_addoption,
     pytest_collection_modifyitems,
+    pytest_configure,
     pytest_sessionfinish,
     pytest_sessionstart,
 )
@@ -78,139 +94,39 @@ from config import (  # noqa: W0611, E402, F401
 # isort: on
 
 
+@pytest_cases.fixture
+def benchmark(benchmark, request):
+    """Apply the instruments enabled on the command line to benchmarks."""
+    instruments = []
+    if request.config.getoption("bench_memory"):
+        instruments.append(measure_memory)
+    if OVERHEAD:
+        instruments.append(measure_dispatch)
+    if directory := request.config.getoption("bench_profile"):
+        instruments.append(Profiler(directory, request.node.nodeid))
+    return InstrumentedBenchmark.wrap(
+        benchmark,
+        instruments,
+        precision=request.config.getoption("bench_precision"),
+        time_cap=request.config.getoption("bench_time_cap"),
+        cold=request.config.getoption("bench_cold"),
+    )
+
+
 @pytest_cases.fixture(params=[0, 1], ids=["AxisIndex", "AxisColumn"])
 def axis(request):
     return request.param
 
 
-# First generate all the base fixtures.
+# First generate all the base fixtures, then all the unions of them.
 fixtures = OrderedSet()
-for dtype, column_generator in column_generators.items():
-
-    def make_dataframe(nr, nc, column_generator=column_generator):
-        assert nc <= len(string.ascii_lowercase)
-        return cudf.DataFrame(
-            {f"{string.ascii_lowercase[i]}": column_generator(nr) for i in range(nc)}
-        )
-
-    for nr in NUM_ROWS:
-        # TODO: pytest_cases.fixture doesn't appear to support lambdas where
-        # pytest does. https://github.com/smarie/python-pytest-cases/issues/278
-        # Once that is fixed we could use lambdas here.
-        # TODO: pytest_cases has a bug where the first argument being a
-        # defaulted kwarg e.g. (nr=nr, nc=nc) raises errors.
-        # https://github.com/smarie/python-pytest-cases/issues/278
-        # Once that is fixed we could remove all the extraneous `request`
-        # fixtures in these fixtures.
-        def series_nulls_false(request, nr=nr, column_generator=column_generator):
-            return cudf.Series(column_generator(nr))
-
-        make_fixture(
-            f"series_dtype_{dtype}_nulls_false_rows_{nr}",
-            series_nulls_false,
-            globals(),
-            fixtures,
-        )
-
-        def series_nulls_true(request, nr=nr, column_generator=column_generator):
-            s = cudf.Series(column_generator(nr))
-            s.iloc[::2] = None
-            return s
-
-        make_fixture(
-            f"series_dtype_{dtype}_nulls_true_rows_{nr}",
-            series_nulls_true,
-            globals(),
-            fixtures,
-        )
-
-        # For now, not bothering to include a nullable index fixture.
-        def index_nulls_false(request, nr=nr, column_generator=column_generator):
-            return cudf.Index(column_generator(nr))
-
-        make_fixture(
-            f"index_dtype_{dtype}_nulls_false_rows_{nr}",
-            index_nulls_false,
-            globals(),
-            fixtures,
-        )
-
-        for nc in NUM_COLS:
-
-            def dataframe_nulls_false(
-                request, nr=nr, nc=nc, make_dataframe=make_dataframe
-            ):
-                return make_dataframe(nr, nc)
-
-            make_fixture(
-                f"dataframe_dtype_{dtype}_nulls_false_cols_{nc}_rows_{nr}",
-                dataframe_nulls_false,
-                globals(),
-                fixtures,
-            )
-
-            def dataframe_nulls_true(
-                request, nr=nr, nc=nc, make_dataframe=make_dataframe
-            ):
-                df = make_dataframe(nr, nc)
-                df.iloc[::2, :] = None
-                return df
-
-            make_fixture(
-                f"dataframe_dtype_{dtype}_nulls_true_cols_{nc}_rows_{nr}",
-                dataframe_nulls_true,
-                globals(),
-                fixtures,
-            )
-
-
-# We define some custom naming functions for use in the creation of fixture
-# unions to create more readable test function names that don't contain the
-# entire union, which quickly becomes intractably long.
-def unique_union_id(val):
-    return val.alternative_name
-
-
-def default_union_id(val):
-    return f"alt{val.get_alternative_idx()}"
-
-
-# Label the first level differently from others since there's no redundancy.
-idfunc = unique_union_id
-num_new_fixtures = len(fixtures)
-
-# Keep trying to merge existing fixtures until no new fixtures are added.
-while num_new_fixtures > 0:
-    num_fixtures = len(fixtures)
-
-    # Note: If we start also introducing unions across dtypes, most likely
-    # those will take the form `*int_and_float*` or similar since we won't want
-    # to union _all_ dtypes. In that case, the regexes will need to use
-    # suitable lookaheads etc to avoid infinite loops here.
-    for pat, repl in [
-        ("_nulls_(true|false)", ""),
-        ("series|dataframe", "indexedframe"),
-        ("indexedframe|index", "frame_or_index"),
-        (r"_rows_\d+", ""),
-        (r"_cols_\d+", ""),
-    ]:
-
-        collapse_fixtures(fixtures, pat, repl, globals(), idfunc)
-
-    num_new_fixtures = len(fixtures) - num_fixtures
-    # All subsequent levels get the same (collapsed) labels.
-    idfunc = default_union_id
-
-
-for dtype, column_generator in column_generators.items():
-    # We have to manually add this one because we aren't including nullable
-    # indexes but we want to be able to run some benchmarks on Series/DataFrame
-    # that may or may not be nullable as well as Index objects.
-    pytest_cases.fixture_union(
-        name=f"frame_or_index_dtype_{dtype}",
-        fixtures=(f"indexedframe_dtype_{dtype}", f"index_dtype_{dtype}_nulls_false"),
-        ids=["", f"index_dtype_{dtype}_nulls_false"],
-    )
+for dtype in column_generators:
+    for name, func in base_fixtures(dtype):
+        make_fixture(name, func, globals(), fixtures)
+
+add_fixture_unions(
+    fixtures, [(dtype, default_distribution) for dtype in column_generators]
+)
 
 
 # TODO: Decide where to incorporate RangeIndex and MultiIndex fixtures.
@@ -1,6 +1,11 @@
 import pytest
 import pytest_cases
-from utils import accepts_cudf_fixture, make_boolean_mask_column, make_gather_map
+from utils import (
+    accepts_cudf_fixture,
+    fixture_unions,
+    make_boolean_mask_column,
+    make_gather_map,
+)
 
 
 @accepts_cudf_fixture(cls="column", dtype="float")
@@ -31,7 +36,10 @@ def bench_take(benchmark, column, gather_how, nullify):
 # TODO: Due to https://github.com/smarie/python-pytest-cases/issues/280 we
 # cannot use the accepts_cudf_fixture decorator for cases. If and when that is
 # resolved, we can change all of the cases below to use that instead of
-# hardcoding the fixture name.
+# hardcoding the fixture name (which must then be created explicitly).
+fixture_unions.materialize("column_dtype_int_nulls_false", globals())
+
+
 def setitem_case_stride_1_slice_scalar(column_dtype_int_nulls_false):
     return column_dtype_int_nulls_false, slice(None, None, 1), 42
 
@@ -88,6 +96,7 @@ def setitem_case_int_column_align_to_col_size(column_dtype_int_nulls_false):
 #           column (len(val) != len(key) & len == num_true)
 
 
+@pytest.mark.mutates_fixture
 @pytest_cases.parametrize_with_cases("column,key,value", cases=".", prefix="setitem")
 def bench_setitem(benchmark, column, key, value):
     benchmark(column.__setitem__, key, value)
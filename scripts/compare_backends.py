@@ -0,0 +1,192 @@
+"""Compare the performance of benchmarks across backends in one invocation.
+
+Each backend is benchmarked in a separate pytest process, after which the
+median times of every benchmark present for all backends are compared. The
+speedup of each backend relative to the baseline backend is reported for each
+group of benchmarks sharing a function, dtype, data distribution, nullability,
+and number of rows (the geometric mean is used to combine the remaining
+parameters). Groups where a backend is slower than the baseline are flagged.
+The results of backends in which some benchmarks failed are still compared,
+and those backends are listed at the end of the report.
+
+Example
+-------
+python scripts/compare_backends.py --backends pandas cudf -- API/bench_series.py
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+from collections import defaultdict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "common"))
+
+from results import (  # noqa: E402
+    format_table,
+    geometric_mean,
+    load_benchmarks,
+    parse_benchmark,
+)
+
+
+def run_backend(backend, output_dir, pytest_args):
+    """Run the benchmarks for `backend`.
+
+    Returns
+    -------
+    Tuple[Optional[str], int]
+        The path to the results, or None (after reporting it) if pytest did not
+        write any, and the exit code of pytest. pytest-benchmark writes the
+        results of the benchmarks that passed even if others failed.
+    """
+    path = os.path.join(output_dir, f"{backend}.json")
+    # Results of a previous run in the same directory must not be reported.
+    if os.path.exists(path):
+        os.remove(path)
+    returncode = subprocess.run(
+        [sys.executable, "-m", "pytest", "--backend", backend]
+        + [f"--benchmark-json={path}", *pytest_args],
+        cwd=ROOT,
+        check=False,
+    ).returncode
+    if not os.path.exists(path):
+        print(f"Skipping {backend}: no results were written to {path}.")
+        return None, returncode
+    return path, returncode
+
+
+def load_results(path):
+    return {b["fullname"]: b for b in load_benchmarks(path)}
+
+
+def compare(results, baseline):
+    """Compute the speedup of each backend over `baseline` for each group.
+
+    Parameters
+    ----------
+    results : Dict[str, Dict[str, dict]]
+        The benchmarks keyed by full name for each backend.
+    baseline : str
+        The backend to compare against.
+
+    Returns
+    -------
+    Dict[Tuple, Dict[str, float]]
+        The speedups of each other backend for each group of benchmarks.
+    """
+    others = [b for b in results if b != baseline]
+    ratios = defaultdict(lambda: defaultdict(list))
+    for fullname, benchmark in results[baseline].items():
+        props = parse_benchmark(benchmark)
+        key = tuple(
+            props[k] for k in ("function", "dtype", "distribution", "nulls", "rows")
+        )
+        for other in others:
+            if fullname in results[other]:
+                ratios[key][other].append(
+                    benchmark["stats"]["median"]
+                    / results[other][fullname]["stats"]["median"]
+                )
+    return {
+        key: {other: geometric_mean(r) for other, r in speedups.items()}
+        for key, speedups in ratios.items()
+    }
+
+
+def sort_key(key):
+    # Sort numerically by rows, placing benchmarks without sizes first.
+    function, dtype, distribution, nulls, rows = key
+    return (
+        function,
+        dtype or "",
+        distribution or "",
+        nulls or "",
+        int(rows) if rows else -1,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        default=["pandas", "cudf"],
+        help="The backends to benchmark.",
+    )
+    parser.add_argument(
+        "--baseline",
+        default="pandas",
+        help="The backend that speedups are relative to (default: pandas).",
+    )
+    parser.add_argument(
+        "--output-dir",
+        help="A directory to save the results of each backend in.",
+    )
+    parser.add_argument(
+        "pytest_args",
+        nargs="*",
+        help="Additional arguments passed to pytest, e.g. paths or -k filters.",
+    )
+    args = parser.parse_args()
+
+    if args.baseline not in args.backends:
+        args.backends.insert(0, args.baseline)
+
+    output_dir = args.output_dir or tempfile.mkdtemp()
+    os.makedirs(output_dir, exist_ok=True)
+    results = {}
+    failed = {}
+    for backend in args.backends:
+        path, returncode = run_backend(backend, output_dir, args.pytest_args)
+        # pytest exits with 5 if no benchmarks were selected.
+        if returncode not in (0, 5):
+            failed[backend] = returncode
+        if path is not None:
+            results[backend] = load_results(path)
+    if args.baseline not in results:
+        sys.exit(f"Cannot compare backends without results for {args.baseline}.")
+    others = [b for b in args.backends if b != args.baseline and b in results]
+    speedups = compare(results, args.baseline)
+
+    rows = []
+    slower = []
+    for key in sorted(speedups, key=sort_key):
+        row = [v or "" for v in key]
+        for other in others:
+            speedup = speedups[key].get(other)
+            if speedup is None:
+                row.append("")
+            else:
+                row.append(f"{speedup:.2f}x" + (" SLOWER" if speedup < 1 else ""))
+                if speedup < 1:
+                    slower.append((other, key))
+        rows.append(row)
+
+    print(f"Speedup relative to {args.baseline} (median time, higher is faster)")
+    print(
+        format_table(
+            ["function", "dtype", "distribution", "nulls", "rows", *others], rows
+        )
+    )
+    if slower:
+        # List the smallest sizes first since that is where fixed overheads
+        # are most likely to make an accelerated backend slower.
+        slower.sort(key=lambda s: int(s[1][4]) if s[1][4] else -1)
+        print(f"\n{len(slower)} groups are slower than {args.baseline}:")
+        for other, (function, dtype, distribution, nulls, rows) in slower:
+            print(
+                f"  {other}: {function} dtype={dtype} "
+                f"distribution={distribution} nulls={nulls} rows={rows}"
+            )
+    if failed:
+        print("\nSome benchmarks failed, so the results of these backends are partial:")
+        for backend, returncode in failed.items():
+            print(f"  {backend}: pytest exited with code {returncode}")
+    print(f"\nResults saved in {output_dir}")
+
+
+if __name__ == "__main__":
+    main()
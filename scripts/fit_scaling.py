@@ -0,0 +1,126 @@
+"""Fit how the time of each benchmark scales with the number of rows.
+
+The benchmarks should be run in the scaling mode, which sweeps the number of
+rows of every fixture over a geometric grid, e.g.
+
+CUDF_BENCHMARKS_SCALING_MAX_ROWS=10000000 pytest --benchmark-json=scaling.json
+
+The median times of each benchmark are then fitted against the number of rows
+with models of the form `t = a + b * f(n)`, where a is the fixed overhead of the
+operation (e.g. Python dispatch and kernel launches) and f is one of constant,
+linear, n log n, or quadratic. The fitted exponent of a power law and the
+crossover size n* at which the variable cost equals the fixed overhead are also
+reported. Below n* the time is dominated by overhead, while above it the
+exponent governs how the operation scales. Benchmarks whose exponent exceeds a
+threshold are flagged as scaling super-linearly.
+
+Example
+-------
+python scripts/fit_scaling.py scaling.json
+"""
+
+import argparse
+import os
+import re
+import sys
+from collections import defaultdict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "common"))
+
+from results import (  # noqa: E402
+    ROW_PARAMETERS,
+    fit_scaling,
+    format_table,
+    load_benchmarks,
+    parse_benchmark,
+)
+
+# Size components of fixture names, which are removed to group the benchmarks
+# that differ only in their number of rows.
+ROWS_PATTERN = re.compile(r"_rows_\d+")
+
+
+def scaling_groups(benchmarks):
+    """Group the median times of benchmarks differing only in their rows.
+
+    Returns
+    -------
+    Dict[str, Dict[int, float]]
+        The median time for each number of rows of each group.
+    """
+    groups = defaultdict(dict)
+    for benchmark in benchmarks:
+        rows = parse_benchmark(benchmark)["rows"]
+        if rows is None:
+            continue
+        params = benchmark.get("params") or {}
+        if any(p in params for p in ROW_PARAMETERS):
+            function, _, _ = benchmark["fullname"].partition("[")
+            other = [f"{k}={v}" for k, v in params.items() if k not in ROW_PARAMETERS]
+            key = f"{function}[{'-'.join(other)}]" if other else function
+        else:
+            key = ROWS_PATTERN.sub("", benchmark["fullname"])
+        groups[key][int(rows)] = benchmark["stats"]["median"]
+    return groups
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "results",
+        nargs="+",
+        help="pytest-benchmark JSON files of runs in the scaling mode.",
+    )
+    parser.add_argument(
+        "--min-points",
+        type=int,
+        default=5,
+        help="The minimum number of sizes needed to fit a benchmark (default: 5).",
+    )
+    parser.add_argument(
+        "--superlinear",
+        type=float,
+        default=1.1,
+        help="The exponent above which benchmarks are flagged (default: 1.1).",
+    )
+    args = parser.parse_args()
+
+    groups = scaling_groups(b for path in args.results for b in load_benchmarks(path))
+    fits = {}
+    for key, times in groups.items():
+        if len(times) >= args.min_points:
+            sizes = sorted(times)
+            fits[key] = fit_scaling(sizes, [times[n] for n in sizes])
+            fits[key]["range"] = (sizes[0], sizes[-1])
+    if not fits:
+        sys.exit(
+            f"No benchmarks were run with at least {args.min_points} sizes. "
+            "Run benchmarks with CUDF_BENCHMARKS_SCALING_MAX_ROWS set."
+        )
+
+    rows = []
+    for key in sorted(fits, key=lambda k: -fits[k]["exponent"]):
+        fit = fits[key]
+        crossover = fit["crossover"]
+        rows.append(
+            [
+                key,
+                "{}-{}".format(*fit["range"]),
+                fit["model"],
+                f"{fit['errors'][fit['model']]:.1%}",
+                f"{fit['exponent']:.2f}"
+                + (" SUPERLINEAR" if fit["exponent"] > args.superlinear else ""),
+                "" if crossover is None else f"{crossover:.3g}",
+            ]
+        )
+    print(
+        format_table(
+            ["benchmark", "rows", "best model", "error", "exponent", "crossover rows"],
+            rows,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,307 @@
+"""Run benchmarks in parallel worker processes isolated from each other.
+
+Running benchmarks in parallel (e.g. with pytest-xdist) on one machine makes
+them contend for cores and memory bandwidth, which distorts their timings.
+This runner instead collects the benchmark IDs once and splits them across
+worker pytest processes, each of which is pinned to a disjoint set of CPUs
+(and, if numactl is installed, bound to the memory of the NUMA node of its
+CPUs). The thread pools of BLAS, OpenMP, Arrow and polars are limited to the
+number of CPUs of each worker, and under cudf each worker may be given its own
+GPU with --gpus.
+
+Isolation reduces but cannot eliminate interference through shared caches and
+memory bandwidth, so before the parallel run a sample of the benchmarks is run
+alone with the CPUs of the first worker. The slowdown of each sampled benchmark
+in the parallel run is reported, and a warning is printed if the geometric mean
+slowdown exceeds --max-interference.
+
+The results of the workers are merged into a single pytest-benchmark JSON file.
+
+Example
+-------
+python scripts/parallel_run.py --workers 4 --output results.json -- API
+"""
+
+import argparse
+import glob
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "common"))
+
+from results import format_table, geometric_mean, load_benchmarks  # noqa: E402
+
+# Environment variables limiting the threads of the libraries used by the
+# backends. Arrow sizes its CPU thread pool from OMP_NUM_THREADS.
+THREAD_VARIABLES = [
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+    "ARROW_IO_THREADS",
+    "POLARS_MAX_THREADS",
+    "RAYON_NUM_THREADS",
+]
+
+
+def collect(pytest_args):
+    """Collect the IDs of the benchmarks selected by `pytest_args`."""
+    output = subprocess.run(
+        [sys.executable, "-m", "pytest", "--collect-only", "-q", *pytest_args],
+        cwd=ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return [line for line in output.splitlines() if "::" in line]
+
+
+def parse_cpulist(text):
+    """Parse a Linux CPU list such as "0-3,8-11"."""
+    cpus = []
+    for part in text.strip().split(","):
+        if part:
+            start, _, stop = part.partition("-")
+            cpus.extend(range(int(start), int(stop or start) + 1))
+    return cpus
+
+
+def numa_nodes():
+    """Get the NUMA node of each CPU (empty if the topology is unknown)."""
+    nodes = {}
+    for path in glob.glob("/sys/devices/system/node/node[0-9]*/cpulist"):
+        node = int(re.search(r"node(\d+)", path).group(1))
+        with open(path) as f:
+            nodes.update(dict.fromkeys(parse_cpulist(f.read()), node))
+    return nodes
+
+
+def partition_cpus(num_workers):
+    """Split the available CPUs into disjoint sets for each worker.
+
+    CPUs are ordered by NUMA node and split into contiguous sets, so that each
+    worker's CPUs belong to a single node whenever the number of workers is a
+    multiple of the number of nodes. On Linux, the hyperthreads of a core are
+    usually numbered far apart, so contiguous sets also tend not to share
+    cores.
+
+    Returns
+    -------
+    List[Tuple[List[int], Optional[int]]]
+        The CPUs of each worker and their NUMA node (None if the CPUs span
+        several nodes or the topology is unknown).
+    """
+    nodes = numa_nodes()
+    cpus = sorted(os.sched_getaffinity(0), key=lambda cpu: (nodes.get(cpu, 0), cpu))
+    if num_workers > len(cpus):
+        sys.exit(f"Cannot run {num_workers} workers on {len(cpus)} CPUs.")
+    size, extra = divmod(len(cpus), num_workers)
+    partitions = []
+    start = 0
+    for i in range(num_workers):
+        stop = start + size + (i < extra)
+        worker_cpus = cpus[start:stop]
+        worker_nodes = {nodes.get(cpu) for cpu in worker_cpus}
+        partitions.append(
+            (worker_cpus, worker_nodes.pop() if len(worker_nodes) == 1 else None)
+        )
+        start = stop
+    return partitions
+
+
+def split(ids, num_workers, block_size):
+    """Assign blocks of consecutive benchmarks to workers in turn.
+
+    Consecutive benchmarks usually share fixtures, so assigning blocks rather
+    than individual benchmarks reduces the fixtures that each worker builds,
+    while interleaving blocks balances the work of the workers.
+    """
+    assignments = [[] for _ in range(num_workers)]
+    for block, i in enumerate(range(0, len(ids), block_size)):
+        stop = i + block_size
+        assignments[block % num_workers].extend(ids[i:stop])
+    return assignments
+
+
+def start_worker(ids, cpus, node, gpu, output_dir, name, pytest_args):
+    """Start a pytest process running `ids` pinned to `cpus`."""
+    select_path = os.path.join(output_dir, f"{name}.txt")
+    with open(select_path, "w") as f:
+        f.write("\n".join(ids))
+    env = dict(os.environ, CUDF_BENCHMARKS_SELECT=select_path)
+    env.update(dict.fromkeys(THREAD_VARIABLES, str(len(cpus))))
+    if gpu is not None:
+        env["CUDA_VISIBLE_DEVICES"] = gpu
+    command = [sys.executable, "-m", "pytest", *pytest_args]
+    command.append(f"--benchmark-json={os.path.join(output_dir, name)}.json")
+    if node is not None and shutil.which("numactl"):
+        command = ["numactl", f"--membind={node}", *command]
+    with open(os.path.join(output_dir, f"{name}.log"), "w") as log:
+        return subprocess.Popen(
+            command,
+            cwd=ROOT,
+            env=env,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            # The affinity is inherited by the process after exec.
+            preexec_fn=lambda: os.sched_setaffinity(0, cpus),
+        )
+
+
+def load_medians(path):
+    if not os.path.exists(path):
+        return {}
+    return {b["fullname"]: b["stats"]["median"] for b in load_benchmarks(path)}
+
+
+def merge_results(paths, output):
+    """Merge the pytest-benchmark JSON files of the workers into `output`."""
+    merged = None
+    for path in paths:
+        if not os.path.exists(path):
+            continue
+        with open(path) as f:
+            data = json.load(f)
+        if merged is None:
+            merged = data
+        else:
+            merged["benchmarks"].extend(data["benchmarks"])
+    if merged is not None:
+        merged["benchmarks"].sort(key=lambda b: b["fullname"])
+        with open(output, "w") as f:
+            json.dump(merged, f, indent=4)
+    return merged
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=2,
+        help="The number of worker processes (default: 2).",
+    )
+    parser.add_argument(
+        "--output",
+        required=True,
+        help="The path of the merged pytest-benchmark JSON results.",
+    )
+    parser.add_argument(
+        "--gpus",
+        nargs="+",
+        help="GPUs assigned to the workers in turn (sets CUDA_VISIBLE_DEVICES).",
+    )
+    parser.add_argument(
+        "--block-size",
+        type=int,
+        default=16,
+        help="The number of consecutive benchmarks assigned together (default: 16).",
+    )
+    parser.add_argument(
+        "--calibration",
+        type=int,
+        default=10,
+        help="The number of benchmarks sampled to measure interference "
+        "(default: 10, 0 disables the measurement).",
+    )
+    parser.add_argument(
+        "--max-interference",
+        type=float,
+        default=1.05,
+        help="The acceptable geometric mean slowdown of the sampled benchmarks "
+        "in the parallel run (default: 1.05).",
+    )
+    parser.add_argument(
+        "--output-dir",
+        help="A directory to save the selections, logs and results of each worker in.",
+    )
+    parser.add_argument(
+        "pytest_args",
+        nargs="*",
+        help="Additional arguments passed to pytest, e.g. paths or -k filters.",
+    )
+    args = parser.parse_args()
+
+    output_dir = args.output_dir or tempfile.mkdtemp()
+    os.makedirs(output_dir, exist_ok=True)
+    ids = collect(args.pytest_args)
+    partitions = partition_cpus(args.workers)
+    gpus = [
+        args.gpus[i % len(args.gpus)] if args.gpus else None
+        for i in range(args.workers)
+    ]
+    print(f"Running {len(ids)} benchmarks in {args.workers} workers:")
+    for i, (cpus, node) in enumerate(partitions):
+        print(
+            f"  worker {i}: CPUs {','.join(map(str, cpus))}"
+            + (f", NUMA node {node}" if node is not None else "")
+            + (f", GPU {gpus[i]}" if gpus[i] is not None else "")
+        )
+
+    sample = []
+    if args.calibration > 0:
+        step = max(len(ids) // args.calibration, 1)
+        sample = ids[::step][: args.calibration]
+    if sample:
+        cpus, node = partitions[0]
+        start_worker(
+            sample, cpus, node, gpus[0], output_dir, "alone", args.pytest_args
+        ).wait()
+
+    start = time.perf_counter()
+    workers = [
+        start_worker(
+            worker_ids, cpus, node, gpu, output_dir, f"worker{i}", args.pytest_args
+        )
+        for i, (worker_ids, (cpus, node), gpu) in enumerate(
+            zip(split(ids, args.workers, args.block_size), partitions, gpus)
+        )
+    ]
+    for i, worker in enumerate(workers):
+        if worker.wait() not in (0, 5):
+            log = os.path.join(output_dir, f"worker{i}.log")
+            print(f"worker {i} failed with exit code {worker.returncode}, see {log}")
+    elapsed = time.perf_counter() - start
+
+    merged = merge_results(
+        [os.path.join(output_dir, f"worker{i}.json") for i in range(args.workers)],
+        args.output,
+    )
+    count = len(merged["benchmarks"]) if merged else 0
+    print(f"\nRan {count} benchmarks in {elapsed:.1f}s, results saved in {args.output}")
+
+    if sample:
+        alone = load_medians(os.path.join(output_dir, "alone.json"))
+        parallel = load_medians(args.output)
+        rows = [
+            [name, f"{alone[name]:.3g}", f"{parallel[name]:.3g}"]
+            + [f"{parallel[name] / alone[name]:.2f}x"]
+            for name in sample
+            if name in alone and name in parallel
+        ]
+        if rows:
+            slowdown = geometric_mean(
+                parallel[name] / alone[name]
+                for name in sample
+                if name in alone and name in parallel
+            )
+            print("\nInterference (median seconds alone and in the parallel run):")
+            print(format_table(["benchmark", "alone", "parallel", "slowdown"], rows))
+            print(f"\nGeometric mean slowdown: {slowdown:.3f}x")
+            if slowdown > args.max_interference:
+                print(
+                    f"WARNING: the slowdown exceeds {args.max_interference}x, "
+                    "consider fewer workers."
+                )
+    print(f"Worker selections and logs saved in {output_dir}")
+
+
+if __name__ == "__main__":
+    main()
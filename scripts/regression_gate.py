@@ -0,0 +1,159 @@
+"""Detect statistically significant performance changes against a baseline.
+
+Both the baseline and the new results must be pytest-benchmark JSON files
+containing the times of every round, i.e. they must be generated with the
+--benchmark-save-data option (e.g. `--benchmark-autosave --benchmark-save-data`
+stores baselines under .benchmarks/). The samples of each benchmark are
+compared with a Mann-Whitney U test, and p-values are adjusted across all
+benchmarks to control the false discovery rate. A change is only reported if
+it is significant and both the change in median time and the effect size
+(Cliff's delta) exceed thresholds, so small changes caused by noise on shared
+machines are ignored.
+
+The rounds of a single run do not capture the variation between runs (e.g. due
+to memory layout or the state of the machine), which is often larger than the
+variation within a run. Passing the results of several runs of each side pools
+their samples so that this variation is accounted for.
+
+The ranked lists of regressions and improvements are printed, and the exit
+code is 1 if there are any regressions.
+
+Example
+-------
+python scripts/regression_gate.py --baseline base1.json base2.json --new new.json
+"""
+
+import argparse
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "common"))
+
+from results import (  # noqa: E402
+    benjamini_hochberg,
+    cliffs_delta,
+    format_table,
+    load_benchmarks,
+    mann_whitney_u,
+    median,
+)
+
+
+def load_samples(paths):
+    """Load the pooled samples of every benchmark keyed by full name."""
+    samples = {}
+    for path in paths:
+        for benchmark in load_benchmarks(path):
+            data = benchmark["stats"].get("data")
+            if not data:
+                sys.exit(
+                    f"{path} does not contain the samples of "
+                    f"{benchmark['fullname']}. Benchmarks must be run with "
+                    "--benchmark-save-data."
+                )
+            samples.setdefault(benchmark["fullname"], []).extend(data)
+    return samples
+
+
+def compare(baseline, new):
+    """Compare the samples of every benchmark present in both results.
+
+    Returns
+    -------
+    List[dict]
+        The name, relative change in median, Cliff's delta, and adjusted
+        p-value of each benchmark. A positive change is a slowdown.
+    """
+    names = [name for name in new if name in baseline]
+    comparisons = []
+    for name in names:
+        old_median = median(baseline[name])
+        comparisons.append(
+            {
+                "name": name,
+                "change": (median(new[name]) - old_median) / old_median,
+                "delta": cliffs_delta(new[name], baseline[name]),
+                "pvalue": mann_whitney_u(new[name], baseline[name])[1],
+            }
+        )
+    for c, p in zip(
+        comparisons, benjamini_hochberg([c["pvalue"] for c in comparisons])
+    ):
+        c["pvalue"] = p
+    return comparisons
+
+
+def print_changes(title, changes):
+    print(f"{title} ({len(changes)}):")
+    if changes:
+        print(
+            format_table(
+                ["benchmark", "change", "cliff's delta", "adjusted p"],
+                [
+                    [c["name"], f"{c['change']:+.1%}", f"{c['delta']:+.2f}"]
+                    + [f"{c['pvalue']:.2g}"]
+                    for c in changes
+                ],
+            )
+        )
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--baseline",
+        nargs="+",
+        required=True,
+        help="The pytest-benchmark JSON files of one or more baseline runs.",
+    )
+    parser.add_argument(
+        "--new",
+        nargs="+",
+        required=True,
+        help="The pytest-benchmark JSON files of one or more new runs.",
+    )
+    parser.add_argument(
+        "--alpha",
+        type=float,
+        default=0.01,
+        help="The false discovery rate (default: 0.01).",
+    )
+    parser.add_argument(
+        "--min-change",
+        type=float,
+        default=0.05,
+        help="The minimum relative change in median time (default: 0.05).",
+    )
+    parser.add_argument(
+        "--min-delta",
+        type=float,
+        default=0.33,
+        help="The minimum absolute Cliff's delta (default: 0.33, a medium effect).",
+    )
+    args = parser.parse_args()
+
+    comparisons = compare(load_samples(args.baseline), load_samples(args.new))
+    significant = [
+        c
+        for c in comparisons
+        if c["pvalue"] < args.alpha
+        and abs(c["change"]) >= args.min_change
+        and abs(c["delta"]) >= args.min_delta
+    ]
+    regressions = sorted(
+        (c for c in significant if c["change"] > 0), key=lambda c: -c["change"]
+    )
+    improvements = sorted(
+        (c for c in significant if c["change"] < 0), key=lambda c: c["change"]
+    )
+
+    print(f"Compared {len(comparisons)} benchmarks.\n")
+    print_changes("Regressions", regressions)
+    print_changes("Improvements", improvements)
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
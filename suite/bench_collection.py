@@ -0,0 +1,40 @@
+"""Benchmarks of the collection of the benchmark suite itself.
+
+The number of generated fixtures grows multiplicatively with each new dtype or
+size in NUM_ROWS/NUM_COLS, so these benchmarks guard against regressions in
+the time taken to collect the suite.
+"""
+
+import os
+import subprocess
+import sys
+
+from utils import fixture_unions
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def bench_materialize_fixture_unions(benchmark):
+    def materialize_all():
+        globals_ = {}
+        for name in fixture_unions:
+            fixture_unions.materialize(name, globals_)
+
+    benchmark(materialize_all)
+
+
+def bench_collect_only(benchmark):
+    # The environment is inherited, so the suite is collected for the same
+    # backend and sizes as the current session. Errors collecting any one
+    # module should not fail this benchmark, so the exit code is recorded
+    # instead of checked.
+    result = benchmark.pedantic(
+        subprocess.run,
+        args=(
+            [sys.executable, "-m", "pytest", "--collect-only", "-q"]
+            + ["-p", "no:cacheprovider"],
+        ),
+        kwargs={"cwd": ROOT, "capture_output": True},
+        rounds=3,
+    )
+    benchmark.extra_info["returncode"] = result.returncode
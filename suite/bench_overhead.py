@@ -0,0 +1,24 @@
+"""Baselines for the fixed per-call cost of benchmarks.
+
+In the overhead mode (CUDF_BENCHMARKS_OVERHEAD), the API benchmarks run on
+inputs of at most 100 rows, where their time is dominated by costs that do not
+depend on the size of the data. These benchmarks measure the floor beneath
+those costs: calling a Python function that does nothing, and the cheapest
+call into the library. Subtracting them from the time of an API benchmark
+leaves the dispatch overhead of the operation itself.
+"""
+
+from utils import accepts_cudf_fixture
+
+
+def noop():
+    pass
+
+
+def bench_noop(benchmark):
+    benchmark(noop)
+
+
+@accepts_cudf_fixture(cls="dataframe", dtype="int", cols=6)
+def bench_noop_len(benchmark, dataframe):
+    benchmark(len, dataframe)
@@ -0,0 +1,151 @@
+"""Benchmarks of the startup time of the backends.
+
+Short-lived processes pay for importing the DataFrame library (and for the
+first operation, which may initialize devices, memory pools or lazily imported
+modules) on every start, yet this cost is invisible to benchmarks running in a
+warm pytest session. These benchmarks instead time fresh Python processes that
+import the modules of the backend, optionally followed by the construction of
+a small DataFrame. Running the interpreter alone provides a baseline.
+
+Besides the wall time of each process, the following are recorded in the
+`extra_info` of each benchmark, as measured by the process itself:
+    - import_seconds: the time taken by the imports.
+    - first_operation_seconds: the time taken by the first operation.
+    - rss_after_import_bytes: the resident set size after the imports.
+    - importtime_top: the modules with the most self time according to
+      `python -X importtime`, measured in a separate untimed process since
+      the measurement slows down imports.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+from config import backend
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The number of modules reported in importtime_top.
+IMPORTTIME_TOP = 10
+
+# The code run by each process. The output is a JSON object on stdout.
+STARTUP_SCRIPT = """\
+import json
+import sys
+import time
+
+def rss():
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        import resource
+        maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+info = {{}}
+start = time.perf_counter()
+{imports}
+info["import_seconds"] = time.perf_counter() - start
+info["rss_after_import_bytes"] = rss()
+start = time.perf_counter()
+{operation}
+info["first_operation_seconds"] = time.perf_counter() - start
+print(json.dumps(info))
+"""
+
+# The backend's frame module may be a module of this repository, such as
+# polars_adapter, so the processes can import from common/.
+ENV = dict(
+    os.environ,
+    PYTHONPATH=os.pathsep.join(
+        filter(None, [os.path.join(ROOT, "common"), os.environ.get("PYTHONPATH")])
+    ),
+)
+
+IMPORTS = {
+    "interpreter": [],
+    "array_module": [backend.array_module],
+    "frame_module": [backend.frame_module],
+}
+
+
+def startup_script(modules, operation):
+    return STARTUP_SCRIPT.format(
+        imports="\n".join(f"import {module}" for module in modules) or "pass",
+        operation=operation,
+    )
+
+
+def run_script(script, *options):
+    """Run `script` in a fresh interpreter, returning its stdout and stderr."""
+    process = subprocess.run(
+        [sys.executable, *options, "-c", script],
+        cwd=ROOT,
+        env=ENV,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return process.stdout, process.stderr
+
+
+def run_startup(script):
+    stdout, _ = run_script(script)
+    return json.loads(stdout)
+
+
+def importtime_top(modules, n=IMPORTTIME_TOP):
+    """Get the `n` modules imported by `modules` with the most self time.
+
+    Returns
+    -------
+    List[dict]
+        The name, self time and cumulative time (in microseconds) of each
+        module, as reported by `python -X importtime`.
+    """
+    _, stderr = run_script(startup_script(modules, "pass"), "-X", "importtime")
+    entries = []
+    for line in stderr.splitlines():
+        # Lines have the form "import time: self [us] | cumulative | name",
+        # preceded by a header line.
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line.partition(":")[2].split("|")
+        entries.append(
+            {
+                "module": name.strip(),
+                "self_us": int(self_us),
+                "cumulative_us": int(cumulative_us),
+            }
+        )
+    return sorted(entries, key=lambda entry: entry["self_us"], reverse=True)[:n]
+
+
+def record_startup(benchmark, modules, info):
+    benchmark.extra_info.update(info)
+    benchmark.extra_info["modules"] = modules
+    if modules:
+        benchmark.extra_info["importtime_top"] = importtime_top(modules)
+
+
+@pytest.mark.parametrize("imports", list(IMPORTS))
+def bench_import(benchmark, imports):
+    modules = IMPORTS[imports]
+    info = benchmark.pedantic(
+        run_startup, args=(startup_script(modules, "pass"),), rounds=5
+    )
+    record_startup(benchmark, modules, info)
+
+
+def bench_import_first_operation(benchmark):
+    modules = IMPORTS["frame_module"]
+    operation = f"{backend.frame_module}.DataFrame({{'a': list(range(10))}})"
+    info = benchmark.pedantic(
+        run_startup, args=(startup_script(modules, operation),), rounds=5
+    )
+    record_startup(benchmark, modules, info)
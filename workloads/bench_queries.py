@@ -0,0 +1,190 @@
+"""Benchmarks of multi-step analytical queries.
+
+The queries are modeled on TPC-H queries and run on the tables generated by
+`tpch.star_schema`. Each query is written once against the cudf API and
+divided into stages (e.g. filter, join, groupby, sort) whose times are recorded
+in addition to the end-to-end time, see `tpch.run_query`.
+"""
+
+import numpy
+import pytest
+from config import SCALE_FACTORS
+from tpch import run_query, star_schema
+
+# The polars adapter does not support boolean masks or left_on/right_on joins.
+pytestmark = pytest.mark.polars_incompatible
+
+
+def date(s):
+    return numpy.datetime64(s, "ns")
+
+
+def q1(tables, stage):
+    """Pricing summary: aggregate most items by return flag and status."""
+    lineitem = tables["lineitem"]
+    with stage("filter"):
+        items = lineitem[lineitem["l_shipdate"] <= date("1998-09-02")]
+    with stage("project"):
+        disc_price = items["l_extendedprice"] * (1 - items["l_discount"])
+        items = items.assign(
+            disc_price=disc_price, charge=disc_price * (1 + items["l_tax"])
+        )
+    with stage("groupby"):
+        result = items.groupby(["l_returnflag", "l_linestatus"]).agg(
+            {
+                "l_quantity": ["sum", "mean"],
+                "l_extendedprice": ["sum", "mean"],
+                "disc_price": "sum",
+                "charge": "sum",
+                "l_discount": ["mean", "count"],
+            }
+        )
+    with stage("sort"):
+        return result.sort_index()
+
+
+def q3(tables, stage):
+    """Shipping priority: the unshipped orders of a segment with most revenue."""
+    customer, orders, lineitem = (
+        tables["customer"],
+        tables["orders"],
+        tables["lineitem"],
+    )
+    with stage("filter"):
+        customer = customer[customer["c_mktsegment"] == "BUILDING"]
+        orders = orders[orders["o_orderdate"] < date("1995-03-15")]
+        lineitem = lineitem[lineitem["l_shipdate"] > date("1995-03-15")]
+    with stage("join"):
+        items = (
+            customer[["c_custkey"]]
+            .merge(
+                orders[["o_orderkey", "o_custkey", "o_orderdate", "o_shippriority"]],
+                left_on="c_custkey",
+                right_on="o_custkey",
+            )
+            .merge(
+                lineitem[["l_orderkey", "l_extendedprice", "l_discount"]],
+                left_on="o_orderkey",
+                right_on="l_orderkey",
+            )
+        )
+    with stage("project"):
+        items = items.assign(
+            revenue=items["l_extendedprice"] * (1 - items["l_discount"])
+        )
+    with stage("groupby"):
+        result = items.groupby(
+            ["l_orderkey", "o_orderdate", "o_shippriority"], as_index=False
+        ).agg({"revenue": "sum"})
+    with stage("sort"):
+        result = result.sort_values(["revenue", "o_orderdate"], ascending=[False, True])
+    with stage("head"):
+        return result.head(10)
+
+
+def q5(tables, stage):
+    """Local volume: the revenue of each nation of a region in a year."""
+    with stage("filter"):
+        region = tables["region"][tables["region"]["r_name"] == "ASIA"]
+        orders = tables["orders"]
+        orders = orders[
+            (orders["o_orderdate"] >= date("1994-01-01"))
+            & (orders["o_orderdate"] < date("1995-01-01"))
+        ]
+    with stage("join"):
+        nation = tables["nation"].merge(
+            region, left_on="n_regionkey", right_on="r_regionkey"
+        )
+        customer = tables["customer"].merge(
+            nation[["n_nationkey", "n_name"]],
+            left_on="c_nationkey",
+            right_on="n_nationkey",
+        )
+        items = (
+            tables["lineitem"][["l_orderkey", "l_extendedprice", "l_discount"]]
+            .merge(
+                orders[["o_orderkey", "o_custkey"]],
+                left_on="l_orderkey",
+                right_on="o_orderkey",
+            )
+            .merge(
+                customer[["c_custkey", "n_name"]],
+                left_on="o_custkey",
+                right_on="c_custkey",
+            )
+        )
+    with stage("project"):
+        items = items.assign(
+            revenue=items["l_extendedprice"] * (1 - items["l_discount"])
+        )
+    with stage("groupby"):
+        result = items.groupby("n_name", as_index=False).agg({"revenue": "sum"})
+    with stage("sort"):
+        return result.sort_values("revenue", ascending=False)
+
+
+def q6(tables, stage):
+    """Forecasting revenue change: a selective filter followed by a reduction."""
+    lineitem = tables["lineitem"]
+    with stage("filter"):
+        items = lineitem[
+            (lineitem["l_shipdate"] >= date("1994-01-01"))
+            & (lineitem["l_shipdate"] < date("1995-01-01"))
+            & (lineitem["l_discount"] >= 0.05)
+            & (lineitem["l_discount"] <= 0.07)
+            & (lineitem["l_quantity"] < 24)
+        ]
+    with stage("reduce"):
+        return (items["l_extendedprice"] * items["l_discount"]).sum()
+
+
+def q10(tables, stage):
+    """Returned items: the customers whose returns lost the most revenue."""
+    with stage("filter"):
+        orders = tables["orders"]
+        orders = orders[
+            (orders["o_orderdate"] >= date("1993-10-01"))
+            & (orders["o_orderdate"] < date("1994-01-01"))
+        ]
+        lineitem = tables["lineitem"]
+        lineitem = lineitem[lineitem["l_returnflag"] == "R"]
+    with stage("join"):
+        items = (
+            lineitem[["l_orderkey", "l_extendedprice", "l_discount"]]
+            .merge(
+                orders[["o_orderkey", "o_custkey"]],
+                left_on="l_orderkey",
+                right_on="o_orderkey",
+            )
+            .merge(tables["customer"], left_on="o_custkey", right_on="c_custkey")
+            .merge(
+                tables["nation"][["n_nationkey", "n_name"]],
+                left_on="c_nationkey",
+                right_on="n_nationkey",
+            )
+        )
+    with stage("project"):
+        items = items.assign(
+            revenue=items["l_extendedprice"] * (1 - items["l_discount"])
+        )
+    with stage("groupby"):
+        result = items.groupby(
+            ["c_custkey", "c_acctbal", "n_name"], as_index=False
+        ).agg({"revenue": "sum"})
+    with stage("sort"):
+        result = result.sort_values("revenue", ascending=False)
+    with stage("head"):
+        return result.head(20)
+
+
+QUERIES = {"q1": q1, "q3": q3, "q5": q5, "q6": q6, "q10": q10}
+
+
+@pytest.fixture(params=SCALE_FACTORS, ids=lambda sf: f"sf_{sf}")
+def tables(request):
+    return star_schema(request.param)
+
+
+@pytest.mark.parametrize("query", list(QUERIES))
+def bench_query(benchmark, tables, query):
+    run_query(benchmark, QUERIES[query], tables)
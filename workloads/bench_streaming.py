@@ -0,0 +1,66 @@
+"""Benchmarks of chunked pipelines over a dataset larger than the memory cap.
+
+These benchmarks only run if CUDF_BENCHMARKS_STREAM_MEMORY_CAP is defined, see
+streaming.py. Each round streams the whole dataset through a pipeline with a
+given number of rows per chunk. The rows of the dataset are recorded so that
+the sustained throughput is reported as `rows_per_second`, and the increase
+in peak RSS over the rounds is recorded as `peak_rss_delta_bytes` together
+with whether it stayed `within_memory_cap`. Throughput grows with the chunk
+size while per-chunk overhead dominates and levels off beyond that point.
+"""
+
+import math
+import os
+
+import pytest
+from config import DATA_DIR, STREAM_MEMORY_CAP
+from instrumentation import PeakRSS
+from streaming import (
+    ROW_BYTES,
+    aggregate_chunks,
+    chunk_sizes,
+    dataset_rows,
+    write_dataset,
+)
+
+# The polars adapter does not support boolean masks or named aggregations.
+pytestmark = [
+    pytest.mark.skipif(
+        STREAM_MEMORY_CAP is None,
+        reason="CUDF_BENCHMARKS_STREAM_MEMORY_CAP is not defined",
+    ),
+    pytest.mark.polars_incompatible,
+]
+
+# Each round reads the whole dataset, so few rounds are run.
+STREAM_ROUNDS = 3
+
+CHUNK_ROWS = [] if STREAM_MEMORY_CAP is None else chunk_sizes(STREAM_MEMORY_CAP)
+
+
+@pytest.fixture(scope="session")
+def dataset(tmp_path_factory):
+    num_rows = dataset_rows(STREAM_MEMORY_CAP)
+    directory = DATA_DIR or tmp_path_factory.mktemp("streaming")
+    os.makedirs(directory, exist_ok=True)
+    row_group_size = max(CHUNK_ROWS)
+    name = f"stream_rows_{num_rows}_row_group_{row_group_size}.parquet"
+    return write_dataset(os.path.join(directory, name), num_rows, row_group_size)
+
+
+@pytest.mark.parametrize("chunk_rows", CHUNK_ROWS)
+def bench_stream_aggregate(benchmark, dataset, chunk_rows):
+    num_rows = dataset_rows(STREAM_MEMORY_CAP)
+    benchmark.extra_info.update(
+        rows=num_rows,
+        bytes=num_rows * ROW_BYTES,
+        io_bytes=os.path.getsize(dataset),
+        chunks=math.ceil(num_rows / chunk_rows),
+        memory_cap_bytes=STREAM_MEMORY_CAP,
+    )
+    with PeakRSS() as rss:
+        benchmark.pedantic(
+            aggregate_chunks, args=(dataset, chunk_rows), rounds=STREAM_ROUNDS
+        )
+    benchmark.extra_info["peak_rss_delta_bytes"] = rss.peak_delta
+    benchmark.extra_info["within_memory_cap"] = rss.peak_delta <= STREAM_MEMORY_CAP